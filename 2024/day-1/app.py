@@ -1,51 +1,79 @@
 """Day 1: Historian Hysteria"""
 
-from typing import Collection, Counter, Generator, Iterable, Sequence, Tuple
+from pathlib import Path
+from typing import Counter, Mapping, Sequence, Tuple, TypeAlias
 
+from aoc.reader import FILENAME_INPUT, read_int_columns
 
-def read_input() -> Generator[Tuple[int, int], None, None]:
-    """Lazily read and parse the input file into (x, y) pairs"""
-    file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
-        line: str
-        for line in file:
-            lhs: int
-            rhs: int
-            lhs, rhs = map(int, line.split())
+# Typing
+Columns: TypeAlias = Tuple[Sequence[int], Sequence[int]]
 
-            yield lhs, rhs
 
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Columns:
+    """Read and parse the input file into its (lhs, rhs) columns"""
 
-def main() -> None:
-    """Solution for AoC 2024, Day 1, Parts 1 & 2"""
+    # Plain files are mapped, compressed ones (or stdin) streamed a chunk at a time
+    lhs: Sequence[int]
+    rhs: Sequence[int]
+    lhs, rhs = read_int_columns(path, 2)
 
-    # Load the entire dataset into memory
-    inputs: Collection[Tuple[int, int]] = tuple(read_input())
+    return (lhs, rhs)
+
+
+def export_input(columns: Columns, /) -> Mapping[str, Sequence[int]]:
+    """Export the columns as flat buffers, to share with worker processes"""
+
+    lhs: Sequence[int]
+    rhs: Sequence[int]
+    lhs, rhs = columns
+
+    return {"lhs": lhs, "rhs": rhs}
 
-    # Split into columns and sort
+
+def import_input(views: Mapping[str, Sequence[int]], /) -> Columns:
+    """Import the columns from views of the buffers exported by `export_input`"""
+
+    # Neither part modifies the columns (part 1 sorts copies), so they're used as is
+    return (views["lhs"], views["rhs"])
+
+
+def solve_part_1(columns: Columns, /) -> int:
+    """Total distance between all locations"""
+
+    # Sort each column
     locations_lhs: Sequence[int]
     locations_rhs: Sequence[int]
-    locations_lhs, locations_rhs = map(sorted, zip(*inputs))
+    locations_lhs, locations_rhs = map(sorted, columns)
 
-    # --- Part One ---
+    return sum(abs(lhs - rhs) for lhs, rhs in zip(locations_lhs, locations_rhs))
 
-    # Total distance between all locations
-    total_distance: int = sum(
-        abs(lhs - rhs) for lhs, rhs in zip(locations_lhs, locations_rhs)
-    )
 
-    print("Total Distance:", total_distance)
+def solve_part_2(columns: Columns, /) -> int:
+    """Total "similarity score" of all locations"""
 
-    # --- Part Two ---
+    locations_lhs: Sequence[int]
+    locations_rhs: Sequence[int]
+    locations_lhs, locations_rhs = columns
 
     # Count the number of occurences of each value in the rhs column
     location_counts: Counter[int] = Counter(locations_rhs)
 
     # Compute the total "similarity score" of values in the lhs column
-    similarity_score: int = sum(
-        value * location_counts[value] for value in locations_lhs
-    )
+    return sum(value * location_counts[value] for value in locations_lhs)
+
+
+def main() -> None:
+    """Solution for AoC 2024, Day 1, Parts 1 & 2"""
 
+    # Load the entire dataset into memory
+    columns: Columns = read_input()
+
+    # --- Part One ---
+    total_distance: int = solve_part_1(columns)
+    print("Total Distance:", total_distance)
+
+    # --- Part Two ---
+    similarity_score: int = solve_part_2(columns)
     print("Similarity Score:", similarity_score)
 
 
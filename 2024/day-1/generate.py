@@ -0,0 +1,40 @@
+"""Input generator for Day 1: Historian Hysteria"""
+
+from random import Random
+from typing import Final, Sequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 1000  # Location pairs
+
+LOCATION_MIN: Final[int] = 10000
+LOCATION_MAX: Final[int] = 99999
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, repeats: int = 250
+) -> None:
+    """
+    Write `size` pairs of location IDs
+
+    To give the similarity score something to count, a right-hand location has a
+    chance of being drawn from a small pool of `repeats` "popular" locations that
+    also appear in the left-hand column.
+    """
+
+    popular: Sequence[int] = tuple(
+        random.randint(LOCATION_MIN, LOCATION_MAX) for _ in range(repeats)
+    )
+
+    _: int
+    for _ in range(size):
+        lhs: int = (
+            random.choice(popular)
+            if random.random() < 0.1
+            else random.randint(LOCATION_MIN, LOCATION_MAX)
+        )
+        rhs: int = (
+            random.choice(popular)
+            if random.random() < 0.5
+            else random.randint(LOCATION_MIN, LOCATION_MAX)
+        )
+
+        file.write(f"{lhs}   {rhs}\n")
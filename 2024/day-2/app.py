@@ -1,18 +1,112 @@
 """Day 2: Red-Nosed Reports"""
 
-from typing import Collection, Generator, Iterable, Optional, Sequence, TypeAlias
+from array import array
+from itertools import pairwise
+from pathlib import Path
+from typing import (
+    Callable,
+    Collection,
+    Final,
+    Generator,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeAlias,
+    overload,
+)
+
+from aoc.chunks import sum_chunks
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.reader import FILENAME_INPUT, open_input
 
 Report: TypeAlias = Sequence[int]
 
 
-def read_input() -> Generator[Report, None, None]:
+class Reports(Sequence[Report]):
+    """
+    Reports held as flat buffers: every level, and where each report starts
+
+    Each report is a slice of the levels, as is any slice of the reports, so
+    nothing is copied (e.g. from views of shared memory).
+
+    Example:
+        >>> reports = Reports(array("q", (1, 2, 3, 4, 5)), array("q", (0, 2, 5)))
+        >>> assert [list(report) for report in reports] == [[1, 2], [3, 4, 5]]
+        >>> assert list(reports[-1]) == [3, 4, 5] and len(reports[1:]) == 1
+    """
+
+    __slots__ = ("levels", "offsets")
+
+    levels: Sequence[int]
+    offsets: Sequence[int]
+
+    def __init__(self, levels: Sequence[int], offsets: Sequence[int], /) -> None:
+        self.levels = levels
+        self.offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __iter__(self) -> Iterator[Report]:
+        return (self.levels[start:stop] for start, stop in pairwise(self.offsets))
+
+    @overload
+    def __getitem__(self, index: int, /) -> Report: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> "Reports": ...
+
+    def __getitem__(self, index: int | slice, /) -> "Report | Reports":
+        # Resolves negative indices (and bounds), as for any other sequence
+        indices: int | range = range(len(self))[index]
+
+        if isinstance(indices, int):
+            return self.levels[self.offsets[indices] : self.offsets[indices + 1]]
+
+        if indices.step != 1:
+            raise ValueError("Reports can only be sliced contiguously")
+
+        # The offsets of a slice run from its first report's start to its last's end
+        stop: int = max(indices.start, indices.stop)
+
+        return Reports(self.levels, self.offsets[indices.start : stop + 1])
+
+
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Generator[Report, None, None]:
     """Lazily read and parse the input file into reports"""
 
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
-        line: str
-        for line in file:
-            yield tuple(map(int, line.split()))
+    with open_input(path, text=True) as file:
+        yield from map(parse_report, file)
+
+
+def parse_report(line: str, /) -> Report:
+    """Parse a line of the input into a report"""
+
+    return tuple(map(int, line.split()))
+
+
+def export_input(reports: Iterable[Report], /) -> Mapping[str, array]:
+    """Export reports as flat buffers, as held by `Reports`"""
+
+    levels: array = array("q")
+    offsets: array = array("q", (0,))
+
+    report: Report
+    for report in reports:
+        levels.extend(report)
+        offsets.append(len(levels))
+
+    return {"levels": levels, "offsets": offsets}
+
+
+def import_input(views: Mapping[str, Sequence[int]], /) -> Reports:
+    """Import reports from views of the buffers exported by `export_input`"""
+
+    return Reports(views["levels"], views["offsets"])
 
 
 def get_sign(x: int, /) -> int:
@@ -129,6 +223,94 @@ def is_report_safe_2(
     return True
 
 
+def solve_part_1_recursive(inputs: Collection[Report], /) -> int:
+    """Total number of safe reports"""
+
+    return sum(map(is_report_safe, inputs))
+
+
+def solve_part_2_recursive(inputs: Collection[Report], /) -> int:
+    """Total number of safe reports (with dampening)"""
+
+    return sum(map(is_report_safe_2, inputs))
+
+
+def is_report_safe_brute_force(report: Report, /) -> bool:
+    """Determine whether a report is considered safe, from all of its differences"""
+
+    differences: Sequence[int] = tuple(rhs - lhs for lhs, rhs in pairwise(report))
+
+    return all(1 <= difference <= 3 for difference in differences) or all(
+        -3 <= difference <= -1 for difference in differences
+    )
+
+
+def is_report_safe_2_brute_force(report: Report, /) -> bool:
+    """Determine whether a report is considered safe, removing each level in turn"""
+
+    return is_report_safe_brute_force(report) or any(
+        is_report_safe_brute_force((*report[:index], *report[index + 1 :]))
+        for index in range(len(report))
+    )
+
+
+def solve_part_1_brute_force(inputs: Collection[Report], /) -> int:
+    """Total number of safe reports (checking all of each report's differences)"""
+
+    return sum(map(is_report_safe_brute_force, inputs))
+
+
+def solve_part_2_brute_force(inputs: Collection[Report], /) -> int:
+    """Total number of safe reports (with dampening, removing each level in turn)"""
+
+    return sum(map(is_report_safe_2_brute_force, inputs))
+
+
+# The recursive dampening is the reference, the oracle removing every level in turn
+# (exactly the dampening the puzzle describes) is checked against. Checking a report
+# again for every level it could remove is ~2.5x slower on the real input though,
+# so it's only run by name
+ENGINES: Final[EngineRegistry] = EngineRegistry(
+    Engine(ENGINE_REFERENCE, solve_part_1_recursive, solve_part_2_recursive),
+    Engine(
+        "brute-force",
+        solve_part_1_brute_force,
+        solve_part_2_brute_force,
+        min_size=None,
+    ),
+)
+
+# Run on its own (rather than by the runner), each part uses the default engine
+solve_part_1: Final[Callable[[Collection[Report]], int]] = ENGINES.default.solve_part_1
+solve_part_2: Final[Callable[[Collection[Report]], int]] = ENGINES.default.solve_part_2
+
+
+def solve_shard(reports: Iterable[Report], /) -> Tuple[int, int]:
+    """Total number of safe reports (without, then with, dampening)"""
+
+    # Reports are independent of one another, so any shard of them (or chunk of
+    # lines) can be counted on its own (see `aoc.mapreduce`)
+    total_safe: int = 0
+    total_safe_with_dampening: int = 0
+
+    report: Report
+    for report in reports:
+        total_safe += is_report_safe(report)
+        total_safe_with_dampening += is_report_safe_2(report)
+
+    return (total_safe, total_safe_with_dampening)
+
+
+def solve_chunk(lines: Iterable[str], /) -> Tuple[int, int]:
+    """Total number of safe reports (without, then with, dampening) in some lines"""
+
+    return solve_shard(map(parse_report, lines))
+
+
+# The counts of every chunk (or shard) just add up
+combine_chunks = sum_chunks
+
+
 def main() -> None:
     """Solution for AoC 2024, Day 2, Parts 1 & 2"""
 
@@ -136,12 +318,12 @@ def main() -> None:
     inputs: Collection[Report] = tuple(read_input())
 
     # --- Part One ---
-    total_safe_reports: int = sum(map(is_report_safe, inputs))
+    total_safe_reports: int = solve_part_1(inputs)
     print("Total Safe Reports:", total_safe_reports)
     assert total_safe_reports == 282
 
     # --- Part Two ---
-    total_safe_reports_with_dampening: int = sum(map(is_report_safe_2, inputs))
+    total_safe_reports_with_dampening: int = solve_part_2(inputs)
     print("Total Safe Reports (With Dampening):", total_safe_reports_with_dampening)
     assert total_safe_reports_with_dampening == 349
 
@@ -0,0 +1,63 @@
+"""Input generator for Day 2: Red-Nosed Reports"""
+
+from random import Random
+from typing import Final, MutableSequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 1000  # Reports
+
+LEVEL_MIN: Final[int] = 1
+LEVEL_MAX: Final[int] = 99
+
+
+def generate_report(random: Random, /, *, levels: int) -> MutableSequence[int]:
+    """Generate a safe report (all increasing or decreasing, by steps of 1-3)"""
+
+    sign: int = random.choice((-1, 1))
+    span: int = 3 * (levels - 1)
+
+    level: int = (
+        random.randint(LEVEL_MIN, LEVEL_MAX - span)
+        if sign == 1
+        else random.randint(LEVEL_MIN + span, LEVEL_MAX)
+    )
+    report: MutableSequence[int] = [level]
+
+    _: int
+    for _ in range(levels - 1):
+        level += sign * random.randint(1, 3)
+        report.append(level)
+
+    return report
+
+
+def generate(
+    file: TextIO,
+    /,
+    *,
+    size: int,
+    random: Random,
+    min_levels: int = 5,
+    max_levels: int = 8,
+) -> None:
+    """
+    Write `size` reports of `min_levels` to `max_levels` levels each
+
+    Reports start out safe, then roughly half have one level corrupted (safe with
+    dampening) and a quarter of those have a second level corrupted (unsafe).
+    """
+
+    _: int
+    for _ in range(size):
+        report: MutableSequence[int] = generate_report(
+            random, levels=random.randint(min_levels, max_levels)
+        )
+
+        corruptions: int = random.choices((0, 1, 2), weights=(4, 3, 1))[0]
+
+        for _ in range(corruptions):
+            report[random.randrange(len(report))] = random.randint(
+                LEVEL_MIN, LEVEL_MAX
+            )
+
+        file.write(" ".join(map(str, report)))
+        file.write("\n")
@@ -3,8 +3,11 @@
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Final, Generator, Iterable, Optional, Sequence
 
+from aoc.reader import FILENAME_INPUT, open_input
+
 
 class Operator(str, Enum):
     """Known instruction operators"""
@@ -43,11 +46,11 @@ PATTERN_INSTRUCTION: Final[str] = rf"(?P<operator>{OPERATOR}+)\((?P<operands>.*)
 PATTERN_INSTRUCTIONS: Final[str] = "|".join((PATTERN_MUL, PATTERN_DO, PATTERN_DONT))
 
 
-def read_input() -> str:
+def read_input(path: Path | str = FILENAME_INPUT, /) -> str:
     """Read the input file"""
 
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         return file.read()
 
 
@@ -74,21 +77,17 @@ def find_instructions(string: str, /) -> Generator[Instruction, None, None]:
         yield Instruction(operator, operands)
 
 
-def main() -> None:
-    """Solution for AoC 2024, Day 3, Parts 1 & 2"""
-
-    # Load the entire dataset into memory
-    dataset: str = read_input()
+def solve_part_1(dataset: str, /) -> int:
+    """Sum of all multiplications"""
 
-    # --- Part One ---
-    sum_of_multiplications: int = sum(
+    return sum(
         int(lhs) * int(rhs)
         for lhs, rhs in re.findall(r"mul\((?P<lhs>\d{1,3}),(?P<rhs>\d{1,3})\)", dataset)
     )
-    print("Sum of Multiplications:", sum_of_multiplications)
-    assert sum_of_multiplications == 175700056
 
-    # --- Part Two ---
+
+def solve_part_2(dataset: str, /) -> int:
+    """Sum of all enabled multiplications"""
 
     do: bool = True
     sum_of_multiplications_conditional: int = 0
@@ -110,6 +109,22 @@ def main() -> None:
 
                 sum_of_multiplications_conditional += lhs * rhs
 
+    return sum_of_multiplications_conditional
+
+
+def main() -> None:
+    """Solution for AoC 2024, Day 3, Parts 1 & 2"""
+
+    # Load the entire dataset into memory
+    dataset: str = read_input()
+
+    # --- Part One ---
+    sum_of_multiplications: int = solve_part_1(dataset)
+    print("Sum of Multiplications:", sum_of_multiplications)
+    assert sum_of_multiplications == 175700056
+
+    # --- Part Two ---
+    sum_of_multiplications_conditional: int = solve_part_2(dataset)
     print("Sum of Multiplications (Conditional):", sum_of_multiplications_conditional)
     assert sum_of_multiplications_conditional == 71668682
 
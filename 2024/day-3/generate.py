@@ -0,0 +1,63 @@
+"""Input generator for Day 3: Mull It Over"""
+
+import string
+from random import Random
+from typing import Final, Sequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 750  # Instructions (valid or otherwise)
+
+INSTRUCTIONS_PER_LINE: Final[int] = 125
+NOISE_CHARACTERS: Final[str] = string.punctuation + " "
+NOISE_OPERATORS: Final[Sequence[str]] = (
+    "why",
+    "where",
+    "what",
+    "when",
+    "who",
+    "how",
+    "select",
+    "from",
+    "mul",
+)
+
+
+def generate_operand(random: Random, /) -> str:
+    """Generate an operand of one to three digits"""
+
+    return str(random.randint(1, 999))
+
+
+def generate_instruction(random: Random, /) -> str:
+    """Generate an instruction, which may well be corrupted"""
+
+    kind: float = random.random()
+
+    # Valid instructions
+    if kind < 0.70:
+        return f"mul({generate_operand(random)},{generate_operand(random)})"
+    if kind < 0.73:
+        return "do()"
+    if kind < 0.76:
+        return "don't()"
+
+    # Corrupted instructions
+    operator: str = random.choice(NOISE_OPERATORS)
+
+    if kind < 0.90:
+        return f"{operator}()"
+
+    return f"{operator}({generate_operand(random)}{random.choice(NOISE_CHARACTERS)})"
+
+
+def generate(file: TextIO, /, *, size: int, random: Random) -> None:
+    """Write `size` (possibly corrupted) instructions, separated by noise"""
+
+    index: int
+    for index in range(size):
+        file.write(generate_instruction(random))
+        file.write("".join(random.choices(NOISE_CHARACTERS, k=random.randint(0, 4))))
+
+        if (index + 1) % INSTRUCTIONS_PER_LINE == 0:
+            file.write("\n")
+
+    file.write("\n")
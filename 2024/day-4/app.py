@@ -1,208 +1,87 @@
 """Day 4: Ceres Search"""
 
-import re
-from typing import Any, Iterable, MutableSequence, Sequence, Tuple, TypeAlias, TypeVar
+from pathlib import Path
+from typing import AbstractSet, Final, Sequence, Tuple
 
-T = TypeVar("T")
+from aoc.grid import Grid, read_grid
+from aoc.reader import FILENAME_INPUT
 
-Coord: TypeAlias = Tuple[int, int]
-Grid: TypeAlias = Sequence[Sequence[T]]
+WORD: Final[bytes] = b"XMAS"
+CROSS_CENTRE: Final[int] = ord("A")
+CROSS_ENDS: Final[AbstractSet[int]] = frozenset(b"MS")
 
 
-def get_grid_size(grid: Grid[Any], /) -> Tuple[int, int]:
-    if not grid:
-        return (0, 0)
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Grid:
+    """Read the input file into a grid of letters"""
 
-    size_x: int = len(grid[0])
-    size_y: int = len(grid)
+    return read_grid(path)
 
-    return (size_x, size_y)
 
+def get_all_lines(grid: Grid, /) -> Sequence[bytes]:
+    """Every line of letters in the grid: horizontal, vertical & both diagonals"""
 
-def get_square_grid_size(grid: Grid[Any], /) -> int:
-    size_x: int
-    size_y: int
-    size_x, size_y = get_grid_size(grid)
-
-    assert size_x == size_y, f"Grid is not a square ({size_x}x{size_y})"
-
-    return size_x
-
-
-def read_input() -> str:
-    """Read the input file"""
-
-    file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
-        return file.read()
-
-
-def to_diagonal(
-    strings: Sequence[str], /, *, anchor: Tuple[int, int] = (0, 0)
-) -> Sequence[str]:
-    """Produce a sequence of diagonal strings from a given sequence (assuming a perfect square)"""
-
-    if not strings:
-        return ()
-
-    size: int = len(strings[0])
-
-    strings_diagonal: MutableSequence[str] = []
-
-    depth: int
-    string_diagonal: str
-    x: int
-    y: int
-    true_x: int
-    true_y: int
-
-    for depth in range(size):
-        string_diagonal = ""
-
-        for y in range(depth + 1):
-            x = depth - y
-
-            true_x = abs(anchor[0] - x)
-            true_y = abs(anchor[1] - y)
-
-            string_diagonal += strings[true_x][true_y]
-
-        strings_diagonal.append(string_diagonal)
-
-    for depth in range(size - 1):
-        true_depth = size - depth - 2
-
-        string_diagonal = ""
-
-        for a in range(size - depth - 1):
-            y = depth + a + 1
-            x = (true_depth - a) + depth + 1
-
-            true_x = abs(anchor[0] - x)
-            true_y = abs(anchor[1] - y)
-
-            string_diagonal += strings[true_x][true_y]
-
-        strings_diagonal.append(string_diagonal)
-
-    return strings_diagonal
-
-
-def count_xmas_in_strings(strings: Sequence[str], /) -> int:
-    return sum(len(re.findall("XMAS", string)) for string in strings)
-
-
-# Load the entire dataset into memory
-dataset: str = read_input()
-
-# --- Part One ---
-
-lines_horizontal: Sequence[str] = dataset.splitlines()
-lines_vertical: Sequence[str] = tuple("".join(line) for line in zip(*lines_horizontal))
-
-size: int = len(lines_horizontal[0])
-
-lines_diagonal_left: Sequence[str] = to_diagonal(lines_horizontal, anchor=(0, 0))
-lines_diagonal_right: Sequence[str] = to_diagonal(
-    lines_horizontal, anchor=(0, size - 1)
-)
-
-seq_of_lines: Sequence[Sequence[str]] = (
-    lines_horizontal,
-    lines_vertical,
-    lines_diagonal_left,
-    lines_diagonal_right,
-)
-
-total_xmas_occurences: int = 0
-
-lines: Sequence[str]
-for lines in seq_of_lines:
-    lines_inv: Sequence[str] = tuple(line[::-1] for line in lines)
-
-    total_xmas_occurences += count_xmas_in_strings(lines)
-    total_xmas_occurences += count_xmas_in_strings(lines_inv)
+    return (
+        *grid.rows(),
+        *grid.columns(),
+        *grid.diagonals(),
+        *grid.anti_diagonals(),
+    )
 
-print("Part 1:", total_xmas_occurences)
-assert total_xmas_occurences == 2468
 
-# --- Part Two ---
+def count_word_in_lines(lines: Sequence[bytes], word: bytes, /) -> int:
+    """Total occurences of a word in some lines, either forwards or backwards"""
 
+    # Neither "XMAS" nor "SAMX" can overlap themselves, so non-overlapping counts
+    # are every occurence
+    word_inv: bytes = word[::-1]
 
-def find_all_a_coords(letters: Sequence[Sequence[str]], /) -> Sequence[Tuple[int, int]]:
-    if not letters:
-        return ()
+    return sum(line.count(word) + line.count(word_inv) for line in lines)
 
-    size_x: int = len(letters[0])
-    size_y: int = len(letters)
 
-    coords: MutableSequence[Tuple[int, int]] = []
+def get_cross_ends(grid: Grid, index: int, /) -> Tuple[AbstractSet[int], ...]:
+    """The letters at the ends of both diagonals crossing at a cell"""
 
-    x: int
-    for x in range(size_x):
-        y: int
-        for y in range(size_y):
-            letter: str = letters[x][y]
+    data: bytearray = grid.data
+    stride: int = grid.stride
 
-            if letter == "A":
-                coords.append((x, y))
+    # Cells on the edge of the grid neighbour its border, which never matches
+    return (
+        {data[index - stride - 1], data[index + stride + 1]},
+        {data[index - stride + 1], data[index + stride - 1]},
+    )
 
-    return coords
 
+def solve_part_1(grid: Grid, /) -> int:
+    """Total occurences of "XMAS" in any direction"""
 
-def get_cross_words_for_coord(
-    letters: Sequence[Sequence[str]], coord: Tuple[int, int], /
-) -> Sequence[str]:
-    size: int = len(letters[0])
-    bounds: Tuple[int, int] = (0, size - 1)
+    return count_word_in_lines(get_all_lines(grid), WORD)
 
-    x: int
-    y: int
-    x, y = coord
 
-    if x in bounds or y in bounds:
-        # Don't bother doing anything, as there can be at most two
-        # letters per diag as we're at a corner.
-        return ()
+def solve_part_2(grid: Grid, /) -> int:
+    """Total occurences of "MAS" in the shape of an X"""
 
-    tl_to_br: str = "".join(
-        (
-            letters[x - 1][y - 1],
-            letters[x][y],
-            letters[x + 1][y + 1],
-        )
+    return sum(
+        all(ends == CROSS_ENDS for ends in get_cross_ends(grid, index))
+        for index in grid.find_all(CROSS_CENTRE)
     )
-    tr_to_bl: str = "".join(
-        (
-            letters[x + 1][y - 1],
-            letters[x][y],
-            letters[x - 1][y + 1],
-        )
-    )
-
-    return (tl_to_br, tr_to_bl)
-
 
-coords: Sequence[Tuple[int, int]] = find_all_a_coords(lines_horizontal)
 
-total_count_of_x_mas: int = 0
+def main() -> None:
+    """Solution for AoC 2024, Day 4, Parts 1 & 2"""
 
-coord: Tuple[int, int]
-for coord in coords:
-    cross_words: Sequence[str] = get_cross_words_for_coord(lines_horizontal, coord)
+    # Load the entire grid into memory
+    grid: Grid = read_input()
 
-    if not cross_words:
-        continue
-
-    cross_words_inv: Sequence[str] = tuple(
-        cross_word[::-1] for cross_word in cross_words
-    )
+    # --- Part One ---
+    total_xmas_occurences: int = solve_part_1(grid)
+    print("Part 1:", total_xmas_occurences)
+    assert total_xmas_occurences == 2468
 
-    all_cross_words: Sequence[str] = (*cross_words, *cross_words_inv)
-    count_of_x_mas: int = sum(map(lambda line: line == "MAS", all_cross_words))
+    # --- Part Two ---
+    total_count_of_x_mas: int = solve_part_2(grid)
+    print("Part 2:", total_count_of_x_mas)
+    assert total_count_of_x_mas == 1864
 
-    if count_of_x_mas == 2:
-        total_count_of_x_mas += 1
 
-print("Part 2:", total_count_of_x_mas)
-assert total_count_of_x_mas == 1864
+if __name__ == "__main__":
+    main()
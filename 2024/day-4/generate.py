@@ -0,0 +1,17 @@
+"""Input generator for Day 4: Ceres Search"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 140  # Width (and height) of the word search
+
+LETTERS: Final[str] = "XMAS"
+
+
+def generate(file: TextIO, /, *, size: int, random: Random) -> None:
+    """Write a `size` by `size` word search of the letters X, M, A and S"""
+
+    _: int
+    for _ in range(size):
+        file.write("".join(random.choices(LETTERS, k=size)))
+        file.write("\n")
@@ -1,10 +1,15 @@
 """Day 5: Print Queue"""
 
 from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from itertools import combinations, permutations
+from pathlib import Path
 from typing import (
+    Callable,
     Collection,
     Final,
     Iterable,
+    Mapping,
     MutableMapping,
     MutableSequence,
     NamedTuple,
@@ -13,15 +18,23 @@ from typing import (
     TypeAlias,
 )
 
+from aoc.counters import KIND_DEPTH, Counter
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.reader import (
+    FILENAME_INPUT,
+    MappedInput,
+    parse_int_columns,
+    parse_int_rows,
+    split_sections,
+)
+
 # Typing
 Update: TypeAlias = Sequence[int]
 MutableUpdate: TypeAlias = MutableSequence[int]
 
 
 # Constants
-RULE_SEP: Final[str] = "|"
-UPDATE_SEP: Final[str] = ","
-SECTION_SEP: Final[str] = "\n\n"
+UPDATE_SEP: Final[bytes] = b","
 
 
 # Models
@@ -53,39 +66,25 @@ class RuleValidationError(Exception):
     rule: Rule
 
 
-def read_input() -> str:
-    """Read the input file"""
-
-    file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
-        return file.read()
-
-
-def parse_rule(rule: str, /) -> Rule:
-    """Parse a rule, e.g. "x|y", into a (named) tuple of (x, y)"""
-
-    x: int
-    y: int
-    x, y = map(int, rule.split(RULE_SEP))
-
-    return Rule(x, y)
-
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Dataset:
+    """Read (memory-map) and parse the input file"""
 
-def parse_update(update: str, /) -> Update:
-    """Parse an update, e.g. "75,47,61,53,29", into a sequence of page numbers"""
+    input_: MappedInput
+    with MappedInput(path) as input_:
+        return parse_dataset(input_.view)
 
-    return tuple(map(int, update.split(UPDATE_SEP)))
 
+def parse_dataset(dataset: memoryview, /) -> Dataset:
+    """Parse a raw dataset into updates & rules"""
 
-def parse_dataset(string: str, /) -> Dataset:
-    """Parse a raw dataset string into updates & rules"""
+    raw_rules: memoryview
+    raw_updates: memoryview
+    raw_rules, raw_updates = split_sections(dataset)
 
-    raw_rules: str
-    raw_updates: str
-    raw_rules, raw_updates = string.strip().split(SECTION_SEP)
-
-    rules: Collection[Rule] = tuple(map(parse_rule, raw_rules.split()))
-    updates: Sequence[Update] = tuple(map(parse_update, raw_updates.split()))
+    # Rules, e.g. b"x|y", are parsed as two columns of (x, y)
+    rules: Collection[Rule] = tuple(map(Rule, *parse_int_columns(raw_rules, 2)))
+    # Updates, e.g. b"75,47,61,53,29", are parsed as rows of page numbers
+    updates: Sequence[Update] = parse_int_rows(raw_updates, UPDATE_SEP)
 
     return Dataset(rules, updates)
 
@@ -199,31 +198,26 @@ class RuleMachine:
         return self.fix(new_update)
 
 
-def main() -> None:
-    """Solution for AoC 2024, Day 5, Parts 1 & 2"""
-
-    # Load the input (dataset) into memory and parse it.
-    raw_dataset: str = read_input()
-    dataset: Dataset = parse_dataset(raw_dataset)
+def solve_part_1_rule_machine(dataset: Dataset, /) -> int:
+    """Sum of the middle page numbers of all valid updates"""
 
-    # Create a rule machine!
+    # Create a rule machine, and learn all the rules...
     rule_machine: RuleMachine = RuleMachine()
-
-    # Learn all the rules...
     rule_machine.learn_all(dataset.rules)
 
-    # --- Part One ---
-
     # Find only the valid updates
     valid_updates: Iterable[Update] = rule_machine.get_valid_updates(dataset.updates)
 
     # Sum the middle page numbers of all valid updates
-    part_1: int = sum(map(get_middle_page_number, valid_updates))
+    return sum(map(get_middle_page_number, valid_updates))
 
-    print("Part 1:", part_1)
-    assert part_1 == 4689
 
-    # --- Part Two ---
+def solve_part_2_rule_machine(dataset: Dataset, /) -> int:
+    """Sum of the middle page numbers of all fixed (formerly invalid) updates"""
+
+    # Create a rule machine, and learn all the rules...
+    rule_machine: RuleMachine = RuleMachine()
+    rule_machine.learn_all(dataset.rules)
 
     # Find only the invalid updates
     invalid_updates: Iterable[Update] = rule_machine.get_invalid_updates(
@@ -234,8 +228,117 @@ def main() -> None:
     fixed_updates: Iterable[Update] = map(rule_machine.fix, invalid_updates)
 
     # Sum the middle page numbers of all fixed (formerly invalid) updates
-    total_2: int = sum(map(get_middle_page_number, fixed_updates))
+    return sum(map(get_middle_page_number, fixed_updates))
+
+
+def is_update_valid_pairwise(update: Update, rules: Set[Rule], /) -> bool:
+    """Check whether an update is valid, by checking every pair of its pages"""
+
+    return not any(
+        Rule(later, earlier) in rules for earlier, later in combinations(update, 2)
+    )
+
+
+def fix_update_pairwise(update: Update, rules: Set[Rule], /) -> Update:
+    """Fix an update, by (topologically) sorting its pages by the rules between them"""
+
+    # Pages are only placed once every page that must precede them has been, and
+    # of those ready to be placed, whichever came first in the update goes first
+    index: Mapping[int, int] = {page: index for index, page in enumerate(update)}
+    successors: Mapping[int, MutableSequence[int]] = {page: [] for page in update}
+    predecessors: MutableMapping[int, int] = dict.fromkeys(update, 0)
+
+    earlier: int
+    later: int
+    for earlier, later in permutations(update, 2):
+        if Rule(earlier, later) in rules:
+            successors[earlier].append(later)
+            predecessors[later] += 1
 
+    ready: MutableSequence[int] = [
+        index[page] for page in update if not predecessors[page]
+    ]
+    fixed: MutableUpdate = []
+
+    while ready:
+        page: int = update[heappop(ready)]
+        fixed.append(page)
+
+        for later in successors[page]:
+            predecessors[later] -= 1
+
+            if not predecessors[later]:
+                heappush(ready, index[later])
+
+    return fixed
+
+
+def solve_part_1_pairwise(dataset: Dataset, /) -> int:
+    """Sum of the middle page numbers of all valid updates (checking every pair)"""
+
+    rules: Set[Rule] = set(dataset.rules)
+
+    return sum(
+        get_middle_page_number(update)
+        for update in dataset.updates
+        if is_update_valid_pairwise(update, rules)
+    )
+
+
+def solve_part_2_pairwise(dataset: Dataset, /) -> int:
+    """Sum of the middle page numbers of all fixed updates (sorting each by rules)"""
+
+    rules: Set[Rule] = set(dataset.rules)
+
+    return sum(
+        get_middle_page_number(fix_update_pairwise(update, rules))
+        for update in dataset.updates
+        if not is_update_valid_pairwise(update, rules)
+    )
+
+
+# The rule machine is the reference, the oracle the pairwise engine is checked
+# against. Checking every pair of pages against a set of rules (and sorting invalid
+# updates topologically, rather than moving one page at a time) is faster at every
+# size measured (~2x at 1kB, ~8x on the real input), but inputs below 1kB (e.g. the
+# puzzle's example) take about a millisecond either way, so stay on the reference
+ENGINES: Final[EngineRegistry] = EngineRegistry(
+    Engine(
+        ENGINE_REFERENCE,
+        solve_part_1_rule_machine,
+        solve_part_2_rule_machine,
+        min_size=None,
+    ),
+    Engine(
+        "pairwise", solve_part_1_pairwise, solve_part_2_pairwise, min_size=1_024
+    ),
+)
+
+# Run on its own (rather than by the runner), each part uses the default engine
+solve_part_1: Final[Callable[[Dataset], int]] = ENGINES.default.solve_part_1
+solve_part_2: Final[Callable[[Dataset], int]] = ENGINES.default.solve_part_2
+
+# Updates validated by either engine, and how deep fixing an update recursed
+COUNTERS: Final[Sequence[Counter]] = (
+    Counter("validations", "RuleMachine.validate"),
+    Counter("validations", "is_update_valid_pairwise"),
+    Counter("fix_depth", "RuleMachine.fix", KIND_DEPTH),
+)
+
+
+def main() -> None:
+    """Solution for AoC 2024, Day 5, Parts 1 & 2"""
+
+    # Load the input (dataset) into memory and parse it.
+    dataset: Dataset = read_input()
+
+    # --- Part One ---
+    part_1: int = solve_part_1(dataset)
+    print("Part 1:", part_1)
+    assert part_1 == 4689
+
+    # --- Part Two ---
+    total_2: int = solve_part_2(dataset)
     print("Part 2:", total_2)
     assert total_2 == 6336
 
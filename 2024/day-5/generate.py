@@ -0,0 +1,66 @@
+"""Input generator for Day 5: Print Queue"""
+
+from random import Random
+from typing import Final, Mapping, MutableSequence, Sequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 200  # Updates
+
+PAGE_MIN: Final[int] = 10
+
+
+def generate(
+    file: TextIO,
+    /,
+    *,
+    size: int,
+    random: Random,
+    pages: int = 49,
+    min_update_length: int = 5,
+    max_update_length: int = 23,
+) -> None:
+    """
+    Write page ordering rules for `pages` pages, followed by `size` updates
+
+    The pages are given a random total order, and a rule is written for every pair
+    of pages, so every update has exactly one valid ordering. Roughly half of the
+    updates are written in that order, the remainder are shuffled. Updates always
+    contain an odd number of pages, so that they have a middle page (and never more
+    pages than there are, so update lengths are clamped to `pages`).
+    """
+
+    if pages < 1:
+        raise ValueError(f"Updates need at least one page to choose from, not {pages}")
+
+    # Page numbers are kept to (at least) two digits, as in the real input
+    page_numbers: Sequence[int] = random.sample(
+        range(PAGE_MIN, PAGE_MIN + max(90, 2 * pages)), pages
+    )
+    rank: Mapping[int, int] = {page: index for index, page in enumerate(page_numbers)}
+
+    # --- Rules ---
+
+    x_index: int
+    for x_index in random.sample(range(pages), pages):
+        y_index: int
+        for y_index in range(x_index + 1, pages):
+            file.write(f"{page_numbers[x_index]}|{page_numbers[y_index]}\n")
+
+    file.write("\n")
+
+    # --- Updates ---
+
+    # Update lengths are rounded to odd numbers (the maximum down, the minimum up)
+    max_length: int = min(max_update_length, pages)
+    max_length -= 1 - max_length % 2
+    min_length: int = min(min_update_length + 1 - min_update_length % 2, max_length)
+
+    _: int
+    for _ in range(size):
+        length: int = random.randrange(min_length, max_length + 1, 2)
+        update: MutableSequence[int] = random.sample(page_numbers, length)
+
+        if random.random() < 0.5:
+            update.sort(key=rank.__getitem__)
+
+        file.write(",".join(map(str, update)))
+        file.write("\n")
@@ -1,17 +1,27 @@
 """Day 7: Bridge Repair"""
 
 import itertools
-import math
 from dataclasses import dataclass
+from functools import partial
 from operator import add as operator_add
 from operator import mul as operator_mul
-from typing import Collection, Final, Iterable, Protocol, Sequence
-
-
-def concatenate(a: int, b: int, /) -> int:
-    shift: int = math.floor(math.log(abs(b), 10) + 1)
-
-    return a * 10**shift + b
+from pathlib import Path
+from typing import (
+    Callable,
+    Collection,
+    Final,
+    Iterable,
+    Iterator,
+    Protocol,
+    Sequence,
+    Tuple,
+)
+
+from aoc.chunks import sum_chunks
+from aoc.counters import KIND_DEPTH, KIND_ITEMS, Counter
+from aoc.digits import concat, int_len, int_split
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.reader import FILENAME_INPUT, open_input
 
 
 class Operator(Protocol):
@@ -20,7 +30,7 @@ class Operator(Protocol):
 
 OPERATOR_ADD: Final[Operator] = operator_add
 OPERATOR_MUL: Final[Operator] = operator_mul
-OPERATOR_CON: Final[Operator] = concatenate
+OPERATOR_CON: Final[Operator] = concat
 
 
 @dataclass
@@ -29,11 +39,6 @@ class Equation:
     operands: Sequence[int]
 
 
-def read_dataset() -> str:
-    with open("input", encoding="utf-8") as file:
-        return file.read()
-
-
 def parse_line(line: str, /) -> Equation:
     raw_test_value: str
     raw_operands: str
@@ -45,15 +50,24 @@ def parse_line(line: str, /) -> Equation:
     )
 
 
-def parse_dataset(dataset: str, /) -> Iterable[Equation]:
-    return tuple(map(parse_line, dataset.splitlines()))
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Iterator[Equation]:
+    # One equation per line, so there's no need to hold the whole input at once
+    file: Iterable[str]
+    with open_input(path, text=True) as file:
+        yield from map(parse_line, file)
+
+
+def iter_operator_combinations(
+    operators: Collection[Operator], count: int, /
+) -> Iterable[Sequence[Operator]]:
+    return itertools.product(operators, repeat=count)
 
 
 def validate_equation(
     equation: Equation, /, *, operators: Collection[Operator]
 ) -> bool:
-    operators_product: Iterable[Sequence[Operator]] = itertools.product(
-        operators, repeat=len(equation.operands) - 1
+    operators_product: Iterable[Sequence[Operator]] = iter_operator_combinations(
+        operators, len(equation.operands) - 1
     )
 
     operators_combo: Sequence[Operator]
@@ -74,32 +88,142 @@ def validate_equation(
     return False
 
 
+def can_produce(
+    value: int, operands: Sequence[int], count: int, /, *, concatenation: bool
+) -> bool:
+    # Whether the first `count` operands can produce the value, working backwards
+    # from it: the last operator can only have been one whose inverse leaves a
+    # whole, non-negative value, which prunes almost every combination
+    last: int = operands[count - 1]
+
+    if count == 1:
+        return value == last
+
+    if value >= last and can_produce(
+        value - last, operands, count - 1, concatenation=concatenation
+    ):
+        return True
+
+    if last == 0:
+        # Whatever the rest produce, multiplying it by zero produces zero
+        if value == 0:
+            return True
+    elif value % last == 0 and can_produce(
+        value // last, operands, count - 1, concatenation=concatenation
+    ):
+        return True
+
+    if not concatenation:
+        return False
+
+    head: int
+    tail: int
+    head, tail = int_split(value, int_len(last))
+
+    return tail == last and can_produce(
+        head, operands, count - 1, concatenation=concatenation
+    )
+
+
+def validate_equation_backwards(equation: Equation, /, *, concatenation: bool) -> bool:
+    return can_produce(
+        equation.test_value,
+        equation.operands,
+        len(equation.operands),
+        concatenation=concatenation,
+    )
+
+
 def calculate_total_calibration_result(
-    equations: Iterable[Equation], /, *, operators: Collection[Operator]
+    equations: Iterable[Equation], /, *, validate: Callable[[Equation], bool]
 ) -> int:
     total_calibration_result: int = 0
 
     equation: Equation
     for equation in equations:
-        if validate_equation(equation, operators=operators):
+        if validate(equation):
             total_calibration_result += equation.test_value
 
     return total_calibration_result
 
 
-def main() -> None:
-    raw_dataset: str = read_dataset()
-    all_equations: Iterable[Equation] = parse_dataset(raw_dataset)
+def solve_part_1_reference(equations: Iterable[Equation], /) -> int:
+    return calculate_total_calibration_result(
+        equations,
+        validate=partial(validate_equation, operators=(OPERATOR_ADD, OPERATOR_MUL)),
+    )
+
 
-    part_1: int = calculate_total_calibration_result(
-        all_equations, operators=(OPERATOR_ADD, OPERATOR_MUL)
+def solve_part_2_reference(equations: Iterable[Equation], /) -> int:
+    return calculate_total_calibration_result(
+        equations,
+        validate=partial(
+            validate_equation, operators=(OPERATOR_ADD, OPERATOR_MUL, OPERATOR_CON)
+        ),
     )
+
+
+def solve_part_1_backwards(equations: Iterable[Equation], /) -> int:
+    return calculate_total_calibration_result(
+        equations, validate=partial(validate_equation_backwards, concatenation=False)
+    )
+
+
+def solve_part_2_backwards(equations: Iterable[Equation], /) -> int:
+    return calculate_total_calibration_result(
+        equations, validate=partial(validate_equation_backwards, concatenation=True)
+    )
+
+
+# Trying every combination of operators is the reference, the oracle the backwards
+# search is checked against, as it's exactly the search the puzzle describes. It's
+# exponential in the number of operands though (~40s on the real input, against
+# ~0.03s), so it's only run by name
+ENGINES: Final[EngineRegistry] = EngineRegistry(
+    Engine(
+        ENGINE_REFERENCE,
+        solve_part_1_reference,
+        solve_part_2_reference,
+        min_size=None,
+    ),
+    Engine("backwards", solve_part_1_backwards, solve_part_2_backwards),
+)
+
+# Run on its own (rather than by the runner), each part uses the default engine
+solve_part_1: Final[Callable[[Iterable[Equation]], int]] = ENGINES.default.solve_part_1
+solve_part_2: Final[Callable[[Iterable[Equation]], int]] = ENGINES.default.solve_part_2
+
+# Work done by each engine: combinations of operators tried in full, or steps of
+# the backwards search (and how deep it went)
+COUNTERS: Final[Sequence[Counter]] = (
+    Counter("combinations_tried", "iter_operator_combinations", KIND_ITEMS),
+    Counter("backwards_steps", "can_produce"),
+    Counter("backwards_depth", "can_produce", KIND_DEPTH),
+)
+
+
+def solve_shard(equations: Sequence[Equation], /) -> Tuple[int, int]:
+    # Equations are independent of one another, so any shard of them (or chunk of
+    # lines) can be solved on its own (see `aoc.mapreduce`)
+    return (solve_part_1(equations), solve_part_2(equations))
+
+
+def solve_chunk(lines: Iterable[str], /) -> Tuple[int, int]:
+    return solve_shard(tuple(map(parse_line, lines)))
+
+
+# The calibration results of every chunk (or shard) just add up
+combine_chunks = sum_chunks
+
+
+def main() -> None:
+    all_equations: Sequence[Equation] = tuple(read_input())
+
+    part_1: int = solve_part_1(all_equations)
     print("Part 1:", part_1)
     assert part_1 == 1985268524462
 
-    part_2: int = calculate_total_calibration_result(
-        all_equations, operators=(OPERATOR_ADD, OPERATOR_MUL, OPERATOR_CON)
-    )
+    part_2: int = solve_part_2(all_equations)
     print("Part 2:", part_2)
     assert part_2 == 150077710195188
 
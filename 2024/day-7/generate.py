@@ -0,0 +1,72 @@
+"""Input generator for Day 7: Bridge Repair"""
+
+from random import Random
+from typing import Final, Sequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 850  # Equations
+
+OPERAND_MIN: Final[int] = 1
+OPERAND_MAX: Final[int] = 999
+ZERO_CHANCE: Final[float] = 0.02  # Of an operand being zero (never, in the real input)
+
+
+def generate_operand(random: Random, /, *, zero_chance: float) -> int:
+    """Generate an operand of one to three digits (mostly one, as in the real input)"""
+
+    # Zero is an edge case for every operator (and its inverse), so is mixed in too
+    if random.random() < zero_chance:
+        return 0
+
+    digits: int = random.choices((1, 2, 3), weights=(6, 3, 1))[0]
+
+    return random.randint(OPERAND_MIN, min(OPERAND_MAX, 10**digits - 1))
+
+
+def apply_random_operator(random: Random, lhs: int, rhs: int, /) -> int:
+    """Apply a randomly chosen operator (add, multiply or concatenate)"""
+
+    match random.randrange(3):
+        case 0:
+            return lhs + rhs
+        case 1:
+            return lhs * rhs
+        case _:
+            return int(f"{lhs}{rhs}")
+
+
+def generate(
+    file: TextIO,
+    /,
+    *,
+    size: int,
+    random: Random,
+    min_operands: int = 3,
+    max_operands: int = 12,
+    zero_chance: float = ZERO_CHANCE,
+) -> None:
+    """
+    Write `size` equations of `min_operands` to `max_operands` operands each
+
+    Roughly two thirds of the equations are solvable, as their test value is
+    produced by applying random operators to their operands. The remainder have
+    their test value nudged, making them (very likely) unsolvable. Operands are
+zero by `zero_chance`.
+    """
+
+    _: int
+    for _ in range(size):
+        operands: Sequence[int] = tuple(
+            generate_operand(random, zero_chance=zero_chance)
+            for _ in range(random.randint(min_operands, max_operands))
+        )
+
+        test_value: int = operands[0]
+
+        operand: int
+        for operand in operands[1:]:
+            test_value = apply_random_operator(random, test_value, operand)
+
+        if random.random() < 1 / 3:
+            test_value += random.randint(1, OPERAND_MAX)
+
+        file.write(f"{test_value}: {' '.join(map(str, operands))}\n")
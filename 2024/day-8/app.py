@@ -1,6 +1,7 @@
 """Day 8: Resonant Collinearity"""
 
 import itertools
+from pathlib import Path
 from typing import (
     Collection,
     Final,
@@ -9,98 +10,49 @@ from typing import (
     MutableMapping,
     MutableSequence,
     MutableSet,
-    Sequence,
     Set,
     Tuple,
     TypeAlias,
     TypeVar,
 )
 
+from aoc.grid import Grid, read_grid
+from aoc.reader import FILENAME_INPUT
+
 # Typing
 T = TypeVar("T")
 Coord: TypeAlias = Tuple[int, int]
-Grid: TypeAlias = Sequence[Sequence[T]]
-MutableGrid: TypeAlias = MutableSequence[MutableSequence[T]]
 Pair: TypeAlias = Tuple[T, T]
 
 # Constants
-VALUE_EMPTY: Final[str] = "."
-VALUE_ANTINODE: Final[str] = "#"
-
-
-def read_dataset() -> str:
-    with open("input", encoding="utf-8") as file:
-        return file.read()
-
-
-def parse_dataset(dataset: str, /) -> MutableGrid[str]:
-    return [list(row) for row in dataset.splitlines()]
-
-
-def grid_get(grid: Grid[T], /, x: int, y: int) -> T:
-    return grid[y][x]
-
-
-def grid_set(grid: MutableGrid[T], /, x: int, y: int, value: T) -> None:
-    grid[y][x] = value
-
-
-def grid_size(grid: Grid[T], /) -> Tuple[int, int]:
-    size_y: int = len(grid)
-    size_x: int = len(grid[0]) if grid else 0
-
-    return (size_x, size_y)
-
-
-def grid_iter(grid: Grid[T], /) -> Iterable[Tuple[Coord, T]]:
-    size_x: int
-    size_y: int
-    size_x, size_y = grid_size(grid)
-
-    y: int
-    for y in range(size_y):
-        x: int
-        for x in range(size_x):
-            value: T = grid_get(grid, x, y)
-
-            yield ((x, y), value)
-
-
-def grid_contains(grid: Grid[T], /, x: int, y: int) -> bool:
-    size_x: int
-    size_y: int
-    size_x, size_y = grid_size(grid)
+VALUE_EMPTY: Final[int] = ord(".")
+VALUE_ANTINODE: Final[int] = ord("#")
 
-    return 0 <= x < size_x and 0 <= y < size_y
 
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Grid:
+    return read_grid(path)
 
-def grid_print(grid: Grid[T], /) -> None:
-    row: Sequence[T]
-    for row in grid:
-        value: T
-        for value in row:
-            print(value, end="")
 
-        print()
+def find_antennas(grid: Grid, /) -> Iterable[Tuple[Coord, int]]:
+    data: bytearray = grid.data
 
+    index: int
+    for index in grid.indices():
+        value: int = data[index]
 
-def find_antennas(grid: Grid[str], /) -> Iterable[Tuple[Coord, str]]:
-    coord: Coord
-    value: str
-    for coord, value in grid_iter(grid):
         if value in (VALUE_EMPTY, VALUE_ANTINODE):
             continue
 
-        yield (coord, value)
+        yield (grid.coord(index), value)
 
 
 def group_antennas(
-    antennas: Iterable[Tuple[Coord, str]], /
-) -> Mapping[str, Collection[Coord]]:
-    grouped_antennas: MutableMapping[str, MutableSequence[Coord]] = {}
+    antennas: Iterable[Tuple[Coord, int]], /
+) -> Mapping[int, Collection[Coord]]:
+    grouped_antennas: MutableMapping[int, MutableSequence[Coord]] = {}
 
     coord: Coord
-    antenna: str
+    antenna: int
     for coord, antenna in antennas:
         grouped_antennas.setdefault(antenna, []).append(coord)
 
@@ -108,8 +60,8 @@ def group_antennas(
 
 
 def pair_antennas(
-    antennas: Iterable[Tuple[Coord, str]], /
-) -> Mapping[str, Collection[Pair[Coord]]]:
+    antennas: Iterable[Tuple[Coord, int]], /
+) -> Mapping[int, Collection[Pair[Coord]]]:
     return {
         frequency: tuple(itertools.combinations(coords, 2))
         for frequency, coords in group_antennas(antennas).items()
@@ -160,7 +112,7 @@ def calculate_antinode_coords(coord_1: Coord, coord_2: Coord, /) -> Pair[Coord]:
 
 
 def calculate_all_antinode_coords(
-    grid: Grid[T], coord_1: Coord, coord_2: Coord, /
+    grid: Grid, coord_1: Coord, coord_2: Coord, /
 ) -> Collection[Coord]:
     dx: int
     dy: int
@@ -174,41 +126,37 @@ def calculate_all_antinode_coords(
 
     # Work "backwards" from coord 1
     coord = coord_1
-    while grid_contains(grid, *coord):
+    while grid.contains(*coord):
         antinode_coords.add(coord)
         coord = translate_coord(coord, translation_inv)
 
     # Work "forwards" from coord 1
     coord = coord_1
-    while grid_contains(grid, *coord):
+    while grid.contains(*coord):
         antinode_coords.add(coord)
         coord = translate_coord(coord, translation)
 
     return antinode_coords
 
 
-def main() -> None:
-    dataset: str = read_dataset()
-    grid: MutableGrid[str] = parse_dataset(dataset)
-
-    # --- Part One ---
-
-    antennas: Iterable[Tuple[Coord, str]] = find_antennas(grid)
-    antenna_pairs: Mapping[str, Collection[Pair[Coord]]] = pair_antennas(antennas)
+def solve_part_1(grid: Grid, /) -> int:
+    antennas: Iterable[Tuple[Coord, int]] = find_antennas(grid)
+    antenna_pairs: Mapping[int, Collection[Pair[Coord]]] = pair_antennas(antennas)
 
     unique_antinode_coords: Set[Coord] = {
         antinode_coord
         for pairs in antenna_pairs.values()
         for antenna_1, antenna_2 in pairs
         for antinode_coord in calculate_antinode_coords(antenna_1, antenna_2)
-        if grid_contains(grid, *antinode_coord)
+        if grid.contains(*antinode_coord)
     }
-    part_1: int = len(unique_antinode_coords)
 
-    print("Part 1:", part_1)
-    assert part_1 == 341
+    return len(unique_antinode_coords)
 
-    # --- Part Two ---
+
+def solve_part_2(grid: Grid, /) -> int:
+    antennas: Iterable[Tuple[Coord, int]] = find_antennas(grid)
+    antenna_pairs: Mapping[int, Collection[Pair[Coord]]] = pair_antennas(antennas)
 
     unique_antinode_coords_with_resonant_harmonics: Set[Coord] = {
         antinode_coord
@@ -216,8 +164,20 @@ def main() -> None:
         for antenna_1, antenna_2 in pairs
         for antinode_coord in calculate_all_antinode_coords(grid, antenna_1, antenna_2)
     }
-    part_2: int = len(unique_antinode_coords_with_resonant_harmonics)
 
+    return len(unique_antinode_coords_with_resonant_harmonics)
+
+
+def main() -> None:
+    grid: Grid = read_input()
+
+    # --- Part One ---
+    part_1: int = solve_part_1(grid)
+    print("Part 1:", part_1)
+    assert part_1 == 341
+
+    # --- Part Two ---
+    part_2: int = solve_part_2(grid)
     print("Part 2:", part_2)
     assert part_2 == 1134
 
@@ -0,0 +1,25 @@
+"""Input generator for Day 8: Resonant Collinearity"""
+
+import string
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 50  # Width (and height) of the map
+
+FREQUENCIES: Final[str] = string.digits + string.ascii_letters
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, density: float = 0.09
+) -> None:
+    """Write a `size` by `size` map, with antennas making up `density` of it"""
+
+    _: int
+    for _ in range(size):
+        file.write(
+            "".join(
+                random.choice(FREQUENCIES) if random.random() < density else "."
+                for _ in range(size)
+            )
+        )
+        file.write("\n")
@@ -1,52 +1,26 @@
 """Day 9: Disk Fragmenter"""
 
-from dataclasses import dataclass
-from enum import Enum, IntEnum, auto
+from array import array
+from enum import Enum, auto
+from itertools import groupby
+from pathlib import Path
 from typing import (
     Callable,
     Final,
     Generic,
     Iterable,
+    Mapping,
     MutableSequence,
     MutableSet,
     Optional,
-    Self,
     Sequence,
-    Type,
     TypeAlias,
     TypeVar,
 )
 
-
-class _CyclicalEnum(IntEnum):
-    """Enum with sequential, cyclical members"""
-
-    @classmethod
-    def first(cls: Type[Self], /) -> Self:
-        """Get the first member of this enum"""
-
-        return cls(1)
-
-    @classmethod
-    def last(cls: Type[Self], /) -> Self:
-        """Get the last member of this enum"""
-
-        return cls(len(cls))
-
-    def next(self: Self, /) -> Self:
-        """Get the next member of this enum"""
-
-        cls: Type[Self] = type(self)
-        next_value: int = self.value % len(cls) + 1
-
-        return cls(next_value)
-
-
-class DiskMapEntryType(_CyclicalEnum):
-    """Enum representing the entry types in a disk-map"""
-
-    FILE: int = auto()
-    SPACE: int = auto()
+from aoc.counters import KIND_ITEMS, Counter
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.reader import FILENAME_INPUT, open_input
 
 
 class Direction(Enum):
@@ -56,25 +30,34 @@ class Direction(Enum):
     RTL: int = auto()
 
 
-@dataclass
+# Blocks (and fragments) are plain, slotted classes, rather than dataclasses, as
+# importing `dataclasses` would otherwise dominate the cost of importing this day
 class Block:
     """Base block class"""
 
+    __slots__ = ()
+
 
-@dataclass
 class Space(Block):
     """Block representing 'free space'"""
 
+    __slots__ = ()
+
 
-@dataclass
 class File(Block):
     """Block representing a file with the given id"""
 
+    __slots__ = ("id",)
+
     id: int
 
+    def __init__(self, id: int, /) -> None:
+        self.id = id
+
 
 # Constants
 SPACE: Final[Block] = Space()
+PARSER_VERSION: Final[int] = 1
 
 # Typing
 B = TypeVar("B", bound=Block)
@@ -82,26 +65,33 @@ Disk: TypeAlias = Sequence[Block]
 MutableDisk: TypeAlias = MutableSequence[Block]
 
 
-@dataclass
 class Fragment(Generic[B]):
     """Class representing a fragment of blocks"""
 
+    __slots__ = ("index", "block", "size")
+
     index: int
     block: B
     size: int
 
+    def __init__(self, *, index: int, block: B, size: int) -> None:
+        self.index = index
+        self.block = block
+        self.size = size
+
 
-def read_dataset() -> str:
+def read_dataset(path: Path | str = FILENAME_INPUT, /) -> str:
     """Read the entire input dataset into memory (read as a string)"""
 
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         return file.read().strip()
 
 
 def parse_disk_map(disk_map: str, /) -> MutableDisk:
     """Parse a disk-map string into a mutable disk"""
 
-    entry_type: DiskMapEntryType = DiskMapEntryType.first()
+    # Entries alternate between files & free space, starting with a file
+    is_file: bool = True
     file_id: int = 0
 
     disk: MutableDisk = []
@@ -116,15 +106,14 @@ def parse_disk_map(disk_map: str, /) -> MutableDisk:
 
         # Build the appropriate block depending on what disk-map entry-type
         # we're currently at
-        match entry_type:
-            case DiskMapEntryType.FILE:
-                block = File(file_id)
+        if is_file:
+            block = File(file_id)
 
-                # We've just created a file, so increment the file ID ready
-                # for the next file
-                file_id += 1
-            case DiskMapEntryType.SPACE:
-                block = SPACE
+            # We've just created a file, so increment the file ID ready
+            # for the next file
+            file_id += 1
+        else:
+            block = SPACE
 
         # Add all of the blocks created by this disk-map entry to the disk
         for _ in range(size):
@@ -132,11 +121,63 @@ def parse_disk_map(disk_map: str, /) -> MutableDisk:
 
         # Move to the next disk-map entry-type
         # (as there are only two, this toggles between them)
-        entry_type = entry_type.next()
+        is_file = not is_file
 
     return disk
 
 
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Disk:
+    """Read and parse the input dataset into a disk"""
+
+    return parse_disk_map(read_dataset(path))
+
+
+def to_file_ids(disk: Disk, /) -> array:
+    """The file ID of each block of a disk (-1 for free space)"""
+
+    return array("i", (block.id if isinstance(block, File) else -1 for block in disk))
+
+
+def from_file_ids(file_ids: Sequence[int], /) -> MutableDisk:
+    """Rebuild a disk from the file ID of each of its blocks (-1 for free space)"""
+
+    # Every block of a file must be the same object (fragments are found by
+    # identity), and free space sits last so that it's indexed by -1
+    blocks: Sequence[Block] = [
+        *(File(file_id) for file_id in range(max(file_ids, default=-1) + 1)),
+        SPACE,
+    ]
+
+    return list(map(blocks.__getitem__, file_ids))
+
+
+def encode_input(disk: Disk, /) -> bytes:
+    """Encode a disk compactly, as the file ID of each block (-1 for free space)"""
+
+    return to_file_ids(disk).tobytes()
+
+
+def decode_input(buffer: memoryview, /) -> MutableDisk:
+    """Decode a disk encoded by `encode_input`"""
+
+    file_ids: array = array("i")
+    file_ids.frombytes(buffer)
+
+    return from_file_ids(file_ids)
+
+
+def export_input(disk: Disk, /) -> Mapping[str, array]:
+    """Export a disk as a flat buffer of the file ID of each block"""
+
+    return {"file_ids": to_file_ids(disk)}
+
+
+def import_input(views: Mapping[str, Sequence[int]], /) -> MutableDisk:
+    """Import a disk from a view of the buffer exported by `export_input`"""
+
+    return from_file_ids(views["file_ids"])
+
+
 def iter_fragments(
     disk: Disk,
     /,
@@ -337,28 +378,135 @@ def calculate_filesystem_checksum(disk: Disk, /) -> int:
     return checksum
 
 
+def solve_part_1_fragments(disk: Disk, /) -> int:
+    """Filesystem checksum after compacting the disk (fragmenting files)"""
+
+    # Compaction happens in-place, so work on a clone of the disk
+    compacted_disk: MutableDisk = clone_disk(disk)
+    compact_disk(compacted_disk)
+
+    return calculate_filesystem_checksum(compacted_disk)
+
+
+def solve_part_2_fragments(disk: Disk, /) -> int:
+    """Filesystem checksum after compacting the disk (keeping files contiguous)"""
+
+    # Compaction happens in-place, so work on a clone of the disk
+    compacted_disk: MutableDisk = clone_disk(disk)
+    compact_disk(compacted_disk, fragment=False)
+
+    return calculate_filesystem_checksum(compacted_disk)
+
+
+def calculate_file_ids_checksum(file_ids: Sequence[int], /) -> int:
+    """Calculate a filesystem checksum from the file ID of each block"""
+
+    return sum(
+        index * file_id for index, file_id in enumerate(file_ids) if file_id >= 0
+    )
+
+
+def solve_part_1_file_ids(disk: Disk, /) -> int:
+    """Filesystem checksum after compacting the disk (moving file IDs block by block)"""
+
+    # Move the last file block into the first free block, until none are left of it
+    file_ids: array = to_file_ids(disk)
+    left: int = 0
+    right: int = len(file_ids) - 1
+
+    while True:
+        while left < right and file_ids[left] != -1:
+            left += 1
+
+        while left < right and file_ids[right] == -1:
+            right -= 1
+
+        if left >= right:
+            break
+
+        file_ids[left], file_ids[right] = file_ids[right], -1
+
+    return calculate_file_ids_checksum(file_ids)
+
+
+def solve_part_2_file_ids(disk: Disk, /) -> int:
+    """Filesystem checksum after compacting the disk (moving whole files as spans)"""
+
+    # Each file (by decreasing ID) moves to the leftmost span of free space before it
+    # that it fits in. Spans are [start, size], with files' listed by their ID
+    files: MutableSequence[MutableSequence[int]] = []
+    spaces: MutableSequence[MutableSequence[int]] = []
+    start: int = 0
+
+    file_id: int
+    blocks: Iterable[int]
+    for file_id, blocks in groupby(to_file_ids(disk)):
+        size: int = sum(1 for _ in blocks)
+        (files if file_id >= 0 else spaces).append([start, size])
+        start += size
+
+    file: MutableSequence[int]
+    for file in reversed(files):
+        space: MutableSequence[int]
+        for space in spaces:
+            if space[0] >= file[0]:
+                break
+
+            if space[1] >= file[1]:
+                file[0] = space[0]
+                space[0] += file[1]
+                space[1] -= file[1]
+                break
+
+    return sum(
+        file_id * (start + offset)
+        for file_id, (start, size) in enumerate(files)
+        for offset in range(size)
+    )
+
+
+# The compaction of fragments is the reference, the oracle moving file IDs (and spans
+# of them) about directly is checked against. Moving file IDs is faster at every
+# size measured (~2x at 20B, ~3x at 100B, ~10x at 4kB & on the real input), but
+# inputs below 100B (e.g. the puzzle's example) take well under a millisecond
+# either way, so stay on the reference
+ENGINES: Final[EngineRegistry] = EngineRegistry(
+    Engine(
+        ENGINE_REFERENCE,
+        solve_part_1_fragments,
+        solve_part_2_fragments,
+        min_size=None,
+    ),
+    Engine("file-ids", solve_part_1_file_ids, solve_part_2_file_ids, min_size=100),
+)
+
+# Run on its own (rather than by the runner), each part uses the default engine
+solve_part_1: Final[Callable[[Disk], int]] = ENGINES.default.solve_part_1
+solve_part_2: Final[Callable[[Disk], int]] = ENGINES.default.solve_part_2
+
+# Scans of the disk for fragments (one for files, then one per file for space), and
+# fragments scanned in all, so fragments scanned per file is roughly their ratio
+COUNTERS: Final[Sequence[Counter]] = (
+    Counter("fragment_scans", "iter_fragments"),
+    Counter("fragments_scanned", "iter_fragments", KIND_ITEMS),
+)
+
+
 def main() -> None:
     """Solution for AoC 2024, Day 9, Parts 1 & 2"""
 
-    dataset: str = read_dataset()
-
-    disk_1: MutableDisk = parse_disk_map(dataset)
-    disk_2: MutableDisk = clone_disk(disk_1)
+    disk: Disk = read_input()
 
     # --- Part One ---
 
-    compact_disk(disk_1)
-
-    part_1: int = calculate_filesystem_checksum(disk_1)
+    part_1: int = solve_part_1(disk)
 
     print("Part 1:", part_1)
     assert part_1 == 6435922584968
 
     # --- Part Two ---
 
-    compact_disk(disk_2, fragment=False)
-
-    checksum_part_2: int = calculate_filesystem_checksum(disk_2)
+    checksum_part_2: int = solve_part_2(disk)
 
     print("Part 2:", checksum_part_2)
     assert checksum_part_2 == 6469636832766
@@ -0,0 +1,34 @@
+"""Input generator for Day 9: Disk Fragmenter"""
+
+from random import Random
+from typing import Final, MutableSequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 19999  # Length of the disk map
+
+CHUNK_SIZE: Final[int] = 1 << 16
+
+
+def generate(file: TextIO, /, *, size: int, random: Random) -> None:
+    """
+    Write a disk map of `size` digits
+
+    The map alternates between files (sized 1-9) and free space (sized 0-9), and
+    always ends with a file, so `size` is rounded up to the nearest odd number.
+    """
+
+    remaining: int = size + 1 - size % 2
+    is_file: bool = True
+
+    while remaining:
+        chunk_size: int = min(remaining, CHUNK_SIZE)
+        chunk: MutableSequence[str] = []
+
+        _: int
+        for _ in range(chunk_size):
+            chunk.append(str(random.randint(1, 9) if is_file else random.randint(0, 9)))
+            is_file = not is_file
+
+        file.write("".join(chunk))
+        remaining -= chunk_size
+
+    file.write("\n")
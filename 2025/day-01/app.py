@@ -1,11 +1,18 @@
 """--- Day 1: Secret Entrance ---"""
 
+import functools
+import itertools
+import operator
 from dataclasses import dataclass
 from enum import Enum
-from typing import Final, Iterable
+from pathlib import Path
+from typing import Final, Iterable, MutableSequence, Sequence, Tuple
+
+from aoc.reader import FILENAME_INPUT, open_input
 
 DIAL_MAX: Final[int] = 99
 DIAL_START: Final[int] = 50
+DIAL_SIZE: Final[int] = DIAL_MAX + 1
 
 
 class Direction(str, Enum):
@@ -50,9 +57,9 @@ def parse_rotation(rotation: str, /) -> Rotation:
     )
 
 
-def read_input() -> Iterable[Rotation]:
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Iterable[Rotation]:
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         line: str
         for line in file:
             yield parse_rotation(line)
@@ -70,12 +77,12 @@ def stream_rotation(position: int, rotation: Rotation) -> Iterable[int]:
         yield position
 
 
-def solve_part_1() -> int:
+def solve_part_1(path: Path | str = FILENAME_INPUT, /) -> int:
     position: int = DIAL_START
     zeroth_position_counter: int = 0
 
     rotation: Rotation
-    for rotation in read_input():
+    for rotation in read_input(path):
         position = apply_rotation(position, rotation)
 
         if position == 0:
@@ -84,12 +91,12 @@ def solve_part_1() -> int:
     return zeroth_position_counter
 
 
-def solve_part_2() -> int:
+def solve_part_2(path: Path | str = FILENAME_INPUT, /) -> int:
     position: int = DIAL_START
     zeroth_position_counter: int = 0
 
     rotation: Rotation
-    for rotation in read_input():
+    for rotation in read_input(path):
         next_position: int
         for next_position in stream_rotation(position, rotation):
             if next_position == 0:
@@ -100,6 +107,121 @@ def solve_part_2() -> int:
     return zeroth_position_counter
 
 
+def solve_parts(path: Path | str = FILENAME_INPUT, /) -> Tuple[int, int]:
+    # Both parts in a single pass over the input: the dial ends up in the same
+    # place either way, part 1 just only counts where each rotation lands
+    position: int = DIAL_START
+    zeroth_position_counter_part_1: int = 0
+    zeroth_position_counter_part_2: int = 0
+
+    rotation: Rotation
+    for rotation in read_input(path):
+        next_position: int
+        for next_position in stream_rotation(position, rotation):
+            if next_position == 0:
+                zeroth_position_counter_part_2 += 1
+
+        position = next_position
+
+        if position == 0:
+            zeroth_position_counter_part_1 += 1
+
+    return (zeroth_position_counter_part_1, zeroth_position_counter_part_2)
+
+
+# Where the dial starts isn't known until every rotation before it has been made, so
+# to split the rotations up (see `aoc.mapreduce`), each chunk of them is summarised
+# for *every* position the dial could start in
+@dataclass(frozen=True)
+class DialSummary:
+    # Where the dial ends up, relative to where it started
+    offset: int
+    # Zeroes counted (for each part), by the position the dial started in
+    zeroes_part_1: Sequence[int]
+    zeroes_part_2: Sequence[int]
+
+    def __add__(self, rhs: "DialSummary", /) -> "DialSummary":
+        # Summaries of consecutive chunks compose: the second chunk starts wherever
+        # the first left the dial
+        shifted: Sequence[int] = [
+            (start + self.offset) % DIAL_SIZE for start in range(DIAL_SIZE)
+        ]
+
+        return DialSummary(
+            offset=(self.offset + rhs.offset) % DIAL_SIZE,
+            zeroes_part_1=[
+                zeroes + rhs.zeroes_part_1[next_start]
+                for zeroes, next_start in zip(self.zeroes_part_1, shifted)
+            ],
+            zeroes_part_2=[
+                zeroes + rhs.zeroes_part_2[next_start]
+                for zeroes, next_start in zip(self.zeroes_part_2, shifted)
+            ],
+        )
+
+
+def summarise_rotations(rotations: Iterable[Rotation], /) -> DialSummary:
+    offset: int = 0
+    # How many rotations land on each offset (from the start)
+    landings: MutableSequence[int] = [0] * DIAL_SIZE
+    # Every full lap passes zero, whatever the start...
+    laps: int = 0
+    # ... but whether the rest of a rotation does depends on it. Those starts are a
+    # (wrapping) range, so they're marked in a difference array, summed up later
+    passes: MutableSequence[int] = [0] * (DIAL_SIZE + 1)
+
+    rotation: Rotation
+    for rotation in rotations:
+        rotation_laps: int
+        remainder: int
+        rotation_laps, remainder = divmod(rotation.distance, DIAL_SIZE)
+        laps += rotation_laps
+
+        if remainder:
+            # The (remainder of the) rotation passes zero from positions 1 to
+            # `remainder` turning left, or the last `remainder` positions turning right
+            first: int = 1 if rotation.direction is Direction.LEFT else -remainder
+            mark_starts(passes, (first - offset) % DIAL_SIZE, remainder)
+
+        multiplier: int = -1 if rotation.direction is Direction.LEFT else 1
+        offset = (offset + multiplier * rotation.distance) % DIAL_SIZE
+        landings[offset] += 1
+
+    # Landing on zero from a start means landing on an offset of minus the start
+    zeroes_part_1: Sequence[int] = [
+        landings[-start % DIAL_SIZE] for start in range(DIAL_SIZE)
+    ]
+    zeroes_part_2: Sequence[int] = [
+        laps + passed for passed in itertools.accumulate(passes[:DIAL_SIZE])
+    ]
+
+    return DialSummary(offset, zeroes_part_1, zeroes_part_2)
+
+
+def mark_starts(passes: MutableSequence[int], first: int, count: int, /) -> None:
+    # Mark `count` starts, from `first`, wrapping back around to 0 if need be
+    end: int = first + count
+
+    passes[first] += 1
+
+    if end <= DIAL_SIZE:
+        passes[end] -= 1
+    else:
+        passes[DIAL_SIZE] -= 1
+        passes[0] += 1
+        passes[end - DIAL_SIZE] -= 1
+
+
+def solve_chunk(lines: Iterable[str], /) -> DialSummary:
+    return summarise_rotations(map(parse_rotation, lines))
+
+
+def combine_chunks(summaries: Sequence[DialSummary], /) -> Tuple[int, int]:
+    summary: DialSummary = functools.reduce(operator.add, summaries)
+
+    return (summary.zeroes_part_1[DIAL_START], summary.zeroes_part_2[DIAL_START])
+
+
 def main() -> None:
     ### Part 1 ###
     part_1: int = solve_part_1()
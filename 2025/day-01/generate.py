@@ -0,0 +1,16 @@
+"""--- Day 1: Secret Entrance --- (input generator)"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 4500  # Rotations
+
+DISTANCE_MAX: Final[int] = 999
+
+
+def generate(file: TextIO, /, *, size: int, random: Random) -> None:
+    """Write `size` rotations, each left or right by 1-999 clicks"""
+
+    _: int
+    for _ in range(size):
+        file.write(f"{random.choice('LR')}{random.randint(1, DISTANCE_MAX)}\n")
@@ -1,28 +1,20 @@
 """--- Day 2: Gift Shop ---"""
 
-import functools
-import itertools
-import math
-from collections.abc import Iterable, Iterator
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator, MutableSequence, MutableSet
 from enum import Enum, auto
-from typing import Collection, Final, Sequence
+from pathlib import Path
+from typing import Callable, Collection, Final, Tuple
+
+from aoc.chunks import sum_chunks
+from aoc.digits import int_len, int_repeat, pow10
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.intervals import Intervals
+from aoc.reader import FILENAME_INPUT, open_input
 
 ID_SEP: Final[str] = "-"
 RANGE_SEPS: Collection[str] = {",", "\n"}
 
 
-# A tuple would work too... but memory isn't going to use itself
-@dataclass
-class Range(Iterable):
-    first_id: int
-    last_id: int
-
-    def __iter__(self) -> Iterator[int]:
-        # First ID and Last ID *inclusive*
-        return iter(range(self.first_id, self.last_id + 1))
-
-
 # I realise you could flip a boolean flag instead... but I like enums, sue me :shrug:
 # And besides, what if there were three states? or, heaven forbid, four states??
 # Ok, fair enough, we know there's only two.
@@ -32,11 +24,11 @@ class State(Enum):
     LAST_ID = auto()
 
 
-def read_input() -> Iterable[Range]:
+def read_ranges(path: Path | str = FILENAME_INPUT, /) -> Iterator[Tuple[int, int]]:
     # Big nested functions are the best right?
 
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         state: State | None = None
         first_id: str
         last_id: str
@@ -64,7 +56,7 @@ def read_input() -> Iterable[Range]:
                 case State.LAST_ID:
                     if character in RANGE_SEPS:
                         # Validation? Never heard of it.
-                        yield Range(int(first_id), int(last_id))
+                        yield (int(first_id), int(last_id))
 
                         # Reset the state
                         state = None
@@ -78,120 +70,167 @@ def read_input() -> Iterable[Range]:
                 break
 
 
-def int_len(integer: int, /) -> int:
-    # Maths refutes the existence of `0`
-    if integer == 0:
-        return 1
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Intervals:
+    # First IDs & last IDs are both *inclusive*. And no, they're not merged: should
+    # two ranges overlap, whatever's in both is counted twice, once per range
+    first_ids: MutableSequence[int] = []
+    last_ids: MutableSequence[int] = []
+
+    first_id: int
+    last_id: int
+    for first_id, last_id in read_ranges(path):
+        first_ids.append(first_id)
+        last_ids.append(last_id)
+
+    return Intervals.from_inclusive(first_ids, last_ids)
+
+
+def is_invalid_id(id_: int, /) -> bool:
+    # A sequence repeated twice is the same digits either half
+    digits: str = str(id_)
+    half_len: int = len(digits) // 2
+
+    return len(digits) % 2 == 0 and digits[:half_len] == digits[half_len:]
+
 
-    # Pick that log up off the floor! Do you live in a barn!?
-    return math.floor(math.log10(integer) + 1)
+def is_invalid_id_part_2(id_: int, /) -> bool:
+    # A sequence repeated any number of times is found within two copies of itself
+    # (other than at either end), as a rotation by the sequence's length
+    digits: str = str(id_)
 
+    return digits in (digits + digits)[1:-1]
 
-def int_split(integer: int, /) -> Sequence[int]:
-    # I could've modelled the IDs as strings, but where's the fun in that.
-    return tuple(
-        (integer // (10**index)) % 10 for index in range(int_len(integer) - 1, -1, -1)
+
+def solve_part_1_reference(ranges: Intervals, /) -> int:
+    # Every ID, one by one
+    return sum(
+        id_ for start, end in ranges for id_ in range(start, end) if is_invalid_id(id_)
     )
 
 
-def int_join(a: int, b: int, /) -> int:
-    # So engrossed in whether we could, we forgot to question whether we should.
-    # But *could* is enough reason for me lol
-    return a * 10 ** int_len(b) + b
+def solve_part_2_reference(ranges: Intervals, /) -> int:
+    return sum(
+        id_
+        for start, end in ranges
+        for id_ in range(start, end)
+        if is_invalid_id_part_2(id_)
+    )
 
 
-def int_join_all(integers: Sequence[int], /) -> int:
-    # I wrote the program, so I know this never happens... I just wouldn't be able to sleep
-    # at night otherwise.
-    if len(integers) == 0:
-        raise ValueError("No integers to join")
+# Rather than checking every ID, the arithmetic engine only enumerates the invalid
+# ones: IDs made of a repeated sequence are multiples of a repunit, so those within
+# a range are an arithmetic progression, summed without visiting the IDs in between
+def find_repeated_ids(start: int, end: int, id_len: int, sequence_len: int, /) -> range:
+    # Every ID of `id_len` digits in [start, end) that's a `sequence_len` digit
+    # sequence, repeated. The multiplier is a repunit in base 10**sequence_len, e.g.
+    # 123123 is 123 * 1001, so (6 digit, 3 digit sequence) IDs are all multiples of
+    # 1001, by a sequence of exactly `sequence_len` digits (100 to 999)
+    multiplier: int = int_repeat(1, id_len // sequence_len, sequence_len)
 
-    return functools.reduce(int_join, integers)
+    first_sequence: int = max(pow10(sequence_len - 1), -(-start // multiplier))
+    stop_sequence: int = min(pow10(sequence_len), -(-end // multiplier))
 
+    return range(first_sequence * multiplier, stop_sequence * multiplier, multiplier)
 
-def validate_id(id_: int, /) -> bool:
-    # If its got an odd number of digits, then you can't have a sequence repeated twice duh
-    if int_len(id_) % 2 != 0:
-        return True
 
-    digits: Sequence[int] = int_split(id_)
-    half_len: int = len(digits) // 2
-    first_half: int = int_join_all(digits[:half_len])
-    last_half: int = int_join_all(digits[half_len:])
+def find_id_lens(start: int, end: int, /) -> range:
+    # Ranges can span IDs of differing lengths, e.g. 95-115
+    return range(int_len(start), int_len(end - 1) + 1)
 
-    # Welp, that looks like an invalid ID to me.
-    if first_half == last_half:
-        return False
 
-    # If it wasn't invalid, then by the laws of deduction and reasoning... it must be valid.
-    # Don't you break out the word "quantum" on me. Life's too short to play that game
-    return True
+def sum_ids(ids: range, /) -> int:
+    # The sum of an arithmetic progression: the number of IDs, times the mean of the
+    # first and last (their sum's halved last, as it's only even once multiplied)
+    return len(ids) * (ids[0] + ids[-1]) // 2 if ids else 0
 
 
-def validate_id_part_2(id_: int, /) -> bool:
-    digits: Sequence[int] = int_split(id_)
+def sum_invalid_ids(start: int, end: int, /) -> int:
+    # Part 1: invalid IDs are a sequence repeated exactly twice, so must have an even
+    # number of digits (and each is only made one way, so no double counting)
+    return sum(
+        sum_ids(find_repeated_ids(start, end, id_len, id_len // 2))
+        for id_len in find_id_lens(start, end)
+        if id_len % 2 == 0
+    )
 
-    max_sequence_length: int = len(digits) // 2
 
-    sequence_length: int
-    for sequence_length in range(1, max_sequence_length + 1):
-        sequence_digits: Sequence[int] = digits[:sequence_length]
-        sequence: int = int_join_all(sequence_digits)
+def sum_invalid_ids_part_2(start: int, end: int, /) -> int:
+    # Part 2: a sequence repeated any number of times. Some IDs can be made more than
+    # one way though (e.g. 222222 is 2 * 6, 22 * 3 and 222 * 2), so dedupe them
+    invalid_ids: MutableSet[int] = set()
 
-        # Ok where has `itertools.batched` been my whole life. I'm feeling butterflies
-        batch_digits: Sequence[int]
-        for batch_digits in itertools.batched(digits, sequence_length):
-            batch: int = int_join_all(batch_digits)
+    id_len: int
+    for id_len in find_id_lens(start, end):
+        sequence_len: int
+        for sequence_len in range(1, id_len // 2 + 1):
+            # A sequence can only be repeated (whole) if it fits a whole number of times
+            if id_len % sequence_len == 0:
+                invalid_ids.update(find_repeated_ids(start, end, id_len, sequence_len))
+
+    return sum(invalid_ids)
 
-            # Why check all of them? Something something fail fast
-            if sequence != batch:
-                break
-        else:
-            return False
 
-    return True
+def solve_part_1_arithmetic(ranges: Intervals, /) -> int:
+    return sum(sum_invalid_ids(start, end) for start, end in ranges)
 
 
-def solve_part_1() -> int:
-    invalid_ids_sum: int = 0
+def solve_part_2_arithmetic(ranges: Intervals, /) -> int:
+    return sum(sum_invalid_ids_part_2(start, end) for start, end in ranges)
 
-    # This algorithm is NOT efficient - if I can be asked, I'll come back and reimplement it.
-    # You should only need to check values that are known to be invalid within the range, rather
-    # than checking everything.
-    # And yes, I realise I could do this all in one big sum(...), but can != should
-    range_: Range
-    for range_ in read_input():
-        id_: int
-        for id_ in range_:
-            if not validate_id(id_):
-                invalid_ids_sum += id_
 
-    return invalid_ids_sum
+def solve_parts(ranges: Intervals, /) -> Tuple[int, int]:
+    invalid_ids_sum_part_1: int = 0
+    invalid_ids_sum_part_2: int = 0
 
+    # One pass over the ranges, feeding both sums
+    start: int
+    end: int
+    for start, end in ranges:
+        invalid_ids_sum_part_1 += sum_invalid_ids(start, end)
+        invalid_ids_sum_part_2 += sum_invalid_ids_part_2(start, end)
 
-def solve_part_2() -> int:
-    invalid_ids_sum: int = 0
+    return (invalid_ids_sum_part_1, invalid_ids_sum_part_2)
 
-    # This logic is identical to that in `solve_part_1` just with a different validation function.
-    # I probably should've followed DRY. I probably should've followed DRY.
-    range_: Range
-    for range_ in read_input():
-        id_: int
-        for id_ in range_:
-            if not validate_id_part_2(id_):
-                invalid_ids_sum += id_
 
-    return invalid_ids_sum
+# Checking every ID, one by one, is the reference, the oracle the arithmetic is
+# checked against, as it tests each ID against the puzzle's definition directly.
+# It's ~2,000x slower on the real input (~2s, against ~1ms), so only run by name
+ENGINES: Final[EngineRegistry] = EngineRegistry(
+    Engine(
+        ENGINE_REFERENCE,
+        solve_part_1_reference,
+        solve_part_2_reference,
+        min_size=None,
+    ),
+    Engine(
+        "arithmetic",
+        solve_part_1_arithmetic,
+        solve_part_2_arithmetic,
+        solve_parts=solve_parts,
+    ),
+)
+
+# Run on its own (rather than by the runner), each part uses the default engine
+solve_part_1: Final[Callable[[Intervals], int]] = ENGINES.default.solve_part_1
+solve_part_2: Final[Callable[[Intervals], int]] = ENGINES.default.solve_part_2
+
+# Ranges are independent of one another (overlaps are counted twice anyway), so any
+# shard of them can be solved on its own, and the sums just add up (see
+# `aoc.mapreduce`)
+solve_shard = solve_parts
+combine_chunks = sum_chunks
 
 
 def main() -> None:
+    ranges: Intervals = read_input()
+
     ### Part 1 ###
-    part_1: int = solve_part_1()
+    part_1: int = solve_part_1(ranges)
     print("Part 1:", part_1)
     assert part_1 == 18595663903
 
     ### Part 2 ###
-    part_2: int = solve_part_2()
+    part_2: int = solve_part_2(ranges)
     print("Part 2:", part_2)
     assert part_2 == 19058204438
 
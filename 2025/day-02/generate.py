@@ -0,0 +1,27 @@
+"""--- Day 2: Gift Shop --- (input generator)"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 30  # ID ranges
+
+MAX_DIGITS: Final[int] = 10
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, max_range_length: int = 100_000
+) -> None:
+    """Write `size` comma-separated ID ranges, of up to `max_range_length` IDs each"""
+
+    index: int
+    for index in range(size):
+        first_id: int = random.randint(1, 10 ** random.randint(1, MAX_DIGITS) - 1)
+        last_id: int = first_id + random.randrange(max_range_length)
+
+        if index:
+            file.write(",")
+
+        file.write(f"{first_id}-{last_id}")
+
+    # The parser relies on every range (even the last) being terminated
+    file.write("\n")
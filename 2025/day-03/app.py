@@ -1,8 +1,11 @@
 """--- Day 3: Lobby ---"""
 
-import functools
-import math
-from typing import Final, Iterable, NamedTuple, Sequence, TypeAlias
+from pathlib import Path
+from typing import Final, Iterable, NamedTuple, Sequence, Tuple, TypeAlias
+
+from aoc.chunks import sum_chunks
+from aoc.digits import from_digits
+from aoc.reader import FILENAME_INPUT, open_input
 
 Battery: TypeAlias = int  # joltage
 Bank: TypeAlias = Sequence[Battery]
@@ -19,29 +22,14 @@ def parse_bank(bank: str, /) -> Bank:
     return tuple(int(battery) for battery in bank)
 
 
-def read_input() -> Iterable[Bank]:
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Iterable[Bank]:
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         line: str
         for line in file:
             yield parse_bank(line.strip())
 
 
-def int_len(integer: int, /) -> int:
-    if integer == 0:
-        return 1
-
-    return math.floor(math.log10(integer) + 1)
-
-
-def int_join(a: int, b: int, /) -> int:
-    return a * 10 ** int_len(b) + b
-
-
-def int_join_all(integers: Iterable[int], /) -> int:
-    return functools.reduce(int_join, integers)
-
-
 def find_first_battery_with_highest_joltage(bank: Bank, /) -> IndexedBattery:
     highest_index: int = 0
     highest_battery: Battery = bank[0]
@@ -87,17 +75,44 @@ def find_batteries_to_turn_on(bank: Bank, count: int) -> Iterable[IndexedBattery
 
 
 def calc_max_bank_joltage(bank: Bank, count: int) -> int:
-    return int_join_all(
+    # Batteries are single digits, so joining them is building an integer from them
+    return from_digits(
         battery.battery for battery in find_batteries_to_turn_on(bank, count)
     )
 
 
-def solve_part_1() -> int:
-    return sum(calc_max_bank_joltage(bank, 2) for bank in read_input())
+def solve_part_1(path: Path | str = FILENAME_INPUT, /) -> int:
+    return sum(calc_max_bank_joltage(bank, 2) for bank in read_input(path))
+
+
+def solve_part_2(path: Path | str = FILENAME_INPUT, /) -> int:
+    return sum(calc_max_bank_joltage(bank, 12) for bank in read_input(path))
+
+
+def solve_chunk(lines: Iterable[str], /) -> Tuple[int, int]:
+    # Banks are independent of one another, so any chunk of lines can be solved on
+    # its own (see `aoc.mapreduce`)
+    part_1: int = 0
+    part_2: int = 0
+
+    line: str
+    for line in lines:
+        bank: Bank = parse_bank(line.strip())
+        part_1 += calc_max_bank_joltage(bank, 2)
+        part_2 += calc_max_bank_joltage(bank, 12)
+
+    return (part_1, part_2)
+
+
+def solve_parts(path: Path | str = FILENAME_INPUT, /) -> Tuple[int, int]:
+    # Both parts in a single pass over the input, which is just one (big) chunk
+    file: Iterable[str]
+    with open_input(path, text=True) as file:
+        return solve_chunk(file)
 
 
-def solve_part_2() -> int:
-    return sum(calc_max_bank_joltage(bank, 12) for bank in read_input())
+# The joltages of every chunk just add up
+combine_chunks = sum_chunks
 
 
 def main() -> None:
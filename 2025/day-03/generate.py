@@ -0,0 +1,22 @@
+"""--- Day 3: Lobby --- (input generator)"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 200  # Banks
+
+JOLTAGES: Final[str] = "123456789"
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, batteries: int = 100
+) -> None:
+    """Write `size` banks of `batteries` batteries each"""
+
+    # Lower joltages are far more common than higher ones
+    weights: range = range(len(JOLTAGES), 0, -1)
+
+    _: int
+    for _ in range(size):
+        file.write("".join(random.choices(JOLTAGES, weights=weights, k=batteries)))
+        file.write("\n")
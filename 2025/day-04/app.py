@@ -1,130 +1,80 @@
 """--- Day 4: Printing Department ---"""
 
-from enum import Enum
-from typing import Collection, Iterable, Iterator, MutableSequence, NamedTuple, Sequence
+from array import array
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Collection, Final, Iterable, Mapping, Sequence
 
-MAX_ADJACENT_ROLLS: int = 3
-
-
-class CellType(str, Enum):
-    EMPTY = "."
-    PAPER_ROLL = "@"
-
-
-class Coord(NamedTuple):
-    x: int
-    y: int
-
-
-class Cell[T](NamedTuple):
-    coord: Coord
-    value: T
-
-
-class Grid[T]:
-    _data: MutableSequence[MutableSequence[T]]
+from aoc.counters import Counter
+from aoc.grid import Grid, read_grid
+from aoc.reader import FILENAME_INPUT
 
-    def __init__(self, data: MutableSequence[MutableSequence[T]], /) -> None:
-        self._data = data
-
-    def __getitem__(self, index: int, /) -> MutableSequence[T]:
-        return self._data[index]
-
-    def __iter__(self) -> Iterator[Cell[T]]:
-        y: int
-        for y in range(self.size_y):
-            x: int
-            for x in range(self.size_x):
-                value: T = self.get(x, y)
-
-                yield Cell(Coord(x, y), value)
-
-    def get(self, x: int, y: int) -> T:
-        return self[y][x]
-
-    def set(self, x: int, y: int, value: T) -> None:
-        self[y][x] = value
-
-    def contains(self, x: int, y: int) -> bool:
-        return 0 <= x < self.size_x and 0 <= y < self.size_y
-
-    def get_surrounding(self, x: int, y: int) -> Sequence[Cell]:
-        neighbours: MutableSequence[Cell] = []
+MAX_ADJACENT_ROLLS: int = 3
 
-        neighbour_x: int
-        for neighbour_x in range(x - 1, x + 2, 1):
-            neighbour_y: int
-            for neighbour_y in range(y - 1, y + 2, 1):
-                if not self.contains(neighbour_x, neighbour_y) or (
-                    neighbour_x == x and neighbour_y == y
-                ):
-                    continue
+# Every search for accessible rolls is a full pass over the grid
+COUNTERS: Final[Sequence[Counter]] = (
+    Counter("grid_passes", "find_accessible_rolls"),
+)
 
-                cell: Cell[T] = Cell(
-                    Coord(neighbour_x, neighbour_y),
-                    self.get(neighbour_x, neighbour_y),
-                )
 
-                neighbours.append(cell)
+class CellType(IntEnum):
+    EMPTY = ord(".")
+    PAPER_ROLL = ord("@")
 
-        return neighbours
 
-    @property
-    def size_x(self) -> int:
-        return len(self._data[0]) if self._data else 0
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Grid:
+    return read_grid(path)
 
-    @property
-    def size_y(self) -> int:
-        return len(self._data)
 
+def export_input(grid: Grid, /) -> Mapping[str, Any]:
+    return {"cells": grid.data, "shape": array("q", (grid.width, grid.height))}
 
-def read_input() -> Grid[str]:
-    file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
-        rows: MutableSequence[MutableSequence[str]] = [
-            list(line.strip()) for line in file
-        ]
 
-        return Grid(rows)
+def import_input(views: Mapping[str, Sequence[int]], /) -> Grid:
+    width: int
+    height: int
+    width, height = views["shape"]
 
+    # Part 2 removes rolls from the grid as it goes, so the cells are copied rather
+    # than shared (which is still far cheaper than parsing them again)
+    return Grid(bytearray(views["cells"]), width, height)
 
-def find_accessible_rolls(grid: Grid[str], /) -> Iterable[Coord]:
-    coord: Coord
-    value: str
-    for coord, value in grid:
-        cell_type: CellType = CellType(value)
 
-        if cell_type != CellType.PAPER_ROLL:
-            continue
+def find_accessible_rolls(grid: Grid, /) -> Iterable[int]:
+    # Work on the grid's flat data directly: each roll's neighbours are at fixed
+    # offsets from it (and the grid's border is never a roll)
+    data: bytearray = grid.data
+    offsets: Collection[int] = grid.offsets_8
 
+    index: int
+    for index in grid.find_all(CellType.PAPER_ROLL):
         total_adjacent_rolls: int = sum(
-            CellType(value) == CellType.PAPER_ROLL
-            for _, value in grid.get_surrounding(*coord)
+            data[index + offset] == CellType.PAPER_ROLL for offset in offsets
         )
 
         if total_adjacent_rolls <= MAX_ADJACENT_ROLLS:
-            yield coord
+            yield index
 
 
-def solve_part_1(grid: Grid[str], /) -> int:
+def solve_part_1(grid: Grid, /) -> int:
     return sum(1 for _ in find_accessible_rolls(grid))
 
 
-def solve_part_2(grid: Grid[str], /) -> int:
+def solve_part_2(grid: Grid, /) -> int:
     total_rolls_removed: int = 0
 
-    accessible_rolls: Collection[Coord]
+    accessible_rolls: Collection[int]
     while accessible_rolls := list(find_accessible_rolls(grid)):
-        coord: Coord
-        for coord in accessible_rolls:
-            grid.set(*coord, CellType.EMPTY)
+        index: int
+        for index in accessible_rolls:
+            grid.data[index] = CellType.EMPTY
             total_rolls_removed += 1
 
     return total_rolls_removed
 
 
 def main() -> None:
-    grid: Grid[str] = read_input()
+    grid: Grid = read_input()
 
     ### Part 1 ###
     part_1: int = solve_part_1(grid)
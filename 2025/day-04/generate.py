@@ -0,0 +1,19 @@
+"""--- Day 4: Printing Department --- (input generator)"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 138  # Width (and height) of the grid
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, density: float = 0.65
+) -> None:
+    """Write a `size` by `size` grid, with paper rolls making up `density` of it"""
+
+    _: int
+    for _ in range(size):
+        file.write(
+            "".join("@" if random.random() < density else "." for _ in range(size))
+        )
+        file.write("\n")
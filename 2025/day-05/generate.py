@@ -0,0 +1,42 @@
+"""--- Day 5: Cafeteria --- (input generator)"""
+
+from random import Random
+from typing import Final, TextIO
+
+DEFAULT_SIZE: Final[int] = 1000  # Available ingredient IDs
+
+ID_MAX: Final[int] = 562_949_953_421_311  # ~2**49, as in the real input
+
+
+def generate(
+    file: TextIO,
+    /,
+    *,
+    size: int,
+    random: Random,
+    ranges: int = 0,
+    max_range_length: int = 0,
+) -> None:
+    """
+    Write fresh ingredient ID ranges, followed by `size` available ingredient IDs
+
+    If `ranges` isn't given, it defaults to a fifth of `size` (as in the real input).
+    Ranges are placed at random, and if `max_range_length` isn't given it shrinks as
+    the number of ranges grows, so that (as in the real input) some ranges overlap
+    but most remain distinct.
+    """
+
+    ranges = ranges or max(1, size // 5)
+    max_range_length = max_range_length or max(1, ID_MAX // ranges)
+
+    _: int
+    for _ in range(ranges):
+        min_: int = random.randint(1, ID_MAX)
+        max_: int = min_ + random.randrange(max_range_length)
+
+        file.write(f"{min_}-{max_}\n")
+
+    file.write("\n")
+
+    for _ in range(size):
+        file.write(f"{random.randint(1, ID_MAX)}\n")
@@ -2,9 +2,19 @@
 
 import functools
 import operator
+import struct
+from array import array
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable, MutableSequence, Protocol, Sequence
+from pathlib import Path
+from typing import Final, Iterable, MutableSequence, Protocol, Sequence
+
+from aoc.reader import FILENAME_INPUT, open_input
+
+# Bump whenever the parsed representation (or its encoding) changes
+PARSER_VERSION: Final[int] = 1
+
+PROBLEM_COUNT: Final[struct.Struct] = struct.Struct("<I")
 
 
 class OperatorFunc(Protocol):
@@ -86,12 +96,71 @@ def parse_input(input_: str, /) -> Iterable[Problem]:
         yield Problem(operator, operands)
 
 
-def read_input() -> Iterable[Problem]:
+def read_input(path: Path | str = FILENAME_INPUT, /) -> Iterable[Problem]:
     file: Iterable[str]
-    with open("input", encoding="utf-8") as file:
+    with open_input(path, text=True) as file:
         return parse_input(file.read())
 
 
+def encode_input(problems: Sequence[Problem], /) -> bytes:
+    # Layout: problem count, a symbol per problem, (operand count, width) per
+    # problem, then every (equal width, space-padded) operand back-to-back
+    symbols: str = "".join(problem.operator.symbol for problem in problems)
+    shapes: array = array("I")
+    operands: MutableSequence[str] = []
+
+    problem: Problem
+    for problem in problems:
+        shapes.append(len(problem.operands))
+        shapes.append(len(problem.operands[0]))
+        operands.extend(problem.operands)
+
+    return b"".join(
+        (
+            PROBLEM_COUNT.pack(len(problems)),
+            symbols.encode("ascii"),
+            shapes.tobytes(),
+            "".join(operands).encode("ascii"),
+        )
+    )
+
+
+def decode_input(buffer: memoryview, /) -> Sequence[Problem]:
+    count: int
+    (count,) = PROBLEM_COUNT.unpack_from(buffer)
+    offset: int = PROBLEM_COUNT.size
+
+    symbols: str = bytes(buffer[offset : offset + count]).decode("ascii")
+    offset += count
+
+    shapes: array = array("I")
+    shapes.frombytes(buffer[offset : offset + 2 * count * shapes.itemsize])
+    offset += 2 * count * shapes.itemsize
+
+    operands: str = bytes(buffer[offset:]).decode("ascii")
+
+    problems: MutableSequence[Problem] = []
+    start: int = 0
+
+    symbol: str
+    operand_count: int
+    width: int
+    for symbol, operand_count, width in zip(symbols, shapes[::2], shapes[1::2]):
+        stop: int = start + operand_count * width
+        indices: range = range(start, stop, width)
+
+        problems.append(
+            Problem(
+                Operator.from_symbol(symbol),
+                [operands[index : index + width] for index in indices],
+            )
+        )
+
+        start = stop
+
+    return problems
+
+
 def solve_problem_part_1(problem: Problem, /) -> int:
     operands: Sequence[int] = [int(operand) for operand in problem.operands]
 
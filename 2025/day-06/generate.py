@@ -0,0 +1,57 @@
+"""--- Day 6: Trash Compactor --- (input generator)"""
+
+from random import Random
+from typing import Final, Sequence, TextIO
+
+DEFAULT_SIZE: Final[int] = 1000  # Problems
+
+SYMBOLS: Final[str] = "+*"
+MAX_DIGITS: Final[int] = 4
+
+
+def generate(
+    file: TextIO, /, *, size: int, random: Random, operands: int = 4
+) -> None:
+    """
+    Write a worksheet of `size` problems, with `operands` operands each
+
+    Problems are laid out in columns, so every line of the worksheet spans every
+    problem. Rather than hold the worksheet in memory, the problems are generated
+    afresh (from the same seed) for each line, and only that line is written.
+    """
+
+    seed: int = random.getrandbits(64)
+
+    line: int
+    for line in range(operands + 1):
+        problems: Random = Random(seed)
+
+        _: int
+        for _ in range(size):
+            # Numbers are ordered by length, so that (when read as columns) there
+            # are never any gaps between the digits of a column.
+            numbers: Sequence[str] = sorted(
+                (
+                    str(problems.randint(1, 10 ** problems.randint(1, MAX_DIGITS) - 1))
+                    for _ in range(operands)
+                ),
+                key=len,
+                reverse=problems.random() < 0.5,
+            )
+            symbol: str = problems.choice(SYMBOLS)
+            left_aligned: bool = problems.random() < 0.5
+            width: int = max(map(len, numbers))
+
+            cell: str
+
+            if line == operands:
+                cell = symbol.ljust(width)
+            elif left_aligned:
+                cell = numbers[line].ljust(width)
+            else:
+                cell = numbers[line].rjust(width)
+
+            file.write(cell)
+            file.write(" ")
+
+        file.write("\n")
@@ -0,0 +1 @@
+"""Tooling for discovering, running and timing the Advent of Code solutions"""
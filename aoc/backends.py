@@ -0,0 +1,65 @@
+"""Pools of workers (processes, or threads) to run work across in parallel"""
+
+import sys
+from types import ModuleType
+from typing import Final, Optional, Sequence
+
+from aoc.lazy import lazy_import
+
+# Only needed once work is run in parallel
+concurrent_futures: ModuleType = lazy_import("concurrent.futures")
+
+# Constants
+BACKEND_PROCESS: Final[str] = "process"
+BACKEND_THREAD: Final[str] = "thread"
+BACKENDS: Final[Sequence[str]] = (BACKEND_PROCESS, BACKEND_THREAD)
+
+
+def is_free_threaded() -> bool:
+    """
+    Whether the GIL is disabled, so threads run Python code in parallel
+
+    Free-threaded builds of CPython (3.13+) can still run with the GIL enabled
+    (e.g. with `PYTHON_GIL=1`, or once an extension requires it), so this is
+    checked at runtime rather than from how the interpreter was built.
+    """
+
+    return not getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def build_name() -> str:
+    """Name of the running interpreter's kind of build, e.g. for reports"""
+
+    return "free-threaded" if is_free_threaded() else "GIL"
+
+
+def resolve_backend(backend: Optional[str] = None, /) -> str:
+    """
+    The backend to use: threads if the GIL is disabled, otherwise processes
+
+    Threads share whatever they work on (e.g. already parsed inputs) rather than
+    having it pickled to them, but only run in parallel without the GIL.
+    """
+
+    if backend is not None:
+        return backend
+
+    return BACKEND_THREAD if is_free_threaded() else BACKEND_PROCESS
+
+
+def make_executor(
+    backend: str, /, *, jobs: int, max_tasks_per_child: Optional[int] = None
+) -> "concurrent_futures.Executor":
+    """
+    A pool of `jobs` workers of the given backend
+
+    Workers are only replaced after `max_tasks_per_child` tasks by processes (as
+    threads can't be isolated from one another anyway).
+    """
+
+    if backend == BACKEND_THREAD:
+        return concurrent_futures.ThreadPoolExecutor(max_workers=jobs)
+
+    return concurrent_futures.ProcessPoolExecutor(
+        max_workers=jobs, max_tasks_per_child=max_tasks_per_child
+    )
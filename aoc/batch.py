@@ -0,0 +1,237 @@
+"""Batch execution of a single day's solution over a directory of many inputs"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import (
+    AbstractSet,
+    Any,
+    Final,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Sequence,
+)
+
+from aoc.backends import make_executor, resolve_backend
+from aoc.discovery import Day
+from aoc.runner import (
+    PARTS,
+    DayResult,
+    Phase,
+    PhaseResult,
+    RunOptions,
+    describe_error,
+    run_day,
+)
+
+# Constants
+PREFETCH: Final[int] = 2  # Inputs queued, beyond those being solved
+BYTES_PER_MEGABYTE: Final[int] = 1_000_000
+
+
+# Exceptions
+class InputsNotFoundError(LookupError):
+    """Exception thrown when a directory of inputs is missing (or empty)"""
+
+
+# Models
+@dataclass(frozen=True)
+class InputResult:
+    """Outcome of executing a day's solution against one of many inputs"""
+
+    path: Path
+    size: int
+    result: DayResult
+
+    @property
+    def parse_time(self) -> Optional[float]:
+        """Wall-clock time spent parsing the input (if parsed separately, and solved)"""
+
+        parse: Optional[PhaseResult] = self.result.get(Phase.PARSE)
+
+        return parse.timing.wall if parse is not None and self.result.ok else None
+
+    @property
+    def solve_time(self) -> Optional[float]:
+        """Wall-clock time spent solving every part (if solved)"""
+
+        if not self.result.ok:
+            return None
+
+        return sum(
+            result.timing.wall
+            for result in self.result.phases
+            if result.phase is not Phase.PARSE
+        )
+
+    def to_json(self) -> Mapping[str, Any]:
+        """A (JSON-serialisable) summary of the result"""
+
+        return {
+            "input": str(self.path),
+            "bytes": self.size,
+            "ok": self.result.ok,
+            "error": self.result.error,
+            **{str(phase): self.result.answer(phase) for phase in PARTS},
+            "parse_s": self.parse_time,
+            "solve_s": self.solve_time,
+            **({"counters": self.result.counters} if self.result.counters else {}),
+        }
+
+
+@dataclass(frozen=True)
+class Throughput:
+    """Aggregate throughput of a batch of inputs"""
+
+    inputs: int
+    failed: int
+    size: int
+    elapsed: float
+
+    @property
+    def inputs_per_second(self) -> float:
+        """Inputs processed (solved or failed) per second"""
+
+        return self.inputs / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def megabytes_per_second(self) -> float:
+        """Megabytes of input processed (solved or failed) per second"""
+
+        return self.size / BYTES_PER_MEGABYTE / self.elapsed if self.elapsed else 0.0
+
+    def to_json(self) -> Mapping[str, Any]:
+        """A (JSON-serialisable) summary of the throughput"""
+
+        return {
+            "inputs": self.inputs,
+            "failed": self.failed,
+            "bytes": self.size,
+            "elapsed_s": self.elapsed,
+            "inputs_per_s": self.inputs_per_second,
+            "mb_per_s": self.megabytes_per_second,
+        }
+
+
+def find_inputs(directory: Path, /) -> Sequence[Path]:
+    """Find every (non-hidden) input file in a directory, in name order"""
+
+    if not directory.is_dir():
+        raise InputsNotFoundError(f"No such directory of inputs: {directory}")
+
+    paths: Sequence[Path] = sorted(
+        path
+        for path in directory.iterdir()
+        if path.is_file() and not path.name.startswith(".")
+    )
+
+    if not paths:
+        raise InputsNotFoundError(f"No inputs found in {directory}")
+
+    return paths
+
+
+def run_input_file(
+    day: Day, path: Path, /, options: RunOptions = RunOptions()
+) -> InputResult:
+    """Execute (and time) every phase of a day's solution against an input file"""
+
+    return InputResult(
+        path=path,
+        size=path.stat().st_size,
+        result=run_day(day, replace(options, input_path=path.resolve())),
+    )
+
+
+def run_inputs(
+    day: Day,
+    paths: Iterable[Path],
+    /,
+    *,
+    jobs: int = 1,
+    options: RunOptions = RunOptions(),
+    backend: Optional[str] = None,
+) -> Iterator[InputResult]:
+    """
+    Execute (and time) a day's solution against each input, across workers
+
+    Workers are processes, or threads on free-threaded builds (unless a backend is
+    given). Workers read each input themselves, so only its path is sent to them,
+    and a few more than there are workers are queued (`jobs + PREFETCH`), so they
+    never wait on the next. Workers are reused between inputs, keeping the solution
+    imported. Results are yielded as they complete, rather than in the order given.
+    """
+
+    backend = resolve_backend(backend)
+    remaining: Iterator[Path] = iter(paths)
+    pending: MutableMapping[Future[InputResult], Path] = {}
+
+    executor: Executor
+    with make_executor(backend, jobs=jobs) as executor:
+        while True:
+            # Top up the queue of inputs, while the workers are busy
+            path: Path
+            for path in remaining:
+                future: Future[InputResult] = executor.submit(
+                    run_input_file, day, path, options
+                )
+                pending[future] = path
+
+                if len(pending) >= jobs + PREFETCH:
+                    break
+
+            if not pending:
+                return
+
+            done: AbstractSet[Future[InputResult]]
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                path = pending.pop(future)
+
+                try:
+                    yield future.result()
+                except Exception as error:
+                    # The worker itself failed (e.g. it died), rather than the solution
+                    yield InputResult(
+                        path=path,
+                        size=path.stat().st_size,
+                        result=DayResult(day, error=describe_error(error)),
+                    )
+
+
+class ThroughputMeter:
+    """Tallies the inputs (and bytes) processed, from when it's created"""
+
+    inputs: int
+    failed: int
+    size: int
+    _started: float
+
+    def __init__(self) -> None:
+        self.inputs = 0
+        self.failed = 0
+        self.size = 0
+        self._started = time.perf_counter()
+
+    def add(self, result: InputResult, /) -> None:
+        """Count an input as processed"""
+
+        self.inputs += 1
+        self.failed += not result.result.ok
+        self.size += result.size
+
+    @property
+    def throughput(self) -> Throughput:
+        """Throughput so far"""
+
+        return Throughput(
+            inputs=self.inputs,
+            failed=self.failed,
+            size=self.size,
+            elapsed=time.perf_counter() - self._started,
+        )
@@ -0,0 +1,376 @@
+"""Repeatable benchmarking of each phase of a solution, with JSON baselines"""
+
+import contextlib
+import gc
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Any,
+    Final,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from aoc.cache import ParseCache
+from aoc.discovery import Day, load_module
+from aoc.lazy import lazy_import
+from aoc.reader import FILENAME_INPUT
+from aoc.report import format_seconds, format_table
+from aoc.runner import Phase, PhaseResult, Solution, describe_error, run_phases
+
+# Only needed once benchmarks are run (or their baselines read & written)
+json: ModuleType = lazy_import("json")
+platform: ModuleType = lazy_import("platform")
+statistics: ModuleType = lazy_import("statistics")
+
+# Constants
+BASELINE_VERSION: Final[int] = 2
+# Baselines of earlier versions are still read, though they lack some fields (e.g.
+# the engine each day was benchmarked with)
+BASELINE_VERSIONS: Final[Sequence[int]] = (1, BASELINE_VERSION)
+METRICS: Final[Sequence[str]] = ("min", "median", "p95")
+DEFAULT_WARMUP: Final[int] = 1
+DEFAULT_REPEAT: Final[int] = 5
+DEFAULT_THRESHOLD: Final[float] = 0.1
+DEFAULT_METRIC: Final[str] = "median"
+
+
+# Models
+@dataclass(frozen=True)
+class Statistics:
+    """Summary statistics of a set of timing samples, in seconds"""
+
+    min: float
+    median: float
+    p95: float
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float], /) -> "Statistics":
+        """Summarise a (non-empty) set of timing samples"""
+
+        p95: float = (
+            statistics.quantiles(samples, n=20, method="inclusive")[-1]
+            if len(samples) > 1
+            else samples[0]
+        )
+
+        return cls(min=min(samples), median=statistics.median(samples), p95=p95)
+
+    def get(self, metric: str, /) -> float:
+        """Get a statistic by name (one of `METRICS`)"""
+
+        return getattr(self, metric)
+
+
+@dataclass
+class PhaseBenchmark:
+    """Timing samples (wall-clock, in seconds) for a single phase"""
+
+    phase: Phase
+    samples: MutableSequence[float] = field(default_factory=list)
+
+    @property
+    def statistics(self) -> Statistics:
+        """Summary statistics of the samples"""
+
+        return Statistics.from_samples(self.samples)
+
+
+@dataclass
+class DayBenchmark:
+    """Timing samples for every phase of a day's solution"""
+
+    day: Day
+    phases: MutableMapping[Phase, PhaseBenchmark] = field(default_factory=dict)
+    error: Optional[str] = None
+    engine: Optional[str] = None  # Of days with several (see `aoc.engines`)
+
+    @property
+    def key(self) -> str:
+        """Key identifying this day within a baseline, e.g. `2024/5`"""
+
+        return f"{self.day.year}/{self.day.day}"
+
+
+@dataclass(frozen=True)
+class BaselineDay:
+    """The statistics of each of a day's phases in a baseline, and its engine"""
+
+    phases: Mapping[Phase, Statistics]
+    engine: Optional[str] = None  # Unknown, in baselines of version 1
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Comparison of a phase's current timing against its baseline timing"""
+
+    key: str
+    phase: Phase
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline, e.g. 0.25 is 25% slower"""
+
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        """Whether the change exceeds the regression threshold"""
+
+        return self.change > self.threshold
+
+
+def benchmark_day(
+    day: Day,
+    /,
+    *,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    directory: Optional[Path] = None,
+    parse_cache: Optional[ParseCache] = None,
+    fused: bool = True,
+    engine: Optional[str] = None,
+) -> DayBenchmark:
+    """
+    Benchmark each phase of a day's solution
+
+    Every iteration re-parses the input, so that parts which mutate their input
+    (e.g. 2025 day-04) are always given a fresh copy. Warmup iterations are
+    executed but not recorded, and garbage is collected between iterations.
+    The input is read from `directory` (by default, the day's own directory), and
+    if a parse cache is given, the parse phase measures loading from it instead.
+    Solutions supporting it are benchmarked solving both parts in a single (fused)
+    pass, unless `fused` is disabled. Days with several engines are benchmarked
+    with the one named, or otherwise the one picked for their input's size.
+    """
+
+    benchmark: DayBenchmark = DayBenchmark(day)
+
+    # Solutions read their input relative to the working directory
+    with contextlib.chdir(directory or day.directory):
+        try:
+            solution: Solution = Solution.from_module(load_module(day)).with_engine(
+                engine, size=os.path.getsize(FILENAME_INPUT)
+            )
+            benchmark.engine = solution.engine
+
+            iteration: int
+            for iteration in range(warmup + repeat):
+                gc.collect()
+
+                result: PhaseResult
+                for result in run_phases(
+                    solution, parse_cache=parse_cache, fused=fused
+                ):
+                    if iteration < warmup:
+                        continue
+
+                    benchmark.phases.setdefault(
+                        result.phase, PhaseBenchmark(result.phase)
+                    ).samples.append(result.timing.wall)
+        except Exception as error:
+            benchmark.error = describe_error(error)
+
+    return benchmark
+
+
+def benchmark_days(
+    days: Iterable[Day],
+    /,
+    *,
+    warmup: int = DEFAULT_WARMUP,
+    repeat: int = DEFAULT_REPEAT,
+    parse_cache: Optional[ParseCache] = None,
+    fused: bool = True,
+    engine: Optional[str] = None,
+) -> Iterable[DayBenchmark]:
+    """Benchmark each day's solution in turn"""
+
+    return (
+        benchmark_day(
+            day,
+            warmup=warmup,
+            repeat=repeat,
+            parse_cache=parse_cache,
+            fused=fused,
+            engine=engine,
+        )
+        for day in days
+    )
+
+
+def to_baseline(
+    benchmarks: Iterable[DayBenchmark], /, *, warmup: int, repeat: int
+) -> Mapping[str, Any]:
+    """Build a (JSON-serialisable) baseline from benchmark results"""
+
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "warmup": warmup,
+        "repeat": repeat,
+        "days": {
+            benchmark.key: {
+                "engine": benchmark.engine,
+                "phases": {
+                    str(phase): {
+                        **vars(phase_benchmark.statistics),
+                        "samples": list(phase_benchmark.samples),
+                    }
+                    for phase, phase_benchmark in benchmark.phases.items()
+                },
+            }
+            for benchmark in benchmarks
+            if benchmark.error is None
+        },
+    }
+
+
+def write_baseline(path: Path, baseline: Mapping[str, Any], /) -> None:
+    """Write a baseline to a JSON file"""
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(baseline, file, indent=2)
+        file.write("\n")
+
+
+def read_baseline(path: Path, /) -> Mapping[str, BaselineDay]:
+    """Read the statistics of each day's phases (and its engine) from a JSON baseline"""
+
+    with open(path, encoding="utf-8") as file:
+        baseline: Mapping[str, Any] = json.load(file)
+
+    version: Any = baseline.get("version")
+
+    if version not in BASELINE_VERSIONS:
+        raise ValueError(f"Unsupported baseline version {version!r}")
+
+    # Days of version 1 baselines are only their phases
+    days: Mapping[str, Mapping[str, Any]] = {
+        key: day if version == BASELINE_VERSION else {"phases": day}
+        for key, day in baseline["days"].items()
+    }
+
+    return {
+        key: BaselineDay(
+            phases={
+                Phase(phase): Statistics(
+                    **{metric: stats[metric] for metric in METRICS}
+                )
+                for phase, stats in day["phases"].items()
+            },
+            engine=day.get("engine"),
+        )
+        for key, day in days.items()
+    }
+
+
+def compare(
+    benchmarks: Iterable[DayBenchmark],
+    baseline: Mapping[str, BaselineDay],
+    /,
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = DEFAULT_METRIC,
+) -> Sequence[Comparison]:
+    """
+    Compare benchmark results against a baseline
+
+    Phases missing from the baseline are skipped, as are days it benchmarked with
+    another engine (unless it didn't record which).
+    """
+
+    return tuple(
+        Comparison(
+            key=benchmark.key,
+            phase=phase,
+            baseline=baseline[benchmark.key].phases[phase].get(metric),
+            current=phase_benchmark.statistics.get(metric),
+            threshold=threshold,
+        )
+        for benchmark in benchmarks
+        if benchmark.key in baseline
+        and baseline[benchmark.key].engine in (None, benchmark.engine)
+        for phase, phase_benchmark in benchmark.phases.items()
+        if phase in baseline[benchmark.key].phases
+    )
+
+
+def format_day(benchmark: DayBenchmark, /) -> str:
+    """Format the day of a benchmark, with the engine it was solved by (if any)"""
+
+    if benchmark.engine is None:
+        return str(benchmark.day.day)
+
+    return f"{benchmark.day.day} ({benchmark.engine})"
+
+
+def format_benchmarks(
+    benchmarks: Iterable[DayBenchmark],
+    /,
+    comparisons: Iterable[Comparison] = (),
+    *,
+    metric: str = DEFAULT_METRIC,
+) -> str:
+    """Format benchmark results (and any baseline comparisons) into a table"""
+
+    comparisons_by_phase: Mapping[Tuple[str, Phase], Comparison] = {
+        (comparison.key, comparison.phase): comparison for comparison in comparisons
+    }
+
+    rows: MutableSequence[Sequence[str]] = [
+        (
+            "Year",
+            "Day",
+            "Phase",
+            *(f"{metric.title()} (s)" for metric in METRICS),
+            f"Baseline {metric} (s)",
+            "Change",
+            "Status",
+        )
+    ]
+
+    benchmark: DayBenchmark
+    for benchmark in benchmarks:
+        if benchmark.error is not None:
+            rows.append(
+                (
+                    str(benchmark.day.year),
+                    format_day(benchmark),
+                    *("",) * (len(METRICS) + 3),
+                    f"error ({benchmark.error})",
+                )
+            )
+            continue
+
+        phase: Phase
+        phase_benchmark: PhaseBenchmark
+        for phase, phase_benchmark in benchmark.phases.items():
+            stats: Statistics = phase_benchmark.statistics
+            comparison: Optional[Comparison] = comparisons_by_phase.get(
+                (benchmark.key, phase)
+            )
+
+            rows.append(
+                (
+                    str(benchmark.day.year),
+                    format_day(benchmark),
+                    str(phase),
+                    *(format_seconds(stats.get(metric)) for metric in METRICS),
+                    format_seconds(comparison.baseline if comparison else None),
+                    f"{comparison.change:+.1%}" if comparison else "-",
+                    "REGRESSED" if comparison and comparison.regressed else "ok",
+                )
+            )
+
+    return format_table(rows)
@@ -0,0 +1 @@
+"""Suites of micro-benchmarks, run via `python -m aoc microbench <suite>`"""
@@ -0,0 +1,104 @@
+"""Exact digit arithmetic (`aoc.digits`) vs the `math.log10` helpers it replaced"""
+
+import contextlib
+import functools
+import math
+from random import Random
+from typing import Final, Iterator, Sequence, Tuple
+
+from aoc.digits import concat, int_len, int_split
+from aoc.microbench import Case
+
+DEFAULT_SIZE: Final[int] = 100_000  # Integers
+SEED: Final[int] = 0
+
+MAX_DIGITS_SMALL: Final[int] = 18  # As large as the operands in 2024 day-7 get
+MAX_DIGITS_LARGE: Final[int] = 100  # Well beyond where `math.log10` is exact
+
+
+def int_len_log10(integer: int, /) -> int:
+    # As previously in 2025 day-02 (and 2025 day-03)
+    if integer == 0:
+        return 1
+
+    return math.floor(math.log10(integer) + 1)
+
+
+def concat_log10(a: int, b: int, /) -> int:
+    # As previously in 2024 day-7 (`concatenate`)
+    return a * 10 ** int_len_log10(b) + b
+
+
+def split_join_digits(integer: int, /) -> Tuple[int, int]:
+    # As previously in 2025 day-02: split into digits, then join each half back up
+    digits: Sequence[int] = tuple(
+        (integer // (10**index)) % 10
+        for index in range(int_len_log10(integer) - 1, -1, -1)
+    )
+    half_len: int = len(digits) // 2
+
+    return (
+        functools.reduce(concat_log10, digits[:half_len]),
+        functools.reduce(concat_log10, digits[half_len:]),
+    )
+
+
+def split_join_exact(integer: int, /) -> Tuple[int, int]:
+    high: int
+    low: int
+    high, low = int_split(integer, int_len(integer) // 2)
+
+    # (the old helpers dropped any leading zeros of the lower half, as does this)
+    return (high, low)
+
+
+def random_integers(random: Random, count: int, max_digits: int, /) -> Sequence[int]:
+    return [
+        random.randrange(1, 10 ** random.randint(1, max_digits)) for _ in range(count)
+    ]
+
+
+@contextlib.contextmanager
+def cases(*, size: int) -> Iterator[Sequence[Case]]:
+    """Generate `size` integers, of both day-7 sized and (much) larger magnitudes"""
+
+    random: Random = Random(SEED)
+
+    small: Sequence[int] = random_integers(random, size, MAX_DIGITS_SMALL)
+    large: Sequence[int] = random_integers(random, size, MAX_DIGITS_LARGE)
+    pairs: Sequence[Tuple[int, int]] = list(zip(small, reversed(small)))
+
+    # Only even-length integers are split in 2025 day-02
+    even: Sequence[int] = [integer for integer in small if int_len(integer) % 2 == 0]
+
+    yield (
+        Case("int_len", "log10", lambda: sum(map(int_len_log10, small)), size),
+        Case("int_len", "exact", lambda: sum(map(int_len, small)), size),
+        Case(
+            "int_len (large)",
+            "str",
+            lambda: sum(len(str(integer)) for integer in large),
+            size,
+        ),
+        Case("int_len (large)", "exact", lambda: sum(map(int_len, large)), size),
+        Case(
+            "concat",
+            "str",
+            lambda: sum(int(f"{a}{b}") for a, b in pairs),
+            size,
+        ),
+        Case(
+            "concat",
+            "log10",
+            lambda: sum(concat_log10(a, b) for a, b in pairs),
+            size,
+        ),
+        Case("concat", "exact", lambda: sum(concat(a, b) for a, b in pairs), size),
+        Case(
+            "split",
+            "digits",
+            lambda: list(map(split_join_digits, even)),
+            len(even),
+        ),
+        Case("split", "exact", lambda: list(map(split_join_exact, even)), len(even)),
+    )
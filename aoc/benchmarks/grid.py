@@ -0,0 +1,190 @@
+"""Flat, array-backed `aoc.grid.Grid` vs the nested-list grids it replaced"""
+
+import contextlib
+import importlib.util
+from random import Random
+from typing import (
+    Final,
+    Iterator,
+    MutableSequence,
+    NamedTuple,
+    Sequence,
+    Tuple,
+)
+
+from aoc.grid import Grid
+from aoc.microbench import Case
+
+DEFAULT_SIZE: Final[int] = 1_000  # Width (and height) of the grid
+DENSITY: Final[float] = 0.65
+SEED: Final[int] = 0
+
+ROLL: Final[str] = "@"
+WORD: Final[str] = "@@@"
+
+
+class Coord(NamedTuple):
+    x: int
+    y: int
+
+
+class Cell(NamedTuple):
+    coord: Coord
+    value: str
+
+
+class NestedGrid:
+    """Nested-list grid, as previously in 2025 day-04 (trimmed down)"""
+
+    rows: Sequence[Sequence[str]]
+    size_x: int
+    size_y: int
+
+    def __init__(self, rows: Sequence[Sequence[str]], /) -> None:
+        self.rows = rows
+        self.size_x = len(rows[0])
+        self.size_y = len(rows)
+
+    def __iter__(self) -> Iterator[Cell]:
+        for y in range(self.size_y):
+            for x in range(self.size_x):
+                yield Cell(Coord(x, y), self.rows[y][x])
+
+    def contains(self, x: int, y: int, /) -> bool:
+        return 0 <= x < self.size_x and 0 <= y < self.size_y
+
+    def get_surrounding(self, x: int, y: int, /) -> Sequence[Cell]:
+        neighbours: MutableSequence[Cell] = []
+
+        for neighbour_x in range(x - 1, x + 2):
+            for neighbour_y in range(y - 1, y + 2):
+                if not self.contains(neighbour_x, neighbour_y) or (
+                    neighbour_x == x and neighbour_y == y
+                ):
+                    continue
+
+                neighbours.append(
+                    Cell(
+                        Coord(neighbour_x, neighbour_y),
+                        self.rows[neighbour_y][neighbour_x],
+                    )
+                )
+
+        return neighbours
+
+
+def iter_nested(
+    rows: Sequence[Sequence[str]], /
+) -> Iterator[Tuple[Tuple[int, int], str]]:
+    # As previously in 2024 day-8 (`grid_iter`)
+    for y in range(len(rows)):
+        for x in range(len(rows[0])):
+            yield ((x, y), rows[y][x])
+
+
+def to_diagonal(strings: Sequence[str], /, *, right: bool) -> Sequence[str]:
+    # As previously in 2024 day-4 (`to_diagonal`), reading each diagonal by index
+    size: int = len(strings)
+    diagonals: MutableSequence[str] = []
+
+    for start in range(-(size - 1), size):
+        diagonal: str = ""
+
+        for y in range(max(0, -start), min(size, size - start)):
+            x: int = y + start
+            diagonal += strings[y][size - 1 - x if right else x]
+
+        diagonals.append(diagonal)
+
+    return diagonals
+
+
+def count_rolls_nested(grid: NestedGrid, /) -> int:
+    return sum(value == ROLL for _, value in grid)
+
+
+def count_rolls_tuples(rows: Sequence[Sequence[str]], /) -> int:
+    return sum(value == ROLL for _, value in iter_nested(rows))
+
+
+def count_rolls_flat(grid: Grid, /) -> int:
+    data: bytearray = grid.data
+    roll: int = ord(ROLL)
+
+    return sum(data[index] == roll for index in grid.indices())
+
+
+def count_rolls_numpy(grid: Grid, /) -> int:
+    return int((grid.to_numpy() == ord(ROLL)).sum())
+
+
+def count_neighbours_nested(grid: NestedGrid, /) -> int:
+    return sum(
+        sum(neighbour.value == ROLL for neighbour in grid.get_surrounding(*coord))
+        for coord, value in grid
+        if value == ROLL
+    )
+
+
+def count_neighbours_flat(grid: Grid, /) -> int:
+    roll: int = ord(ROLL)
+
+    return sum(grid.count_neighbours(index, roll) for index in grid.find_all(roll))
+
+
+def count_words_nested(rows: Sequence[str], /) -> int:
+    lines: Sequence[str] = (
+        *rows,
+        *("".join(column) for column in zip(*rows)),
+        *to_diagonal(rows, right=False),
+        *to_diagonal(rows, right=True),
+    )
+
+    return sum(line.count(WORD) for line in lines)
+
+
+def count_words_flat(grid: Grid, /) -> int:
+    lines: Sequence[bytes] = (
+        *grid.rows(),
+        *grid.columns(),
+        *grid.diagonals(),
+        *grid.anti_diagonals(),
+    )
+    word: bytes = WORD.encode("ascii")
+
+    return sum(line.count(word) for line in lines)
+
+
+@contextlib.contextmanager
+def cases(*, size: int) -> Iterator[Sequence[Case]]:
+    """Generate a `size` by `size` grid, shaped as 2025 day-04"""
+
+    random: Random = Random(SEED)
+    rows: Sequence[str] = [
+        "".join(ROLL if random.random() < DENSITY else "." for _ in range(size))
+        for _ in range(size)
+    ]
+
+    nested: NestedGrid = NestedGrid([list(row) for row in rows])
+    flat: Grid = Grid.from_text("\n".join(rows))
+    cells: int = size * size
+
+    iterate: MutableSequence[Case] = [
+        Case("cells", "cell tuples", lambda: count_rolls_nested(nested), cells),
+        Case("cells", "coord tuples", lambda: count_rolls_tuples(rows), cells),
+        Case("cells", "flat", lambda: count_rolls_flat(flat), cells),
+    ]
+
+    # NumPy is optional
+    if importlib.util.find_spec("numpy") is not None:
+        iterate.append(Case("cells", "numpy", lambda: count_rolls_numpy(flat), cells))
+
+    yield (
+        *iterate,
+        Case(
+            "neighbours", "cell tuples", lambda: count_neighbours_nested(nested), cells
+        ),
+        Case("neighbours", "flat", lambda: count_neighbours_flat(flat), cells),
+        Case("lines", "strings", lambda: count_words_nested(rows), cells),
+        Case("lines", "flat", lambda: count_words_flat(flat), cells),
+    )
@@ -0,0 +1,259 @@
+"""Array-backed `aoc.intervals.Intervals` vs the per-range objects it replaced"""
+
+import contextlib
+from bisect import bisect_right
+from dataclasses import dataclass
+from random import Random
+from typing import (
+    Final,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Sequence,
+    Tuple,
+)
+
+from aoc.intervals import Intervals
+from aoc.microbench import Case
+
+DEFAULT_SIZE: Final[int] = 1_000_000  # Intervals (and lookups)
+SEED: Final[int] = 0
+
+ID_MAX: Final[int] = 562_949_953_421_311  # As in 2025 day-05
+LEGACY_MAX_SIZE: Final[int] = 2_000  # `RangeTree` merges in quadratic time
+
+
+@dataclass
+class Range:
+    """Inclusive range, as previously in 2025 day-05"""
+
+    min: int
+    max: int
+
+    def __gt__(self, rhs: "Range", /) -> bool:
+        return self.min > rhs.max
+
+    def __lt__(self, rhs: "Range", /) -> bool:
+        return self.max < rhs.min
+
+    def __len__(self) -> int:
+        return self.max - self.min + 1
+
+    def __contains__(self, value: int, /) -> bool:
+        return self.min <= value <= self.max
+
+
+class RangeTree:
+    """Sorted list of merged ranges, as previously in 2025 day-05"""
+
+    _ranges: MutableSequence[Range]
+
+    def __init__(self, ranges: Iterable[Range] | None = None, /) -> None:
+        self._ranges = []
+
+        if ranges is not None:
+            for range_ in ranges:
+                self.add(range_)
+
+    def __iter__(self) -> Iterator[Range]:
+        yield from self._ranges
+
+    def _get_insertion_coords(self, range_: Range, /) -> Tuple[int, int]:
+        # 1. Insert at the beginning
+        if not self._ranges or range_ < self._ranges[0]:
+            return (0,) * 2
+
+        # 2. Insert at the end
+        if range_ > self._ranges[-1]:
+            return (len(self._ranges),) * 2
+
+        index_lt: int | None = None  # index of last range less than `range_`
+        index_gt: int | None = None  # index of first range greater than `range_
+
+        index: int
+        existing_range: Range
+        for index, existing_range in enumerate(self):
+            if existing_range < range_:
+                index_lt = index
+            elif existing_range > range_:
+                index_gt = index
+                break
+
+        index_start: int = index_lt + 1 if index_lt is not None else 0
+        index_end: int = index_gt if index_gt is not None else len(self._ranges)
+
+        # 3. Insert in the middle (might span either end)
+        return (index_start, index_end)
+
+    def add(self, range_: Range, /) -> None:
+        insert_start: int
+        insert_end: int
+        insert_start, insert_end = self._get_insertion_coords(range_)
+
+        # 1. Single position to insert into (no intersection)
+        if insert_start == insert_end:
+            self._ranges.insert(insert_start, range_)
+            return
+
+        # 2. The new range intersects existing range(s) - create a single
+        # merged range (including the new range) and insert this in place
+        # of the intersection.
+        intersection: Sequence[Range] = self._ranges[insert_start:insert_end]
+        merged_range: Range = Range(
+            min=min(range_.min, intersection[0].min),
+            max=max(range_.max, intersection[-1].max),
+        )
+        self._ranges[insert_start:insert_end] = [merged_range]
+
+    def contains(self, value: int, /) -> bool:
+        return any(value in range_ for range_ in self._ranges)
+
+
+def merge_tuples(ranges: Iterable[Tuple[int, int]], /) -> Sequence[Tuple[int, int]]:
+    # Sorting (start, end) tuples, then merging them one by one
+    merged: MutableSequence[Tuple[int, int]] = []
+
+    start: int
+    end: int
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def contains_tuples(
+    starts: Sequence[int], merged: Sequence[Tuple[int, int]], value: int, /
+) -> bool:
+    index: int = bisect_right(starts, value) - 1
+
+    return index >= 0 and value < merged[index][1]
+
+
+def build_tree(firsts: Sequence[int], lasts: Sequence[int], /) -> RangeTree:
+    return RangeTree(map(Range, firsts, lasts))
+
+
+def normalise_tree(
+    firsts: Sequence[int], lasts: Sequence[int], /
+) -> Sequence[Tuple[int, int]]:
+    return [(range_.min, range_.max + 1) for range_ in build_tree(firsts, lasts)]
+
+
+def normalise_intervals(
+    firsts: Sequence[int], lasts: Sequence[int], /
+) -> Sequence[Tuple[int, int]]:
+    return list(Intervals.from_inclusive(firsts, lasts).normalise())
+
+
+@contextlib.contextmanager
+def cases(*, size: int) -> Iterator[Sequence[Case]]:
+    """Generate `size` random (partly overlapping) ranges, and `size` IDs to look up"""
+
+    random: Random = Random(SEED)
+    max_length: int = max(1, 2 * ID_MAX // size)
+
+    firsts: Sequence[int] = [random.randint(1, ID_MAX) for _ in range(size)]
+    lasts: Sequence[int] = [first + random.randrange(max_length) for first in firsts]
+    ids: Sequence[int] = [random.randint(1, ID_MAX) for _ in range(size)]
+
+    intervals: Intervals = Intervals.from_inclusive(firsts, lasts).normalise()
+    merged: Sequence[Tuple[int, int]] = merge_tuples(
+        (first, last + 1) for first, last in zip(firsts, lasts)
+    )
+    starts: Sequence[int] = [start for start, _ in merged]
+
+    # A second set of ranges, offset from the first, to combine them with
+    others: Intervals = Intervals(
+        (start + max_length // 2 for start in intervals.starts),
+        (end + max_length // 2 for end in intervals.ends),
+    ).normalise()
+
+    # The range tree merges each range into a list, so it's only timed on a subset
+    legacy_size: int = min(size, LEGACY_MAX_SIZE)
+    legacy_firsts: Sequence[int] = firsts[:legacy_size]
+    legacy_lasts: Sequence[int] = lasts[:legacy_size]
+    tree: RangeTree = build_tree(legacy_firsts, legacy_lasts)
+    legacy_intervals: Intervals = Intervals.from_inclusive(
+        legacy_firsts, legacy_lasts
+    ).normalise()
+
+    yield (
+        Case(
+            f"normalise ({legacy_size})",
+            "range tree",
+            lambda: normalise_tree(legacy_firsts, legacy_lasts),
+            legacy_size,
+        ),
+        Case(
+            f"normalise ({legacy_size})",
+            "intervals",
+            lambda: normalise_intervals(legacy_firsts, legacy_lasts),
+            legacy_size,
+        ),
+        Case(
+            f"contains ({legacy_size})",
+            "range tree",
+            lambda: sum(tree.contains(id_) for id_ in ids[:legacy_size]),
+            legacy_size,
+        ),
+        Case(
+            f"contains ({legacy_size})",
+            "intervals",
+            lambda: sum(id_ in legacy_intervals for id_ in ids[:legacy_size]),
+            legacy_size,
+        ),
+        Case(
+            "normalise",
+            "tuples",
+            lambda: merge_tuples(
+                (first, last + 1) for first, last in zip(firsts, lasts)
+            ),
+            size,
+        ),
+        Case(
+            "normalise",
+            "intervals",
+            lambda: normalise_intervals(firsts, lasts),
+            size,
+        ),
+        Case(
+            "contains",
+            "tuples",
+            lambda: sum(contains_tuples(starts, merged, id_) for id_ in ids),
+            size,
+        ),
+        Case(
+            "contains",
+            "intervals",
+            lambda: sum(id_ in intervals for id_ in ids),
+            size,
+        ),
+        Case(
+            "total length",
+            "tuples",
+            lambda: sum(end - start for start, end in merged),
+            size,
+        ),
+        Case("total length", "intervals", intervals.total_length, size),
+        Case(
+            "union",
+            "intervals",
+            lambda: (intervals | others).total_length(),
+            size,
+        ),
+        Case(
+            "intersection",
+            "intervals",
+            lambda: (intervals & others).total_length(),
+            size,
+        ),
+        Case(
+            "difference",
+            "intervals",
+            lambda: (intervals - others).total_length(),
+            size,
+        ),
+    )
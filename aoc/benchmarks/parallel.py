@@ -0,0 +1,120 @@
+"""Serial vs worker threads vs worker processes, solving shards of parsed inputs"""
+
+import contextlib
+import os
+import tempfile
+from concurrent.futures import Executor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Final, Iterator, Mapping, MutableSequence, Sequence, Tuple
+
+from aoc.backends import BACKEND_PROCESS, BACKEND_THREAD, build_name, make_executor
+from aoc.discovery import Day, find_days, load_module
+from aoc.generate import write_input
+from aoc.mapreduce import CHUNKS_PER_JOB, map_shards
+from aoc.microbench import Case
+
+DEFAULT_SIZE: Final[int] = 2_000  # Equations (and ten times as many reports)
+
+# (year, day, items per unit of size, generator parameters) of the days compared:
+# enough items for each shard to outweigh handing it to a worker
+WORKLOADS: Final[Sequence[Tuple[int, int, float, Mapping[str, int]]]] = (
+    (2024, 7, 1, {"max_operands": 6}),  # Every operator is tried, so keep them few
+    (2024, 2, 10, {}),
+    (2025, 2, 1, {}),
+)
+
+
+def solve_serially(module: ModuleType, data: Any, /) -> Sequence[int]:
+    return tuple(module.combine_chunks([module.solve_shard(data)]))
+
+
+@contextlib.contextmanager
+def cases(*, size: int) -> Iterator[Sequence[Case]]:
+    """
+    Generate an input per day, parse each once, then solve its shards in parallel
+
+    Parsed inputs are shared by worker threads, but pickled to worker processes (a
+    shard at a time), or attached to in shared memory by them, for days which can
+    export their parsed input. Each backend is labelled with the build it ran on,
+    so runs under `python3.13` (GIL) and `python3.13t` (free-threaded) can be
+    compared.
+    """
+
+    jobs: int = os.cpu_count() or 1
+    shards: int = jobs * CHUNKS_PER_JOB
+    build: str = build_name()
+    inputs: MutableSequence[Tuple[Day, ModuleType, Any, int]] = []
+
+    directory: str
+    with tempfile.TemporaryDirectory(prefix="aoc-parallel-") as directory:
+        year: int
+        number: int
+        per_size: float
+        params: Mapping[str, int]
+        for year, number, per_size, params in WORKLOADS:
+            day: Day = find_days(year, number)[0]
+            path: Path = Path(directory) / f"{year}-{number}"
+            items: int = max(1, round(size * per_size))
+
+            write_input(day, path, size=items, params=params)
+
+            # Loaded before any worker process starts, so that they inherit it (and
+            # can unpickle the parsed items it defines)
+            module: ModuleType = load_module(day)
+            data: Any = module.read_input(path)
+
+            # Lazily parsed inputs are gathered up, so that they can be sliced
+            if not hasattr(data, "__getitem__"):
+                data = tuple(data)
+
+            inputs.append((day, module, data, items))
+
+    threads: Executor
+    processes: Executor
+    with (
+        make_executor(BACKEND_THREAD, jobs=jobs) as threads,
+        make_executor(BACKEND_PROCESS, jobs=jobs) as processes,
+    ):
+        yield tuple(
+            case
+            for day, module, data, items in inputs
+            for case in (
+                Case(
+                    f"{day}",
+                    "serial",
+                    lambda module=module, data=data: solve_serially(module, data),
+                    items,
+                ),
+                Case(
+                    f"{day}",
+                    f"threads ({build})",
+                    lambda day=day, data=data: map_shards(
+                        day, data, threads, shards=shards
+                    ),
+                    items,
+                ),
+                Case(
+                    f"{day}",
+                    f"processes, pickled ({build})",
+                    lambda day=day, data=data: map_shards(
+                        day, data, processes, shards=shards, shared=False
+                    ),
+                    items,
+                ),
+                *(
+                    (
+                        Case(
+                            f"{day}",
+                            f"processes, shared memory ({build})",
+                            lambda day=day, data=data: map_shards(
+                                day, data, processes, shards=shards
+                            ),
+                            items,
+                        ),
+                    )
+                    if hasattr(module, "export_input")
+                    else ()
+                ),
+            )
+        )
@@ -0,0 +1,99 @@
+"""Memory-mapped (`aoc.reader`) vs text-mode reading of inputs"""
+
+import contextlib
+import tempfile
+from pathlib import Path
+from typing import Final, Iterator, Sequence, Tuple
+
+from aoc.discovery import find_days
+from aoc.generate import write_input
+from aoc.microbench import Case
+from aoc.reader import MappedInput, parse_int_columns, parse_ints, split_sections
+
+DEFAULT_SIZE: Final[int] = 1_000_000  # Lines
+
+
+def count_lines_text(path: Path, /) -> int:
+    with open(path, encoding="utf-8") as file:
+        return sum(1 for _ in file)
+
+
+def count_lines_mapped(path: Path, /) -> int:
+    input_: MappedInput
+    with MappedInput(path) as input_:
+        return sum(1 for _ in input_.lines())
+
+
+def sum_columns_text(path: Path, /) -> Tuple[int, int]:
+    # As in 2024 day-1, prior to using `aoc.reader`
+    with open(path, encoding="utf-8") as file:
+        lhs: Sequence[int]
+        rhs: Sequence[int]
+        lhs, rhs = zip(*(map(int, line.split()) for line in file))
+
+    return (sum(lhs), sum(rhs))
+
+
+def sum_columns_mapped(path: Path, /) -> Tuple[int, int]:
+    input_: MappedInput
+    with MappedInput(path) as input_:
+        lhs: Sequence[int]
+        rhs: Sequence[int]
+        lhs, rhs = input_.int_columns(2)
+
+    return (sum(lhs), sum(rhs))
+
+
+def sum_sections_text(path: Path, /) -> Tuple[int, int]:
+    # As in 2025 day-05, prior to using `aoc.reader`
+    with open(path, encoding="utf-8") as file:
+        raw_ranges: str
+        raw_ids: str
+        raw_ranges, raw_ids = file.read().split("\n\n")
+
+    ranges: Sequence[Tuple[int, int]] = [
+        tuple(map(int, raw_range.split("-"))) for raw_range in raw_ranges.splitlines()
+    ]
+    ids: Sequence[int] = [int(raw_id) for raw_id in raw_ids.splitlines()]
+
+    return (sum(max_ - min_ for min_, max_ in ranges), sum(ids))
+
+
+def sum_sections_mapped(path: Path, /) -> Tuple[int, int]:
+    input_: MappedInput
+    with MappedInput(path) as input_:
+        raw_ranges: memoryview
+        raw_ids: memoryview
+        raw_ranges, raw_ids = split_sections(input_.view)
+
+        mins: Sequence[int]
+        maxes: Sequence[int]
+        mins, maxes = parse_int_columns(raw_ranges, 2)
+        ids: Sequence[int] = parse_ints(raw_ids)
+
+        # Release the views, so that the mapping can be closed
+        del raw_ranges, raw_ids
+
+    return (sum(maxes) - sum(mins), sum(ids))
+
+
+@contextlib.contextmanager
+def cases(*, size: int) -> Iterator[Sequence[Case]]:
+    """Generate inputs of `size` lines, shaped as 2024 day-1 and 2025 day-05"""
+
+    directory: str
+    with tempfile.TemporaryDirectory(prefix="aoc-reader-") as directory:
+        columns: Path = Path(directory) / "columns"
+        sections: Path = Path(directory) / "sections"
+
+        write_input(find_days(2024, 1)[0], columns, size=size)
+        write_input(find_days(2025, 5)[0], sections, size=size)
+
+        yield (
+            Case("lines", "text", lambda: count_lines_text(columns), size),
+            Case("lines", "mmap", lambda: count_lines_mapped(columns), size),
+            Case("int columns", "text", lambda: sum_columns_text(columns), size),
+            Case("int columns", "mmap", lambda: sum_columns_mapped(columns), size),
+            Case("sections", "text", lambda: sum_sections_text(sections), size),
+            Case("sections", "mmap", lambda: sum_sections_mapped(sections), size),
+        )
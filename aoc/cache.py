@@ -0,0 +1,250 @@
+"""On-disk caches of parsed inputs & answers, keyed by a hash of the raw input"""
+
+import contextlib
+import hashlib
+import os
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Final, Optional, Tuple
+
+from aoc.reader import FILENAME_INPUT
+from aoc.lazy import lazy_import
+
+# Only needed to store parsed inputs & to cache answers, so imported once they are
+sqlite3: ModuleType = lazy_import("sqlite3")
+tempfile: ModuleType = lazy_import("tempfile")
+
+# Constants
+ENV_CACHE_DIR: Final[str] = "AOC_CACHE_DIR"
+DIRECTORY_PARSE: Final[str] = "parse"
+SUFFIX_ENTRY: Final[str] = ".bin"
+MAGIC: Final[bytes] = b"AOCP"
+FORMAT_VERSION: Final[int] = 1
+FILENAME_ANSWERS: Final[str] = "answers.sqlite3"
+ANSWERS_VERSION: Final[int] = 2  # Databases of other versions are emptied
+DEFAULT_MAX_ANSWERS: Final[int] = 1024
+SQLITE_TIMEOUT: Final[float] = 30.0  # Seconds to wait on other writers
+
+# Entry header: magic, format version, parser version, SHA-256 of the raw input
+HEADER: Final[struct.Struct] = struct.Struct("<4sHI32s")
+
+
+def default_directory() -> Path:
+    """
+    The directory caches are kept in
+
+    This is `$AOC_CACHE_DIR` if set, otherwise `aoc` within the user's cache
+    directory (`$XDG_CACHE_HOME`, or `~/.cache`).
+    """
+
+    if os.environ.get(ENV_CACHE_DIR):
+        return Path(os.environ[ENV_CACHE_DIR])
+
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "aoc"
+
+
+def hash_file(path: Path | str = FILENAME_INPUT, /) -> bytes:
+    """SHA-256 digest of a file (by default, the raw input)"""
+
+    with open(path, "rb") as file:
+        return hashlib.file_digest(file, "sha256").digest()
+
+
+# Models
+@dataclass(frozen=True)
+class InputCodec:
+    """
+    Compact binary (de)serialisation of a solution's parsed input
+
+    Solutions opt in to parse caching by exposing `PARSER_VERSION` alongside
+    `encode_input(data) -> bytes` and `decode_input(buffer) -> data`. The version
+    must be bumped whenever the parser (or encoding) changes, which invalidates
+    every entry cached by previous versions.
+    """
+
+    version: int
+    encode: Callable[[Any], bytes]
+    decode: Callable[[memoryview], Any]
+
+
+@dataclass(frozen=True)
+class ParseCache:
+    """
+    Cache of parsed inputs, with an entry per solution & raw input
+
+    Entries are stored at `<directory>/parse/<module>/<input SHA-256>.bin`, and
+    are only used if their header matches the solution's current parser version.
+    """
+
+    directory: Path = field(default_factory=default_directory)
+
+    def get_path(self, namespace: str, digest: bytes, /) -> Path:
+        """Path to the entry for a solution (by module name) and input digest"""
+
+        filename: str = f"{digest.hex()}{SUFFIX_ENTRY}"
+
+        return self.directory / DIRECTORY_PARSE / namespace / filename
+
+    def load(
+        self, namespace: str, digest: bytes, codec: InputCodec, /
+    ) -> Optional[Any]:
+        """Load a cached parsed input, if there's an entry of the current version"""
+
+        try:
+            with open(self.get_path(namespace, digest), "rb") as file:
+                entry: bytes = file.read()
+        except FileNotFoundError:
+            return None
+
+        if len(entry) < HEADER.size:
+            return None
+
+        magic: bytes
+        format_version: int
+        parser_version: int
+        entry_digest: bytes
+        magic, format_version, parser_version, entry_digest = HEADER.unpack_from(entry)
+
+        if (magic, format_version, parser_version, entry_digest) != (
+            MAGIC,
+            FORMAT_VERSION,
+            codec.version,
+            digest,
+        ):
+            return None
+
+        return codec.decode(memoryview(entry)[HEADER.size :])
+
+    def store(
+        self, namespace: str, digest: bytes, codec: InputCodec, data: Any, /
+    ) -> None:
+        """Store a parsed input, replacing any existing entry for the same input"""
+
+        path: Path = self.get_path(namespace, digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        header: bytes = HEADER.pack(MAGIC, FORMAT_VERSION, codec.version, digest)
+        payload: bytes = codec.encode(data)
+
+        # Write to a temporary file first, so concurrent readers never see a
+        # partially written entry
+        descriptor: int
+        temporary: str
+        descriptor, temporary = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+
+        try:
+            with open(descriptor, "wb") as file:
+                file.write(header)
+                file.write(payload)
+
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+
+@dataclass(frozen=True)
+class AnswerCache:
+    """
+    Size-bounded, least-recently-used cache of answers
+
+    Answers are keyed on the SHA-256 of the raw input, the SHA-256 of the solution's
+    source (only its `app.py`, not any modules it imports), the engine which solved
+    it (of days with several, see `aoc.engines`) and the part. Entries are
+    kept in a SQLite database, so the cache can be shared by concurrent runs, and
+    the least recently used are evicted once there are more than `max_entries`.
+    """
+
+    directory: Path = field(default_factory=default_directory)
+    max_entries: int = DEFAULT_MAX_ANSWERS
+
+    @property
+    def path(self) -> Path:
+        """Path to the database"""
+
+        return self.directory / FILENAME_ANSWERS
+
+    def connect(self) -> "sqlite3.Connection":
+        """Connect to the database, creating it if needed"""
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        connection: sqlite3.Connection = sqlite3.connect(
+            self.path, timeout=SQLITE_TIMEOUT
+        )
+        # The schema's versioned by SQLite's `user_version`, and as this is only a
+        # cache, answers of any other version are dropped rather than migrated
+        version: int = connection.execute("PRAGMA user_version").fetchone()[0]
+
+        if version != ANSWERS_VERSION:
+            with connection:
+                connection.execute("DROP TABLE IF EXISTS answers")
+                connection.execute(f"PRAGMA user_version = {ANSWERS_VERSION}")
+
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS answers ("
+            "input BLOB, source BLOB, engine TEXT, part TEXT, answer TEXT, "
+            "accessed REAL, PRIMARY KEY (input, source, engine, part))"
+        )
+
+        return connection
+
+    def get(
+        self,
+        input_: bytes,
+        source: bytes,
+        part: str,
+        /,
+        *,
+        engine: Optional[str] = None,
+    ) -> Optional[int]:
+        """Get a cached answer (marking it as recently used), if there is one"""
+
+        # Days without engines are keyed on an empty engine, as NULLs never match
+        key: Tuple[bytes, bytes, str, str] = (input_, source, engine or "", part)
+
+        connection: sqlite3.Connection
+        with contextlib.closing(self.connect()) as connection, connection:
+            row: Optional[Tuple[str]] = connection.execute(
+                "SELECT answer FROM answers "
+                "WHERE input = ? AND source = ? AND engine = ? AND part = ?",
+                key,
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            connection.execute(
+                "UPDATE answers SET accessed = ? "
+                "WHERE input = ? AND source = ? AND engine = ? AND part = ?",
+                (time.time(), *key),
+            )
+
+        return int(row[0])
+
+    def put(
+        self,
+        input_: bytes,
+        source: bytes,
+        part: str,
+        answer: int,
+        /,
+        *,
+        engine: Optional[str] = None,
+    ) -> None:
+        """Cache an answer, evicting the least recently used beyond the limit"""
+
+        connection: sqlite3.Connection
+        with contextlib.closing(self.connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?)",
+                (input_, source, engine or "", part, str(answer), time.time()),
+            )
+            connection.execute(
+                "DELETE FROM answers WHERE rowid NOT IN ("
+                "SELECT rowid FROM answers ORDER BY accessed DESC LIMIT ?)",
+                (self.max_entries,),
+            )
@@ -0,0 +1,19 @@
+"""
+Reducers of chunks (or shards) summarised by days, for `aoc.mapreduce`
+
+Kept apart from `aoc.mapreduce` itself, as days import them, and shouldn't pay
+for importing what only map-reducing needs (e.g. backends & shared memory).
+"""
+
+from typing import Iterable, Sequence, Tuple
+
+
+def sum_chunks(summaries: Iterable[Sequence[int]], /) -> Tuple[int, ...]:
+    """
+    Reduce chunks summarised as each part's (partial) answer, by summing them
+
+    Example:
+        >>> assert sum_chunks([(1, 2), (3, 4)]) == (4, 6)
+    """
+
+    return tuple(map(sum, zip(*summaries)))
@@ -0,0 +1,947 @@
+"""Command-line interface, e.g. `python -m aoc run 2024 5`"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Iterator, Mapping, MutableSequence, Optional, Sequence, Tuple
+
+from aoc import (
+    bench,
+    client,
+    complexity,
+    fuzz,
+    generate,
+    imports,
+    mapreduce,
+    memory,
+    microbench,
+    profiling,
+    sampling,
+)
+from aoc.backends import BACKEND_THREAD, BACKENDS, resolve_backend
+from aoc.cache import DEFAULT_MAX_ANSWERS, AnswerCache, ParseCache
+from aoc.discovery import Day, DayNotFoundError, find_days
+from aoc.engines import ENGINE_ALL
+from aoc.lazy import lazy_import
+from aoc.reader import STDIN
+from aoc.report import (
+    format_counters,
+    format_memory,
+    format_results,
+    format_seconds,
+    format_table,
+)
+from aoc.runner import DayResult, RunOptions, run_days
+
+# Only needed by a single command (rather than to build the parser), so imported
+# once that command is run
+batch: ModuleType = lazy_import("aoc.batch")
+daemon: ModuleType = lazy_import("aoc.daemon")
+
+
+def select_days(args: argparse.Namespace, /) -> Sequence[Day]:
+    """Select the days to operate on from the `year`/`day`/`--all` arguments"""
+
+    if args.all:
+        return find_days()
+
+    return find_days(args.year, args.day)
+
+
+def run_options(args: argparse.Namespace, /) -> RunOptions:
+    """Build the options for executing days from the `run` arguments"""
+
+    input_path: Optional[Path] = args.input
+    profile_directory: Optional[Path] = args.profile
+
+    # Sampling profiles are written alongside cProfile's, unless told otherwise
+    if args.sample is not None and profile_directory is None:
+        profile_directory = profiling.DEFAULT_DIRECTORY
+
+    # As are their inputs, so these must be resolved beforehand
+    if input_path is not None and str(input_path) != STDIN:
+        input_path = input_path.resolve()
+
+    return RunOptions(
+        parse_cache=ParseCache() if args.parse_cache else None,
+        answer_cache=AnswerCache(max_entries=args.cache_size) if args.cache else None,
+        # Solutions are run from their own directory
+        profile_directory=profile_directory.resolve() if profile_directory else None,
+        sample_rate=args.sample,
+        trace_memory=args.memory or args.memory_budget is not None,
+        count_work=args.counters,
+        memory_budget=args.memory_budget,
+        fused=args.fused,
+        input_path=input_path,
+        parallel_parts=args.parallel_parts,
+        engine=args.engine,
+    )
+
+
+@contextlib.contextmanager
+def exit_on_broken_pipe() -> Iterator[None]:
+    """
+    Exit quietly (rather than with a traceback) once stdout's reader stops reading,
+    e.g. `aoc generate ... | head`
+
+    Python flushes stdout again on exit, which would fail too, so what's left of it
+    is sent to /dev/null first.
+    """
+
+    try:
+        yield
+        sys.stdout.flush()
+    except BrokenPipeError:
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def command_run(args: argparse.Namespace, /) -> int:
+    """Run (and time) the selected days, reporting answers in a table"""
+
+    if args.inputs is not None:
+        return command_run_batch(args)
+
+    days: Sequence[Day] = select_days(args)
+
+    if args.input is not None and len(days) != 1:
+        raise DayNotFoundError("An input can only be given for a single day")
+
+    started: float = time.perf_counter()
+    results: MutableSequence[DayResult] = sorted(
+        run_days(
+            days, jobs=args.jobs, options=run_options(args), backend=args.backend
+        ),
+        key=lambda result: result.day,
+    )
+    elapsed: float = time.perf_counter() - started
+
+    # One line per day (and engine) instead, e.g. to compare counters across engines
+    if args.json:
+        for result in results:
+            print(json.dumps(result.to_json()))
+
+        return 0 if all(result.ok for result in results) else 1
+
+    print(format_results(results))
+    print(f"Elapsed (s): {elapsed:.4f}")
+
+    if args.memory or args.memory_budget is not None:
+        print()
+        print(format_memory(results))
+
+    if args.counters:
+        print()
+        print(format_counters(results))
+
+    if args.sample is not None:
+        print(
+            "Profiles (.hotspots & .collapsed) written to: "
+            f"{args.profile or profiling.DEFAULT_DIRECTORY}"
+        )
+    elif args.profile is not None:
+        print(f"Profiles (.pstats & .collapsed) written to: {args.profile}")
+
+    return 0 if all(result.ok for result in results) else 1
+
+
+def command_run_batch(args: argparse.Namespace, /) -> int:
+    """Run a single day against every input in a directory, reporting JSON lines"""
+
+    days: Sequence[Day] = select_days(args)
+
+    if len(days) != 1:
+        raise DayNotFoundError("Batches of inputs can only be run for a single day")
+
+    meter: batch.ThroughputMeter = batch.ThroughputMeter()
+
+    # One line per input (as each completes), then a line of aggregate throughput
+    with exit_on_broken_pipe():
+        result: batch.InputResult
+        for result in batch.run_inputs(
+            days[0],
+            batch.find_inputs(args.inputs),
+            jobs=args.jobs,
+            options=run_options(args),
+            backend=args.backend,
+        ):
+            meter.add(result)
+            print(json.dumps(result.to_json()), flush=True)
+
+        print(json.dumps(meter.throughput.to_json()))
+
+    return 1 if meter.failed else 0
+
+
+def command_bench(args: argparse.Namespace, /) -> int:
+    """Benchmark the selected days, optionally writing/comparing a JSON baseline"""
+
+    benchmarks: Sequence[bench.DayBenchmark] = tuple(
+        bench.benchmark_days(
+            select_days(args),
+            warmup=args.warmup,
+            repeat=args.repeat,
+            parse_cache=ParseCache() if args.parse_cache else None,
+            fused=args.fused,
+            engine=args.engine,
+        )
+    )
+    comparisons: Sequence[bench.Comparison] = ()
+
+    if args.compare is not None:
+        baseline: Mapping[str, bench.BaselineDay] = bench.read_baseline(args.compare)
+        comparisons = bench.compare(
+            benchmarks, baseline, threshold=args.threshold, metric=args.metric
+        )
+
+    print(bench.format_benchmarks(benchmarks, comparisons, metric=args.metric))
+
+    if args.output is not None:
+        bench.write_baseline(
+            args.output,
+            bench.to_baseline(benchmarks, warmup=args.warmup, repeat=args.repeat),
+        )
+
+    failed: bool = any(benchmark.error is not None for benchmark in benchmarks)
+    regressed: bool = any(comparison.regressed for comparison in comparisons)
+
+    return 1 if failed or regressed else 0
+
+
+def command_generate(args: argparse.Namespace, /) -> int:
+    """Generate a synthetic input for a single day"""
+
+    days: Sequence[Day] = select_days(args)
+
+    if len(days) != 1:
+        raise DayNotFoundError("Inputs can only be generated for a single day")
+
+    day: Day = days[0]
+
+    with exit_on_broken_pipe():
+        generate.write_input(
+            day,
+            args.output,
+            size=generate.resolve_size(day, size=args.size, scale=args.scale),
+            seed=args.seed,
+            params=dict(args.param),
+        )
+
+    return 0
+
+
+def command_complexity(args: argparse.Namespace, /) -> int:
+    """Measure how the selected days scale, fitting an exponent per phase"""
+
+    complexities: Sequence[complexity.DayComplexity] = tuple(
+        complexity.measure_days(
+            select_days(args),
+            scales=complexity.size_ladder(
+                min_scale=args.min_scale, factor=args.factor, steps=args.steps
+            ),
+            seed=args.seed,
+            repeat=args.repeat,
+            time_limit=args.time_limit,
+            engine=args.engine,
+        )
+    )
+
+    print(complexity.format_complexities(complexities, tolerance=args.tolerance))
+
+    if args.csv is not None:
+        with open(args.csv, "w", encoding="utf-8", newline="") as file:
+            complexity.write_csv(file, complexities)
+
+    return 0 if all(c.error is None for c in complexities) else 1
+
+
+def command_fuzz(args: argparse.Namespace, /) -> int:
+    """Fuzz the selected days' engines against their reference engines"""
+
+    fuzzes: Sequence[fuzz.DayFuzz] = tuple(
+        fuzz.fuzz_days(
+            select_days(args),
+            cases=args.cases,
+            max_size=args.max_size,
+            seed=args.seed,
+            params=dict(args.param),
+        )
+    )
+
+    print(fuzz.format_fuzz(fuzzes))
+
+    if args.output is not None:
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    day_fuzz: fuzz.DayFuzz
+    for day_fuzz in fuzzes:
+        mismatch: fuzz.Mismatch
+        for mismatch in day_fuzz.mismatches:
+            print()
+            print(fuzz.format_mismatch(day_fuzz.day, mismatch), end="")
+
+            if args.output is not None:
+                path: Path = fuzz.get_reproducer_path(
+                    args.output, day_fuzz.day, mismatch
+                )
+                path.write_text(mismatch.input, encoding="utf-8")
+
+    return 0 if all(day_fuzz.ok for day_fuzz in fuzzes) else 1
+
+
+def command_mapreduce(args: argparse.Namespace, /) -> int:
+    """Solve a single day by splitting its input (or parsed input) across workers"""
+
+    days: Sequence[Day] = select_days(args)
+
+    if len(days) != 1:
+        raise DayNotFoundError("Inputs can only be split for a single day")
+
+    result: mapreduce.ChunkedResult = (
+        mapreduce.solve_sharded(
+            days[0],
+            args.input,
+            jobs=args.jobs,
+            shards=args.chunks,
+            backend=args.backend,
+        )
+        if args.parsed
+        else mapreduce.solve_chunked(
+            days[0],
+            args.input,
+            jobs=args.jobs,
+            chunks=args.chunks,
+            backend=args.backend,
+        )
+    )
+
+    print(
+        format_table(
+            [
+                (
+                    "Year",
+                    "Day",
+                    "Part 1",
+                    "Part 2",
+                    "Jobs",
+                    "Backend",
+                    "Chunks",
+                    "Wall (s)",
+                    "MB/s",
+                ),
+                (
+                    str(days[0].year),
+                    str(days[0].day),
+                    *map(str, result.answers),
+                    str(args.jobs),
+                    resolve_backend(args.backend),
+                    str(result.chunks),
+                    format_seconds(result.elapsed),
+                    f"{result.megabytes_per_second:.2f}",
+                ),
+            ]
+        )
+    )
+
+    return 0
+
+
+def command_microbench(args: argparse.Namespace, /) -> int:
+    """Run a suite of micro-benchmarks, comparing alternative implementations"""
+
+    results: Sequence[microbench.CaseResult] = microbench.run_suite(
+        args.suite, size=args.size, repeat=args.repeat, number=args.number
+    )
+
+    print(microbench.format_results(results))
+
+    return 0 if all(result.matches for result in results) else 1
+
+
+def command_import_profile(args: argparse.Namespace, /) -> int:
+    """Profile importing the selected days in fresh interpreters, slowest first"""
+
+    profiles: Sequence[imports.DayImports] = tuple(
+        imports.profile_days(select_days(args), repeat=args.repeat)
+    )
+
+    print(imports.format_imports(profiles, top=args.top, budget_ms=args.budget))
+
+    failed: bool = any(profile.error is not None for profile in profiles)
+    over_budget: bool = any(profile.over_budget(args.budget) for profile in profiles)
+
+    return 1 if failed or over_budget else 0
+
+
+def command_serve(args: argparse.Namespace, /) -> int:
+    """Serve requests to solve days from a warm daemon, until interrupted"""
+
+    socket_path: Path = args.socket or client.default_socket_path()
+
+    server: daemon.Daemon
+    with daemon.Daemon(socket_path, jobs=args.jobs) as server:
+        print(
+            f"Serving on {socket_path} with {args.jobs} warm worker(s), "
+            "e.g. python -m aoc.client 2024 5",
+            flush=True,
+        )
+
+        daemon.serve(server)
+
+    return 0
+
+
+def parameter(value: str, /) -> Tuple[str, str]:
+    """Argument type for `NAME=VALUE` pairs (converted by whatever accepts them)"""
+
+    name: str
+    raw_value: str
+    separator: str
+    name, separator, raw_value = value.partition("=")
+
+    if not separator or not name:
+        raise argparse.ArgumentTypeError(f"{value!r} is not of the form NAME=VALUE")
+
+    return (name, raw_value)
+
+
+def non_negative_int(value: str, /) -> int:
+    """Argument type for integers of at least zero"""
+
+    integer: int = int(value)
+
+    if integer < 0:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a non-negative integer")
+
+    return integer
+
+
+def positive_int(value: str, /) -> int:
+    """Argument type for integers of at least one"""
+
+    integer: int = int(value)
+
+    if integer < 1:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a positive integer")
+
+    return integer
+
+
+def byte_size(value: str, /) -> int:
+    """Argument type for sizes in bytes, with an optional suffix (e.g. `64M`)"""
+
+    try:
+        return memory.parse_bytes(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{value!r} is not a size in bytes")
+
+
+def add_day_selection(parser: argparse.ArgumentParser, /) -> None:
+    """Add the arguments used to select which days to operate on"""
+
+    parser.add_argument("year", type=int, nargs="?", help="e.g. 2024")
+    parser.add_argument("day", type=int, nargs="?", help="e.g. 5 (default: all)")
+    parser.add_argument("--all", action="store_true", help="select every day")
+
+
+def add_backend(parser: argparse.ArgumentParser, /) -> None:
+    """Add the option choosing what kind of workers run in parallel"""
+
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        help="run workers as processes or threads "
+        "(default: threads on free-threaded builds, otherwise processes)",
+    )
+
+
+def add_fused(parser: argparse.ArgumentParser, /, *, default: bool) -> None:
+    """Add the argument used to choose between fused & separate solving of parts"""
+
+    parser.add_argument(
+        "--fused",
+        action=argparse.BooleanOptionalAction,
+        default=default,
+        help="solve both parts in a single pass, for days which support it",
+    )
+
+
+def add_engine(parser: argparse.ArgumentParser, /, *, every: bool = False) -> None:
+    """Add the argument used to pick which engine solves days with several"""
+
+    parser.add_argument(
+        "--engine",
+        metavar="NAME",
+        help="solve days with several engines using the one named"
+        + (
+            f", or with '{ENGINE_ALL}' of them, failing any whose answers differ "
+            "from the reference engine's"
+            if every
+            else ""
+        )
+        + " (default: picked by input size)",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for all commands"""
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="aoc", description=__doc__
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run: argparse.ArgumentParser = commands.add_parser(
+        "run", help="run solutions and report their answers & timings"
+    )
+    add_day_selection(run)
+    run.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="run days concurrently across N workers (default: 1)",
+    )
+    add_backend(run)
+    run.add_argument(
+        "--parse-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="load parsed inputs from (and store them in) the on-disk parse cache, "
+        "so the parse phase times loading them instead",
+    )
+    run.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="skip solving parts whose answer is cached for the same input & source",
+    )
+    run.add_argument(
+        "--cache-size",
+        type=positive_int,
+        default=DEFAULT_MAX_ANSWERS,
+        help="answers kept in the cache, evicting the least recently used "
+        f"(default: {DEFAULT_MAX_ANSWERS})",
+    )
+    run.add_argument(
+        "--profile",
+        type=Path,
+        nargs="?",
+        const=profiling.DEFAULT_DIRECTORY,
+        metavar="DIR",
+        help="profile each phase with cProfile, writing .pstats & collapsed stacks "
+        f"to DIR (default: {profiling.DEFAULT_DIRECTORY})",
+    )
+    run.add_argument(
+        "--sample",
+        type=positive_int,
+        nargs="?",
+        const=sampling.DEFAULT_RATE,
+        metavar="HZ",
+        help="profile each phase by sampling its stack HZ times a second, rather "
+        "than with cProfile, writing the hottest lines & collapsed stacks to the "
+        f"--profile DIR (default rate: {sampling.DEFAULT_RATE})",
+    )
+    run.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace the peak memory & top allocation sites of each phase",
+    )
+    run.add_argument(
+        "--memory-budget",
+        type=byte_size,
+        metavar="SIZE",
+        help="fail days whose peak memory in any phase exceeds SIZE, e.g. 64M "
+        "(implies --memory)",
+    )
+    run.add_argument(
+        "--counters",
+        action="store_true",
+        help="count the work done by each phase, e.g. calls of hot functions "
+        "(for days declaring `COUNTERS`)",
+    )
+    run.add_argument(
+        "--json",
+        action="store_true",
+        help="report a JSON line per day (and engine), rather than a table",
+    )
+    add_fused(run, default=True)
+    run.add_argument(
+        "--parallel-parts",
+        action="store_true",
+        help="solve both parts concurrently in worker processes, which share the "
+        "parsed input through shared memory (for days exposing `export_input`)",
+    )
+    add_engine(run, every=True)
+    inputs = run.add_mutually_exclusive_group()
+    inputs.add_argument(
+        "--input",
+        type=Path,
+        metavar="PATH",
+        help="run a single day against the input at PATH, rather than its own: "
+        "- for stdin, or a .gz/.xz/.bz2 file to decompress as it's read",
+    )
+    inputs.add_argument(
+        "--inputs",
+        type=Path,
+        metavar="DIR",
+        help="run a single day against every input file in DIR, across --jobs "
+        "workers, printing a JSON line per input then the throughput",
+    )
+    run.set_defaults(handler=command_run)
+
+    bench_: argparse.ArgumentParser = commands.add_parser(
+        "bench", help="benchmark each phase of solutions over repeated runs"
+    )
+    add_day_selection(bench_)
+    bench_.add_argument(
+        "--warmup",
+        type=non_negative_int,
+        default=bench.DEFAULT_WARMUP,
+        help=f"unrecorded iterations per day (default: {bench.DEFAULT_WARMUP})",
+    )
+    bench_.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=bench.DEFAULT_REPEAT,
+        help=f"recorded iterations per day (default: {bench.DEFAULT_REPEAT})",
+    )
+    bench_.add_argument(
+        "-o", "--output", type=Path, help="write the results as a JSON baseline"
+    )
+    bench_.add_argument(
+        "--compare", type=Path, help="compare the results against a JSON baseline"
+    )
+    bench_.add_argument(
+        "--threshold",
+        type=float,
+        default=bench.DEFAULT_THRESHOLD,
+        help="relative slowdown that counts as a regression "
+        f"(default: {bench.DEFAULT_THRESHOLD})",
+    )
+    bench_.add_argument(
+        "--metric",
+        choices=bench.METRICS,
+        default=bench.DEFAULT_METRIC,
+        help="statistic to compare against the baseline "
+        f"(default: {bench.DEFAULT_METRIC})",
+    )
+    bench_.add_argument(
+        "--parse-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help="time loading parsed inputs from the on-disk parse cache, "
+        "rather than parsing them",
+    )
+    # Benchmarks time each part (against a baseline of parts), so fusing is opt-in
+    add_fused(bench_, default=False)
+    add_engine(bench_)
+    bench_.set_defaults(handler=command_bench)
+
+    generate_: argparse.ArgumentParser = commands.add_parser(
+        "generate", help="generate a synthetic input for a day"
+    )
+    add_day_selection(generate_)
+    size = generate_.add_mutually_exclusive_group()
+    size.add_argument(
+        "--size", type=positive_int, help="size of the input (meaning varies per day)"
+    )
+    size.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="size of the input, relative to the real input (default: 1.0)",
+    )
+    generate_.add_argument(
+        "--seed",
+        type=int,
+        default=generate.DEFAULT_SEED,
+        help=f"seed for the random number generator (default: {generate.DEFAULT_SEED})",
+    )
+    generate_.add_argument(
+        "--param",
+        type=parameter,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="day-specific generator parameter, e.g. max_operands=20",
+    )
+    generate_.add_argument(
+        "-o",
+        "--output",
+        default=generate.STDOUT,
+        help="file to write the input to (default: stdout)",
+    )
+    generate_.set_defaults(handler=command_generate)
+
+    complexity_: argparse.ArgumentParser = commands.add_parser(
+        "complexity",
+        help="fit how each phase's runtime scales across generated input sizes",
+    )
+    add_day_selection(complexity_)
+    complexity_.add_argument(
+        "--min-scale",
+        type=float,
+        default=complexity.DEFAULT_MIN_SCALE,
+        help="smallest input size, relative to the real input "
+        f"(default: {complexity.DEFAULT_MIN_SCALE})",
+    )
+    complexity_.add_argument(
+        "--factor",
+        type=float,
+        default=complexity.DEFAULT_FACTOR,
+        help=f"growth factor between sizes (default: {complexity.DEFAULT_FACTOR})",
+    )
+    complexity_.add_argument(
+        "--steps",
+        type=positive_int,
+        default=complexity.DEFAULT_STEPS,
+        help=f"number of sizes (default: {complexity.DEFAULT_STEPS})",
+    )
+    complexity_.add_argument(
+        "--seed",
+        type=int,
+        default=generate.DEFAULT_SEED,
+        help=f"seed for the input generators (default: {generate.DEFAULT_SEED})",
+    )
+    complexity_.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=complexity.DEFAULT_REPEAT,
+        help="runs per size, keeping the fastest "
+        f"(default: {complexity.DEFAULT_REPEAT})",
+    )
+    complexity_.add_argument(
+        "--time-limit",
+        type=float,
+        default=complexity.DEFAULT_TIME_LIMIT,
+        help="stop growing a day's input once a run takes this many seconds "
+        f"(default: {complexity.DEFAULT_TIME_LIMIT})",
+    )
+    complexity_.add_argument(
+        "--tolerance",
+        type=float,
+        default=complexity.DEFAULT_TOLERANCE,
+        help="exponent above 1 tolerated before flagging a phase as super-linear "
+        f"(default: {complexity.DEFAULT_TOLERANCE})",
+    )
+    complexity_.add_argument(
+        "--csv", type=Path, help="write every measurement to a CSV file"
+    )
+    add_engine(complexity_)
+    complexity_.set_defaults(handler=command_complexity)
+
+    fuzz_: argparse.ArgumentParser = commands.add_parser(
+        "fuzz",
+        help="compare each engine's answers with the reference engine's on small "
+        "generated inputs, shrinking any mismatching input",
+    )
+    add_day_selection(fuzz_)
+    fuzz_.add_argument(
+        "--cases",
+        type=positive_int,
+        default=fuzz.DEFAULT_CASES,
+        help=f"inputs generated per day (default: {fuzz.DEFAULT_CASES})",
+    )
+    fuzz_.add_argument(
+        "--max-size",
+        type=positive_int,
+        default=fuzz.DEFAULT_MAX_SIZE,
+        help="largest size of input generated, in the generator's units "
+        f"(default: {fuzz.DEFAULT_MAX_SIZE})",
+    )
+    fuzz_.add_argument(
+        "--seed",
+        type=int,
+        default=generate.DEFAULT_SEED,
+        help="seed from which each input's seed is drawn "
+        f"(default: {generate.DEFAULT_SEED})",
+    )
+    fuzz_.add_argument(
+        "--param",
+        type=parameter,
+        action="append",
+        default=[],
+        metavar="NAME=VALUE",
+        help="day-specific generator parameter, e.g. pages=5",
+    )
+    fuzz_.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        metavar="DIR",
+        help="directory to write each shrunk, mismatching input to",
+    )
+    fuzz_.set_defaults(handler=command_fuzz)
+
+    mapreduce_: argparse.ArgumentParser = commands.add_parser(
+        "mapreduce",
+        help="solve a single huge input by splitting it into chunks of lines "
+        "(or its parsed items into shards), solved across workers",
+    )
+    add_day_selection(mapreduce_)
+    mapreduce_.add_argument(
+        "--input",
+        type=Path,
+        metavar="PATH",
+        help="(plain) input file to split (default: the day's own input)",
+    )
+    mapreduce_.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="workers (default: one per CPU)",
+    )
+    add_backend(mapreduce_)
+    mapreduce_.add_argument(
+        "--chunks",
+        type=positive_int,
+        help="chunks (or shards) to split the input into "
+        f"(default: {mapreduce.CHUNKS_PER_JOB} per worker)",
+    )
+    mapreduce_.add_argument(
+        "--parsed",
+        action="store_true",
+        help="parse the input once, then shard its parsed items across workers "
+        "(any input, including stdin & compressed files)",
+    )
+    mapreduce_.set_defaults(handler=command_mapreduce)
+
+    microbench_: argparse.ArgumentParser = commands.add_parser(
+        "microbench", help="compare alternative implementations of an operation"
+    )
+    microbench_.add_argument("suite", choices=microbench.SUITES)
+    microbench_.add_argument(
+        "--size", type=positive_int, help="size of the workload (default: per suite)"
+    )
+    microbench_.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=microbench.DEFAULT_REPEAT,
+        help=f"timed repetitions (default: {microbench.DEFAULT_REPEAT})",
+    )
+    microbench_.add_argument(
+        "--number",
+        type=positive_int,
+        default=microbench.DEFAULT_NUMBER,
+        help=f"calls per repetition (default: {microbench.DEFAULT_NUMBER})",
+    )
+    microbench_.set_defaults(handler=command_microbench)
+
+    import_profile: argparse.ArgumentParser = commands.add_parser(
+        "import-profile",
+        help="profile importing each solution in a fresh interpreter "
+        "(with -X importtime), slowest first",
+    )
+    add_day_selection(import_profile)
+    import_profile.add_argument(
+        "--repeat",
+        type=positive_int,
+        default=imports.DEFAULT_REPEAT,
+        help="imports per day, keeping the fastest "
+        f"(default: {imports.DEFAULT_REPEAT})",
+    )
+    import_profile.add_argument(
+        "--top",
+        type=non_negative_int,
+        default=imports.DEFAULT_TOP,
+        help="slowest imports listed per day, by their own time "
+        f"(default: {imports.DEFAULT_TOP})",
+    )
+    import_profile.add_argument(
+        "--budget",
+        type=float,
+        metavar="MS",
+        help="fail days which take longer than MS milliseconds to import",
+    )
+    import_profile.set_defaults(handler=command_import_profile)
+
+    serve: argparse.ArgumentParser = commands.add_parser(
+        "serve",
+        help="serve requests to solve days (from `python -m aoc.client`) on a Unix "
+        "socket, from worker processes with every solution already imported",
+    )
+    serve.add_argument(
+        "--socket",
+        type=Path,
+        metavar="PATH",
+        help="socket to listen on "
+        "(default: aoc-<uid>.sock in $XDG_RUNTIME_DIR, or /tmp)",
+    )
+    serve.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=os.cpu_count() or 1,
+        help="requests solved at once, by as many worker processes "
+        "(default: one per CPU)",
+    )
+    serve.set_defaults(handler=command_serve)
+
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None, /) -> None:
+    """Parse the command-line arguments and dispatch to the chosen command"""
+
+    parser: argparse.ArgumentParser = build_parser()
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    if "year" in args and args.year is None and not args.all:
+        parser.error("either a year (and optionally a day) or --all is required")
+
+    if getattr(args, "inputs", None) is not None and (
+        args.profile is not None or args.sample is not None
+    ):
+        parser.error("--profile & --sample can't be combined with --inputs")
+
+    if getattr(args, "inputs", None) is not None and args.engine == ENGINE_ALL:
+        parser.error(f"--engine {ENGINE_ALL} can't be combined with --inputs")
+
+    if args.command in ("bench", "complexity") and args.engine == ENGINE_ALL:
+        parser.error(f"--engine {ENGINE_ALL} is only supported by run")
+
+    # Profiling, tracing memory & counting work are process-wide, so would mix up
+    # worker threads
+    if (
+        args.command == "run"
+        and args.jobs > 1
+        and resolve_backend(args.backend) == BACKEND_THREAD
+        and (
+            args.profile is not None
+            or args.sample is not None
+            or args.memory
+            or args.memory_budget is not None
+            or args.counters
+        )
+    ):
+        parser.error(
+            "--profile, --sample, --memory & --counters can't be combined with "
+            "worker threads"
+        )
+
+    # Exiting from outside the `try`, as the errors caught are looked up as any
+    # exception passes through it (importing any lazily imported module they're in)
+    status: int = 0
+
+    try:
+        status = args.handler(args)
+    except (
+        DayNotFoundError,
+        batch.InputsNotFoundError,
+        fuzz.FuzzingNotSupportedError,
+        daemon.DaemonRunningError,
+        mapreduce.ChunkingNotSupportedError,
+        generate.GeneratorNotFoundError,
+        generate.GeneratorParameterError,
+        microbench.SuiteNotFoundError,
+    ) as error:
+        parser.error(str(error))
+
+    sys.exit(status)
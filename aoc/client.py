@@ -0,0 +1,118 @@
+"""
+Thin client for the warm daemon (`python -m aoc serve`), e.g.
+`python -m aoc.client 2024 7 --input equations.txt`
+
+Only the standard library modules needed to talk to the daemon are imported, so
+the client starts (far) quicker than the runner. It prints the daemon's response
+as a JSON line, along with how long the client took to start, the round trip to
+the daemon, the solve itself, and the import cost the daemon paid once up front.
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import time
+from pathlib import Path
+from typing import IO, Any, Final, Mapping, Optional, Sequence
+
+# Constants
+ENCODING: Final[str] = "utf-8"  # Requests & responses are JSON, one per line
+FILENAME_SOCKET: Final[str] = "aoc-{uid}.sock"
+
+
+def default_socket_path() -> Path:
+    """Per-user socket, in `$XDG_RUNTIME_DIR` (if set) or `/tmp`"""
+
+    return Path(
+        os.environ.get("XDG_RUNTIME_DIR") or "/tmp",
+        FILENAME_SOCKET.format(uid=os.getuid()),
+    )
+
+
+def request(
+    year: int,
+    day: int,
+    input_path: Optional[Path] = None,
+    /,
+    *,
+    socket_path: Optional[Path] = None,
+) -> Mapping[str, Any]:
+    """
+    Ask the daemon to solve a day, against an input (by default, the day's own)
+
+    Relative input paths are resolved against the client's working directory, as
+    the daemon has its own.
+    """
+
+    payload: Mapping[str, Any] = {
+        "year": year,
+        "day": day,
+        "input": str(input_path.resolve()) if input_path is not None else None,
+    }
+
+    connection: socket.socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(str(socket_path or default_socket_path()))
+
+        stream: IO[str]
+        with connection.makefile("rw", encoding=ENCODING) as stream:
+            stream.write(json.dumps(payload) + "\n")
+            stream.flush()
+
+            return json.loads(stream.readline())
+
+
+def main(argv: Optional[Sequence[str]] = None, /) -> None:
+    """Parse the command-line arguments, then request (and time) a single day"""
+
+    # CPU time so far is that of the interpreter starting & importing the client,
+    # as it's CPU bound (and unlike wall time, is measured from process creation)
+    startup: float = time.process_time()
+
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m aoc.client", description=__doc__.split("\n\n")[0]
+    )
+    parser.add_argument("year", type=int, help="e.g. 2024")
+    parser.add_argument("day", type=int, help="e.g. 5")
+    parser.add_argument(
+        "--input",
+        type=Path,
+        metavar="PATH",
+        help="input to solve, rather than the day's own",
+    )
+    parser.add_argument(
+        "--socket",
+        type=Path,
+        metavar="PATH",
+        help="socket the daemon is listening on "
+        "(default: aoc-<uid>.sock in $XDG_RUNTIME_DIR, or /tmp)",
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+    socket_path: Path = args.socket or default_socket_path()
+
+    started: float = time.perf_counter()
+
+    try:
+        response: Mapping[str, Any] = request(
+            args.year, args.day, args.input, socket_path=socket_path
+        )
+    except OSError as error:
+        parser.error(f"can't reach the daemon at {socket_path} ({error})")
+
+    print(
+        json.dumps(
+            {
+                **response,
+                "startup_s": startup,
+                "round_trip_s": time.perf_counter() - started,
+            }
+        )
+    )
+
+    sys.exit(0 if response.get("ok") else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+"""Empirical complexity: how each phase's runtime scales with its input size"""
+
+import math
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    Final,
+    Iterable,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+)
+
+from aoc.bench import DayBenchmark, benchmark_day
+from aoc.discovery import Day
+from aoc.generate import DEFAULT_SEED, resolve_size, write_input
+from aoc.lazy import lazy_import
+from aoc.reader import FILENAME_INPUT
+from aoc.report import PLACEHOLDER, format_seconds, format_table
+from aoc.runner import Phase
+
+# Only needed once days are measured (or their measurements written)
+csv: ModuleType = lazy_import("csv")
+statistics: ModuleType = lazy_import("statistics")
+tempfile: ModuleType = lazy_import("tempfile")
+
+# Constants
+DEFAULT_MIN_SCALE: Final[float] = 0.25
+DEFAULT_FACTOR: Final[float] = 2.0
+DEFAULT_STEPS: Final[int] = 5
+DEFAULT_REPEAT: Final[int] = 3
+DEFAULT_TIME_LIMIT: Final[float] = 10.0
+DEFAULT_TOLERANCE: Final[float] = 0.15
+CSV_FIELDS: Final[Sequence[str]] = (
+    "year",
+    "day",
+    "phase",
+    "scale",
+    "size",
+    "bytes",
+    "seconds",
+    "exponent",
+    "engine",
+)
+
+
+# Models
+@dataclass(frozen=True)
+class Measurement:
+    """Fastest observed runtime of a phase on a generated input"""
+
+    phase: Phase
+    scale: float
+    size: int
+    bytes: int
+    seconds: float
+    engine: Optional[str] = None  # Of days with several (see `aoc.engines`)
+
+
+@dataclass(frozen=True)
+class Fit:
+    """Least-squares fit of `seconds = c * bytes ** exponent` (in log-log space)"""
+
+    exponent: float
+    r_squared: float
+
+
+@dataclass
+class DayComplexity:
+    """Measurements of every phase of a day, across a ladder of input sizes"""
+
+    day: Day
+    measurements: MutableSequence[Measurement] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def phases(self) -> Sequence[Phase]:
+        """The phases that were measured (in execution order)"""
+
+        return tuple(dict.fromkeys(m.phase for m in self.measurements))
+
+    def get_measurements(self, phase: Phase, /) -> Sequence[Measurement]:
+        """Get the measurements of a single phase, ordered by input size"""
+
+        return tuple(m for m in self.measurements if m.phase is phase)
+
+    def fit(self, phase: Phase, /) -> Optional[Fit]:
+        """Fit a power law to a phase's measurements (if there are enough of them)"""
+
+        return fit_power_law(
+            [(m.bytes, m.seconds) for m in self.get_measurements(phase)]
+        )
+
+
+def size_ladder(
+    *,
+    min_scale: float = DEFAULT_MIN_SCALE,
+    factor: float = DEFAULT_FACTOR,
+    steps: int = DEFAULT_STEPS,
+) -> Sequence[float]:
+    """Build a geometric ladder of scales, e.g. 0.25, 0.5, 1, 2, 4"""
+
+    return tuple(min_scale * factor**step for step in range(steps))
+
+
+def fit_power_law(points: Sequence[Tuple[int, float]], /) -> Optional[Fit]:
+    """Fit a power law to (size, seconds) points, via linear regression of their logs"""
+
+    # Points must be positive (to take their logs), and of at least two sizes
+    usable: Sequence[Tuple[int, float]] = [
+        (size, seconds) for size, seconds in points if size > 0 and seconds > 0
+    ]
+
+    if len({size for size, _ in usable}) < 2:
+        return None
+
+    xs: Sequence[float] = [math.log(size) for size, _ in usable]
+    ys: Sequence[float] = [math.log(seconds) for _, seconds in usable]
+
+    slope: float
+    slope, _ = statistics.linear_regression(xs, ys)
+
+    r_squared: float = (
+        statistics.correlation(xs, ys) ** 2 if len(set(ys)) > 1 else 1.0
+    )
+
+    return Fit(exponent=slope, r_squared=r_squared)
+
+
+def measure_day(
+    day: Day,
+    /,
+    *,
+    scales: Iterable[float],
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+    engine: Optional[str] = None,
+) -> DayComplexity:
+    """
+    Measure each phase of a day's solution on generated inputs of increasing size
+
+    Each phase's fastest time over `repeat` runs is recorded. Climbing the ladder
+    stops early once a single run of the solution exceeds `time_limit` seconds.
+    Days with several engines are measured with the one named, or otherwise the one
+    picked for each input's size (so may switch engines as the ladder is climbed).
+    """
+
+    complexity: DayComplexity = DayComplexity(day)
+
+    directory: str
+    with tempfile.TemporaryDirectory(prefix="aoc-complexity-") as directory:
+        path: Path = Path(directory) / FILENAME_INPUT
+
+        scale: float
+        for scale in scales:
+            size: int = resolve_size(day, scale=scale)
+
+            write_input(day, path, size=size, seed=seed)
+
+            benchmark: DayBenchmark = benchmark_day(
+                day, warmup=0, repeat=repeat, directory=Path(directory), engine=engine
+            )
+
+            if benchmark.error is not None:
+                complexity.error = f"at scale {scale:g}: {benchmark.error}"
+                break
+
+            complexity.measurements.extend(
+                Measurement(
+                    phase=phase,
+                    scale=scale,
+                    size=size,
+                    bytes=path.stat().st_size,
+                    seconds=min(phase_benchmark.samples),
+                    engine=benchmark.engine,
+                )
+                for phase, phase_benchmark in benchmark.phases.items()
+            )
+
+            if (
+                sum(min(pb.samples) for pb in benchmark.phases.values())
+                > time_limit
+            ):
+                break
+
+    return complexity
+
+
+def measure_days(
+    days: Iterable[Day],
+    /,
+    *,
+    scales: Sequence[float],
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+    time_limit: float = DEFAULT_TIME_LIMIT,
+    engine: Optional[str] = None,
+) -> Iterable[DayComplexity]:
+    """Measure each day's solution in turn"""
+
+    return (
+        measure_day(
+            day,
+            scales=scales,
+            seed=seed,
+            repeat=repeat,
+            time_limit=time_limit,
+            engine=engine,
+        )
+        for day in days
+    )
+
+
+def write_csv(file: TextIO, complexities: Iterable[DayComplexity], /) -> None:
+    """Write every measurement (alongside its phase's fitted exponent) as CSV"""
+
+    writer = csv.writer(file)
+    writer.writerow(CSV_FIELDS)
+
+    complexity: DayComplexity
+    for complexity in complexities:
+        fits: Mapping[Phase, Optional[Fit]] = {
+            phase: complexity.fit(phase) for phase in complexity.phases
+        }
+
+        measurement: Measurement
+        for measurement in complexity.measurements:
+            fit: Optional[Fit] = fits[measurement.phase]
+
+            writer.writerow(
+                (
+                    complexity.day.year,
+                    complexity.day.day,
+                    measurement.phase,
+                    measurement.scale,
+                    measurement.size,
+                    measurement.bytes,
+                    f"{measurement.seconds:.6f}",
+                    "" if fit is None else f"{fit.exponent:.3f}",
+                    measurement.engine or "",
+                )
+            )
+
+
+def format_complexities(
+    complexities: Iterable[DayComplexity],
+    /,
+    *,
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> str:
+    """Format each phase's fitted exponent into a table, flagging super-linear ones"""
+
+    rows: MutableSequence[Sequence[str]] = [
+        (
+            "Year",
+            "Day",
+            "Phase",
+            "Sizes",
+            "Bytes",
+            "Slowest (s)",
+            "Exponent",
+            "R²",
+            "Status",
+        )
+    ]
+
+    complexity: DayComplexity
+    for complexity in complexities:
+        phase: Phase
+        for phase in complexity.phases:
+            measurements: Sequence[Measurement] = complexity.get_measurements(phase)
+            fit: Optional[Fit] = complexity.fit(phase)
+
+            status: str = "-"
+            if fit is not None:
+                status = (
+                    "super-linear" if fit.exponent > 1 + tolerance else "ok"
+                )
+
+            rows.append(
+                (
+                    str(complexity.day.year),
+                    str(complexity.day.day),
+                    str(phase),
+                    str(len(measurements)),
+                    f"{measurements[0].bytes}-{measurements[-1].bytes}",
+                    format_seconds(measurements[-1].seconds),
+                    PLACEHOLDER if fit is None else f"{fit.exponent:.2f}",
+                    PLACEHOLDER if fit is None else f"{fit.r_squared:.2f}",
+                    status,
+                )
+            )
+
+        if complexity.error is not None:
+            rows.append(
+                (
+                    str(complexity.day.year),
+                    str(complexity.day.day),
+                    *("",) * 6,
+                    f"error ({complexity.error})",
+                )
+            )
+
+    return format_table(rows)
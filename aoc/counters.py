@@ -0,0 +1,143 @@
+"""Counters of the work done by a solution's hot functions (e.g. calls, or depth)"""
+
+import contextlib
+import functools
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# Constants
+KIND_CALLS: Final[str] = "calls"
+KIND_ITEMS: Final[str] = "items"  # Yielded by a generator function
+KIND_DEPTH: Final[str] = "depth"  # Of the deepest (recursive) call
+KINDS: Final[Sequence[str]] = (KIND_CALLS, KIND_ITEMS, KIND_DEPTH)
+
+
+# Models
+# Counters are named tuples, rather than dataclasses, for the same reason engines are
+# (see `aoc.engines`): they're declared by days which avoid importing `dataclasses`
+class Counter(NamedTuple):
+    """
+    A count of some of a solution's work, made by instrumenting one of its functions
+
+    The function (or method) is named relative to the solution's module, e.g.
+    `RuleMachine.fix`. Counters of the same name add up (or, for depths, take the
+    deepest), so engines doing the same work in different functions compare.
+    """
+
+    name: str
+    target: str
+    kind: str = KIND_CALLS
+
+
+def instrument(
+    function: Callable[..., Any],
+    counts: MutableMapping[str, int],
+    counter: Counter,
+    /,
+) -> Callable[..., Any]:
+    """Wrap a function, counting its calls, the items it yields, or its depth"""
+
+    name: str = counter.name
+
+    if counter.kind == KIND_ITEMS:
+
+        @functools.wraps(function)
+        def count_items(*args: Any, **kwargs: Any) -> Iterator[Any]:
+            item: Any
+            for item in function(*args, **kwargs):
+                counts[name] += 1
+                yield item
+
+        return count_items
+
+    if counter.kind == KIND_DEPTH:
+        depth: int = 0
+
+        @functools.wraps(function)
+        def count_depth(*args: Any, **kwargs: Any) -> Any:
+            nonlocal depth
+            depth += 1
+            counts[name] = max(counts[name], depth)
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                depth -= 1
+
+        return count_depth
+
+    @functools.wraps(function)
+    def count_calls(*args: Any, **kwargs: Any) -> Any:
+        counts[name] += 1
+        return function(*args, **kwargs)
+
+    return count_calls
+
+
+@contextlib.contextmanager
+def count(
+    module: ModuleType, counters: Sequence[Counter], /
+) -> Iterator[Mapping[str, int]]:
+    """
+    Count a solution's work within the context, by instrumenting its functions
+
+    Functions are only replaced (in their module, or class) within the context, so
+    counting costs nothing otherwise. They're replaced for every thread though, so
+    only a single thread may count at a time.
+
+    Example:
+        >>> module = ModuleType("example")
+        >>> exec("def f(n):\\n    return n and f(n - 1)", vars(module))
+        >>> counters = (Counter("f", "f"), Counter("f_depth", "f", KIND_DEPTH))
+        >>> with count(module, counters) as counts:
+        ...     _ = module.f(3)
+        >>> assert counts == {"f": 4, "f_depth": 4}
+    """
+
+    counts: MutableMapping[str, int] = dict.fromkeys(
+        (counter.name for counter in counters), 0
+    )
+    # What each replaced attribute was (`None` if it was inherited), to restore it
+    replaced: MutableSequence[Tuple[Any, str, Optional[Any]]] = []
+
+    try:
+        counter: Counter
+        for counter in counters:
+            if counter.kind not in KINDS:
+                raise ValueError(f"{counter.name!r} has no kind {counter.kind!r}")
+
+            owner: Any = module
+            attribute: str
+            *path, attribute = counter.target.split(".")
+
+            part: str
+            for part in path:
+                owner = getattr(owner, part)
+
+            replaced.append((owner, attribute, vars(owner).get(attribute)))
+            setattr(
+                owner,
+                attribute,
+                instrument(getattr(owner, attribute), counts, counter),
+            )
+
+        yield counts
+    finally:
+        original: Optional[Any]
+        for owner, attribute, original in reversed(replaced):
+            if original is None:
+                delattr(owner, attribute)
+            else:
+                setattr(owner, attribute, original)
@@ -0,0 +1,161 @@
+"""Warm daemon, solving days on request over a Unix domain socket"""
+
+import json
+import multiprocessing
+import signal
+import socket
+import socketserver
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Final, Mapping, Optional, Sequence
+
+from aoc.client import ENCODING
+from aoc.discovery import Day, discover_days, find_days, load_module
+from aoc.runner import PARTS, DayResult, RunOptions, describe_error, run_day
+
+# Constants
+# Workers are started afresh (each importing every day), rather than forked from
+# the daemon once its threads are serving requests
+START_METHOD: Final[str] = "spawn"
+
+# Time each worker took to import every solution, as it started
+_preload_time: Optional[float] = None
+
+
+# Exceptions
+class DaemonRunningError(Exception):
+    """Exception thrown when a daemon is already listening on the socket"""
+
+
+def preload_days() -> None:
+    """Import every day's solution (in each worker, as it starts)"""
+
+    global _preload_time
+
+    # Interrupts (e.g. Ctrl-C, sent to the whole process group) are the daemon's to
+    # handle, which then shuts its workers down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    started: float = time.perf_counter()
+
+    day: Day
+    for day in discover_days():
+        load_module(day)
+
+    _preload_time = time.perf_counter() - started
+
+
+def solve(year: int, day: int, input_path: Optional[str], /) -> Mapping[str, Any]:
+    """Solve a day (in a worker, whose solutions are already imported)"""
+
+    days: Sequence[Day] = find_days(year, day)
+    result: DayResult = run_day(
+        days[0],
+        RunOptions(input_path=Path(input_path) if input_path is not None else None),
+    )
+
+    return {
+        "year": year,
+        "day": day,
+        "ok": result.ok,
+        "error": result.error,
+        **{str(phase): result.answer(phase) for phase in PARTS},
+        "solve_s": result.timing.wall,
+        "preload_s": _preload_time,
+    }
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Handles a connection's requests (one JSON line each), in its own thread"""
+
+    server: "Daemon"
+
+    def handle(self) -> None:
+        line: bytes
+        for line in self.rfile:
+            response: Mapping[str, Any]
+
+            try:
+                payload: Mapping[str, Any] = json.loads(line)
+                future: Future[Mapping[str, Any]] = self.server.executor.submit(
+                    solve,
+                    int(payload["year"]),
+                    int(payload["day"]),
+                    payload.get("input"),
+                )
+                response = future.result()
+            except Exception as error:
+                # A malformed request, an unknown day, or the worker itself failed
+                response = {"ok": False, "error": describe_error(error)}
+
+            self.wfile.write((json.dumps(response) + "\n").encode(ENCODING))
+            self.wfile.flush()
+
+
+class Daemon(socketserver.ThreadingUnixStreamServer):
+    """
+    Serves requests concurrently, across a pool of warm worker processes
+
+    Each connection is handled by its own thread, which hands its requests to the
+    pool, so up to `jobs` days are solved at once.
+    """
+
+    daemon_threads = True
+
+    executor: ProcessPoolExecutor
+
+    def __init__(self, socket_path: Path, /, *, jobs: int = 1) -> None:
+        replace_stale_socket(socket_path)
+
+        self.executor = ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context(START_METHOD),
+            initializer=preload_days,
+        )
+
+        # Start (and warm) every worker up front, rather than on the first requests:
+        # workers are started on demand, while none are idle
+        warmups: Sequence[Future[None]] = [
+            self.executor.submit(time.sleep, 0) for _ in range(jobs)
+        ]
+
+        future: Future[None]
+        for future in warmups:
+            future.result()
+
+        super().__init__(str(socket_path), RequestHandler)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown(cancel_futures=True)
+        Path(str(self.server_address)).unlink(missing_ok=True)
+
+
+def replace_stale_socket(socket_path: Path, /) -> None:
+    """Remove a socket left behind by a daemon which is no longer running"""
+
+    if not socket_path.exists():
+        return
+
+    probe: socket.socket
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(str(socket_path))
+        except ConnectionRefusedError:
+            socket_path.unlink()
+            return
+
+    raise DaemonRunningError(f"A daemon is already listening on {socket_path}")
+
+
+def serve(daemon: Daemon, /) -> None:
+    """Serve requests until interrupted (or terminated)"""
+
+    # Terminate as gracefully as an interrupt does
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,164 @@
+"""Exact digit arithmetic on (arbitrary-precision, non-negative) integers"""
+
+import functools
+from typing import Final, Iterable, Optional, Sequence, Tuple
+
+# Constants
+TABLE_DIGITS: Final[int] = 64  # Powers of ten up to 10**TABLE_DIGITS are tabled
+POWERS_OF_TEN: Final[Sequence[int]] = tuple(10**k for k in range(TABLE_DIGITS + 1))
+# Digits of the smallest integer of each bit length (all below the largest tabled
+# power of ten), which those of the same bit length have either as many of, or one
+# more than
+DIGITS_BY_BIT_LENGTH: Final[Sequence[int]] = (
+    1,
+    *(len(str(1 << (bits - 1))) for bits in range(1, POWERS_OF_TEN[-1].bit_length())),
+)
+
+# floor(log10(2) * 2**31), which slightly underestimates log10(2), so digit counts
+# estimated with it never overshoot (and are then corrected upwards)
+LOG10_2_NUMERATOR: Final[int] = 646_456_993
+LOG10_2_SHIFT: Final[int] = 31
+
+
+@functools.lru_cache(maxsize=1024)
+def _pow10(exponent: int, /) -> int:
+    return 10**exponent
+
+
+def pow10(exponent: int, /) -> int:
+    """
+    10 to the power of a (non-negative) exponent, from a table or cache
+
+    Example:
+        >>> assert pow10(3) == 1000
+    """
+
+    if exponent <= TABLE_DIGITS:
+        return POWERS_OF_TEN[exponent]
+
+    return _pow10(exponent)
+
+
+def int_len(integer: int, /) -> int:
+    """
+    Number of (decimal) digits in a non-negative integer, exactly
+
+    Small integers are looked up in a table by their bit length, then corrected by
+    comparison with a power of ten. Larger ones are estimated from their bit length,
+    then corrected the same way, so unlike `math.log10` this is exact at any size.
+
+    Example:
+        >>> assert [int_len(n) for n in (0, 9, 10, 10**100 - 1, 10**100)] == [
+        ...     1, 1, 2, 100, 101
+        ... ]
+    """
+
+    bits: int = integer.bit_length()
+
+    if bits < len(DIGITS_BY_BIT_LENGTH):
+        # (`0` has a digit too, and is never at least `10**1`)
+        digits: int = DIGITS_BY_BIT_LENGTH[bits]
+
+        return digits + (integer >= POWERS_OF_TEN[digits])
+
+    # 2**(bits - 1) <= integer, so this is at most floor(log10(integer))...
+    exponent: int = ((bits - 1) * LOG10_2_NUMERATOR) >> LOG10_2_SHIFT
+
+    # ... and (for any integer that fits in memory) short of it by at most one
+    while integer >= pow10(exponent + 1):
+        exponent += 1
+
+    return exponent + 1
+
+
+def int_split(integer: int, width: int, /) -> Tuple[int, int]:
+    """
+    Split an integer into its leading digits and its trailing `width` digits
+
+    Example:
+        >>> assert int_split(123405, 2) == (1234, 5)
+    """
+
+    return divmod(integer, pow10(width))
+
+
+def int_join(high: int, low: int, width: int, /) -> int:
+    """
+    Join leading digits onto `width` trailing digits (the inverse of `int_split`)
+
+    Example:
+        >>> assert int_join(1234, 5, 2) == 123405
+    """
+
+    return high * pow10(width) + low
+
+
+def concat(a: int, b: int, /) -> int:
+    """
+    Concatenate the digits of two integers, e.g. `12 || 345 = 12345`
+
+    Example:
+        >>> assert concat(12, 345) == 12345
+        >>> assert concat(12, 0) == 120
+    """
+
+    return a * pow10(int_len(b)) + b
+
+
+def int_repeat(block: int, times: int, width: Optional[int] = None, /) -> int:
+    """
+    Repeat the digits of an integer, padding it to `width` digits (if given)
+
+    Example:
+        >>> assert int_repeat(12, 3) == 121212
+        >>> assert int_repeat(1, 2, 2) == 101
+    """
+
+    if width is None:
+        width = int_len(block)
+
+    # e.g. 12 * 10101 for 3 repetitions of a 2 digit block
+    repunit: int = (pow10(width * times) - 1) // (pow10(width) - 1)
+
+    return block * repunit
+
+
+def to_digits(integer: int, /) -> Sequence[int]:
+    """
+    The (decimal) digits of a non-negative integer, most significant first
+
+    Example:
+        >>> assert to_digits(1203) == (1, 2, 0, 3)
+    """
+
+    if integer < POWERS_OF_TEN[-1]:
+        return tuple(map(int, str(integer)))
+
+    # Beyond a size, converting integers to strings is quadratic (and limited by
+    # `sys.set_int_max_str_digits`), so split large integers in half first
+    width: int = int_len(integer) // 2
+    high: int
+    low: int
+    high, low = int_split(integer, width)
+
+    low_digits: Sequence[int] = to_digits(low)
+
+    return (*to_digits(high), *(0,) * (width - len(low_digits)), *low_digits)
+
+
+def from_digits(digits: Iterable[int], /) -> int:
+    """
+    Build an integer from its (decimal) digits, most significant first
+
+    Example:
+        >>> assert from_digits((1, 2, 0, 3)) == 1203
+    """
+
+    integer: int = 0
+
+    digit: int
+    for digit in digits:
+        integer = integer * 10 + digit
+
+    return integer
+
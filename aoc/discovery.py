@@ -0,0 +1,143 @@
+"""Discovery & loading of the `<year>/day-*/app.py` solutions"""
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass, field
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+from types import ModuleType
+from typing import Final, MutableSequence, Optional, Sequence
+
+from aoc.reader import FILENAME_INPUT
+
+# Constants
+ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+PATTERN_YEAR: Final[str] = r"\d{4}"
+PATTERN_DAY: Final[str] = r"day-(?P<day>\d+)"
+FILENAME_SOLUTION: Final[str] = "app.py"
+FILENAME_GENERATOR: Final[str] = "generate.py"
+
+
+# Exceptions
+class DayNotFoundError(LookupError):
+    """Exception thrown when no solution exists for a requested day"""
+
+
+# Models
+@dataclass(frozen=True, order=True)
+class Day:
+    """A single day's solution, located at `<year>/day-<day>/app.py`"""
+
+    year: int
+    day: int
+    directory: Path = field(compare=False)
+
+    def __str__(self) -> str:
+        return f"{self.year} day {self.day}"
+
+    @property
+    def solution_path(self) -> Path:
+        """Path to the solution module"""
+
+        return self.directory / FILENAME_SOLUTION
+
+    @property
+    def input_path(self) -> Path:
+        """Path to the (checked-in) puzzle input"""
+
+        return self.directory / FILENAME_INPUT
+
+    @property
+    def module_name(self) -> str:
+        """Unique, importable name for the solution module"""
+
+        return f"aoc_{self.year}_day_{self.day:02}"
+
+    def get_module_name(self, filename: str, /) -> str:
+        """Unique, importable name for a module within this day's directory"""
+
+        if filename == FILENAME_SOLUTION:
+            return self.module_name
+
+        return f"{self.module_name}_{Path(filename).stem}"
+
+
+def discover_days(root: Path = ROOT, /) -> Sequence[Day]:
+    """Discover every solution beneath `root`, ordered by year then day"""
+
+    days: MutableSequence[Day] = []
+
+    year_directory: Path
+    for year_directory in root.iterdir():
+        if not year_directory.is_dir() or not re.fullmatch(
+            PATTERN_YEAR, year_directory.name
+        ):
+            continue
+
+        day_directory: Path
+        for day_directory in year_directory.iterdir():
+            day_match: Optional[re.Match] = re.fullmatch(
+                PATTERN_DAY, day_directory.name
+            )
+
+            if day_match is None or not (day_directory / FILENAME_SOLUTION).is_file():
+                continue
+
+            days.append(
+                Day(
+                    year=int(year_directory.name),
+                    day=int(day_match.group("day")),
+                    directory=day_directory,
+                )
+            )
+
+    return sorted(days)
+
+
+def find_days(
+    year: Optional[int] = None, day: Optional[int] = None, /, *, root: Path = ROOT
+) -> Sequence[Day]:
+    """Find all solutions matching the given year and/or day"""
+
+    days: Sequence[Day] = tuple(
+        candidate
+        for candidate in discover_days(root)
+        if (year is None or candidate.year == year)
+        and (day is None or candidate.day == day)
+    )
+
+    if not days:
+        raise DayNotFoundError(
+            f"No solutions found for year={year!r}, day={day!r} in {root}"
+        )
+
+    return days
+
+
+def load_module(day: Day, /, filename: str = FILENAME_SOLUTION) -> ModuleType:
+    """Import (or fetch the already imported) module from a day's directory"""
+
+    module_name: str = day.get_module_name(filename)
+
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec: Optional[ModuleSpec] = importlib.util.spec_from_file_location(
+        module_name, day.directory / filename
+    )
+
+    assert spec is not None and spec.loader is not None
+
+    module: ModuleType = importlib.util.module_from_spec(spec)
+
+    # Register the module before executing it, as e.g. dataclasses look it up
+    sys.modules[module_name] = module
+
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+
+    return module
@@ -0,0 +1,120 @@
+"""Registries of alternative implementations (engines) of a day's parts"""
+
+from typing import (
+    Callable,
+    Final,
+    Iterator,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+# Constants
+ENGINE_ALL: Final[str] = "all"  # Every engine, checking they agree (see the runner)
+ENGINE_REFERENCE: Final[str] = "reference"
+
+
+# Exceptions
+class EngineNotFoundError(LookupError):
+    """Exception thrown when a day has no engine by a given name"""
+
+
+# Models
+# Engines are named tuples, rather than dataclasses, as every day with engines
+# imports this module, and importing `dataclasses` would dominate some of theirs
+class Engine(NamedTuple):
+    """
+    A single implementation of a day's parts (and, optionally, both at once)
+
+    Engines are picked automatically for inputs of at least `min_size` bytes,
+    unless it's `None`, in which case they're only run when asked for by name.
+    """
+
+    name: str
+    solve_part_1: Callable[..., int]
+    solve_part_2: Callable[..., int]
+    solve_parts: Optional[Callable[..., Sequence[int]]] = None
+    min_size: Optional[int] = 0
+
+
+class EngineRegistry:
+    """
+    A day's engines, by name, starting with its reference engine
+
+    The reference engine is the simplest (most obviously correct) implementation,
+    kept as an oracle for the other engines to be checked against. It's usually
+    the slowest, so only run by name, but not always, in which case it's picked by
+    size like any other. Inputs are solved by whichever engine has the largest
+    `min_size` the input reaches (the first registered, should several), or the
+    reference engine, should there be none.
+
+    Example:
+        >>> engines = EngineRegistry(
+        ...     Engine(ENGINE_REFERENCE, len, len, min_size=None),
+        ...     Engine("fast", len, len),
+        ...     Engine("huge", len, len, min_size=1_000_000),
+        ... )
+        >>> assert engines.select(size=1_000).name == "fast"
+        >>> assert engines.select(size=10_000_000).name == "huge"
+        >>> assert engines.select(ENGINE_REFERENCE) is engines.reference
+    """
+
+    _engines: MutableMapping[str, Engine]
+
+    def __init__(self, reference: Engine, /, *engines: Engine) -> None:
+        self._engines = {}
+
+        engine: Engine
+        for engine in (reference, *engines):
+            self.register(engine)
+
+    def __iter__(self) -> Iterator[Engine]:
+        return iter(self._engines.values())
+
+    @property
+    def names(self) -> Sequence[str]:
+        """Name of every engine, starting with the reference engine"""
+
+        return tuple(self._engines)
+
+    @property
+    def reference(self) -> Engine:
+        """The engine registered first, which every other is checked against"""
+
+        return next(iter(self))
+
+    @property
+    def default(self) -> Engine:
+        """The engine picked for inputs of unknown size (e.g. from stdin)"""
+
+        return self.select()
+
+    def register(self, engine: Engine, /) -> None:
+        """Register another engine, under a name of its own"""
+
+        if engine.name in self._engines or engine.name == ENGINE_ALL:
+            raise ValueError(f"An engine can't be registered as {engine.name!r}")
+
+        self._engines[engine.name] = engine
+
+    def select(self, name: Optional[str] = None, /, *, size: int = 0) -> Engine:
+        """Get an engine by name, or pick one for an input of `size` bytes"""
+
+        if name is not None:
+            if name not in self._engines:
+                raise EngineNotFoundError(
+                    f"No engine named {name!r} (available: {', '.join(self.names)})"
+                )
+
+            return self._engines[name]
+
+        return max(
+            (
+                engine
+                for engine in self
+                if engine.min_size is not None and engine.min_size <= size
+            ),
+            key=lambda engine: engine.min_size or 0,
+            default=self.reference,
+        )
@@ -0,0 +1,459 @@
+"""Differential fuzzing: a day's engines against its reference, on generated inputs"""
+
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from random import Random
+from types import ModuleType
+from typing import (
+    Callable,
+    Final,
+    Iterable,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from aoc.discovery import Day, load_module
+from aoc.engines import ENGINE_REFERENCE, Engine, EngineRegistry
+from aoc.generate import (
+    DEFAULT_SEED,
+    Params,
+    generate_input,
+    load_generator,
+    open_output,
+)
+from aoc.lazy import lazy_import
+from aoc.reader import FILENAME_INPUT
+from aoc.report import format_table
+from aoc.runner import PARTS, Phase, Solution, describe_error
+
+# Only needed once days are fuzzed
+tempfile: ModuleType = lazy_import("tempfile")
+
+# Constants
+DEFAULT_CASES: Final[int] = 200
+DEFAULT_MAX_SIZE: Final[int] = 10  # In the generator's units (e.g. lines, digits)
+FUSED: Final[str] = "fused"
+# Days solving their parts only one way aren't reported as skipped, as there's
+# nothing to fuzz in the first place
+SKIP_NOTHING_TO_COMPARE: Final[str] = "nothing to compare"
+SKIP_NO_GENERATOR: Final[str] = "no input generator"
+
+
+# Exceptions
+class FuzzingNotSupportedError(LookupError):
+    """Exception thrown when no day has several engines (and a generator) to fuzz"""
+
+
+# Models
+@dataclass(frozen=True)
+class Candidate:
+    """An engine checked against the reference engine, solving parts or fused"""
+
+    engine: str
+    fused: bool = False
+
+    def __str__(self) -> str:
+        return f"{self.engine} ({FUSED})" if self.fused else self.engine
+
+
+@dataclass(frozen=True)
+class Outcome:
+    """
+    What solving an input gave: each part's answer, or an error
+
+    Errors are only told apart by their type, as their messages needn't agree.
+    """
+
+    answers: Optional[Sequence[int]] = None
+    error_type: Optional[str] = None
+    error: Optional[str] = field(default=None, compare=False)
+
+    def __str__(self) -> str:
+        if self.answers is None:
+            return f"error ({self.error})"
+
+        return ", ".join(map(str, self.answers))
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """
+    A (shrunk) input on which a candidate disagrees with the reference engine
+
+    The input it was shrunk from is generated again from its `seed`, `size` &
+    generator `params`.
+    """
+
+    candidate: Candidate
+    seed: int
+    size: int
+    input: str
+    expected: Outcome
+    actual: Outcome
+    params: Params = field(default_factory=dict)
+
+
+@dataclass
+class DayFuzz:
+    """Every candidate engine of a day, checked against its reference engine"""
+
+    day: Day
+    reference: str = ""
+    candidates: Sequence[Candidate] = ()
+    cases: int = 0
+    elapsed: float = 0.0  # Spent solving the generated inputs (not shrinking them)
+    failures: MutableMapping[Candidate, int] = field(default_factory=dict)
+    mismatches: MutableSequence[Mismatch] = field(default_factory=list)
+    skipped: Optional[str] = None  # Why the day wasn't fuzzed, if it wasn't
+
+    @property
+    def ok(self) -> bool:
+        """Whether every candidate agreed with the reference on every input"""
+
+        return not self.mismatches
+
+    @property
+    def cases_per_second(self) -> float:
+        """Inputs solved by every engine (and checked) per second"""
+
+        return self.cases / self.elapsed if self.elapsed else 0.0
+
+
+def find_candidates(engines: EngineRegistry, /) -> Sequence[Candidate]:
+    """Every engine's parts (bar the reference's), and every engine's fused pass"""
+
+    return tuple(
+        candidate
+        for index, engine in enumerate(engines)
+        for candidate in (
+            *((Candidate(engine.name),) if index > 0 else ()),
+            *((Candidate(engine.name, fused=True),) if engine.solve_parts else ()),
+        )
+    )
+
+
+def get_engines(solution: Solution, /) -> Optional[EngineRegistry]:
+    """
+    A solution's engines, or (should it have none) its parts as a reference engine
+    for its fused pass to be checked against, if it has one
+    """
+
+    if solution.engines is not None or solution.fused is None:
+        return solution.engines
+
+    return EngineRegistry(
+        Engine(
+            ENGINE_REFERENCE,
+            solution.parts[Phase.PART_1],
+            solution.parts[Phase.PART_2],
+            solution.fused,
+        )
+    )
+
+
+def get_skip_reason(day: Day, /) -> Optional[str]:
+    """
+    Why a day can't be fuzzed, or `None` if it can (it has candidate engines to
+    fuzz, and a generator to fuzz them with)
+    """
+
+    solution: Solution
+    try:
+        solution = Solution.from_module(load_module(day))
+    except Exception as error:
+        return f"failed to load ({describe_error(error)})"
+
+    engines: Optional[EngineRegistry] = get_engines(solution)
+
+    if engines is None or not find_candidates(engines):
+        return SKIP_NOTHING_TO_COMPARE
+
+    try:
+        load_generator(day)
+    except Exception:
+        return SKIP_NO_GENERATOR
+
+    return None
+
+
+def solve(solution: Solution, path: Path, /, *, fused: bool = False) -> Outcome:
+    """
+    Solve an input with one of a solution's engines, catching any error
+
+    The input is parsed afresh, as engines may mutate their parsed input.
+    """
+
+    try:
+        data: object = (
+            None if solution.read_input is None else solution.parse(path=path)
+        )
+        answers: Sequence[int] = (
+            solution.solve_fused(data, path=path)
+            if fused
+            else tuple(solution.solve(phase, data, path=path) for phase in PARTS)
+        )
+    except Exception as error:
+        return Outcome(error_type=type(error).__name__, error=describe_error(error))
+
+    return Outcome(answers=tuple(answers))
+
+
+def shrink(
+    units: Sequence[str], is_failing: Callable[[Sequence[str]], bool], /
+) -> Sequence[str]:
+    """
+    Shrink a failing input to a (locally) minimal one, by removing chunks of it
+
+    Chunks of units (e.g. lines) are removed while the input keeps failing, halving
+    their size down to a single unit, so that no single unit can then be removed.
+
+    Example:
+        >>> assert shrink("abcdef", lambda units: {"c", "e"} <= {*units}) == ["c", "e"]
+    """
+
+    units = list(units)
+    size: int = len(units) // 2
+
+    while size >= 1:
+        start: int = 0
+
+        while start < len(units):
+            shrunk: Sequence[str] = [*units[:start], *units[start + size :]]
+
+            if shrunk and is_failing(shrunk):
+                units = list(shrunk)
+            else:
+                start += size
+
+        size //= 2
+
+    return units
+
+
+def split_units(text: str, /) -> Sequence[str]:
+    """
+    Split an input into the units it's shrunk by: lines, or characters of a line
+
+    Example:
+        >>> assert split_units("1 2\\n3 4\\n") == ["1 2\\n", "3 4\\n"]
+        >>> assert split_units("2333\\n") == ["2", "3", "3", "3", "\\n"]
+    """
+
+    lines: Sequence[str] = text.splitlines(keepends=True)
+
+    return lines if len(lines) > 1 else list(text)
+
+
+def fuzz_day(
+    day: Day,
+    /,
+    *,
+    cases: int = DEFAULT_CASES,
+    max_size: int = DEFAULT_MAX_SIZE,
+    seed: int = DEFAULT_SEED,
+    params: Optional[Params] = None,
+) -> DayFuzz:
+    """
+    Solve small generated inputs with every engine of a day, comparing their answers
+
+    Each input is generated from a seed (and a size, up to `max_size`) of its own,
+    drawn from `seed`. The first input each candidate disagrees with the reference
+    engine on is shrunk to a minimal input it still disagrees on (which the
+    reference engine still solves, unless it failed on the original too).
+    """
+
+    solution: Solution = Solution.from_module(load_module(day))
+    engines: Optional[EngineRegistry] = get_engines(solution)
+    assert engines is not None
+
+    # Solutions without engines of their own solve the same either way, only their
+    # candidate is their fused pass
+    reference: Solution = solution.with_engine(engines.reference.name)
+    candidates: Mapping[Candidate, Solution] = {
+        candidate: solution.with_engine(candidate.engine)
+        for candidate in find_candidates(engines)
+    }
+    fuzz: DayFuzz = DayFuzz(
+        day, reference=engines.reference.name, candidates=tuple(candidates)
+    )
+    random: Random = Random(seed)
+
+    directory: str
+    with tempfile.TemporaryDirectory(prefix="aoc-fuzz-") as directory:
+        path: Path = Path(directory) / FILENAME_INPUT
+
+        def solve_text(candidate: Candidate, text: str, /) -> Tuple[Outcome, Outcome]:
+            with open_output(path) as file:
+                file.write(text)
+
+            return solve(reference, path), solve(
+                candidates[candidate], path, fused=candidate.fused
+            )
+
+        _: int
+        for _ in range(cases):
+            case_seed: int = random.getrandbits(32)
+            size: int = random.randint(1, max_size)
+
+            start: float = time.perf_counter()
+
+            with open_output(path) as file:
+                generate_input(day, file, size=size, seed=case_seed, params=params)
+
+            expected: Outcome = solve(reference, path)
+            outcomes: Mapping[Candidate, Outcome] = {
+                candidate: solve(candidate_solution, path, fused=candidate.fused)
+                for candidate, candidate_solution in candidates.items()
+            }
+
+            fuzz.elapsed += time.perf_counter() - start
+            fuzz.cases += 1
+
+            candidate: Candidate
+            actual: Outcome
+            for candidate, actual in outcomes.items():
+                if actual == expected:
+                    continue
+
+                fuzz.failures[candidate] = fuzz.failures.get(candidate, 0) + 1
+
+                if fuzz.failures[candidate] > 1:
+                    continue
+
+                text: str = path.read_text(encoding="utf-8")
+                solvable: bool = expected.answers is not None
+
+                def is_failing(
+                    units: Sequence[str], /, candidate: Candidate = candidate
+                ) -> bool:
+                    shrunk_expected: Outcome
+                    shrunk_actual: Outcome
+                    shrunk_expected, shrunk_actual = solve_text(
+                        candidate, "".join(units)
+                    )
+
+                    return shrunk_actual != shrunk_expected and (
+                        shrunk_expected.answers is not None or not solvable
+                    )
+
+                shrunk: str = "".join(shrink(split_units(text), is_failing))
+
+                fuzz.mismatches.append(
+                    Mismatch(
+                        candidate,
+                        case_seed,
+                        size,
+                        shrunk,
+                        *solve_text(candidate, shrunk),
+                        params=dict(params or {}),
+                    )
+                )
+
+    return fuzz
+
+
+def fuzz_days(
+    days: Iterable[Day],
+    /,
+    *,
+    cases: int = DEFAULT_CASES,
+    max_size: int = DEFAULT_MAX_SIZE,
+    seed: int = DEFAULT_SEED,
+    params: Optional[Params] = None,
+) -> Iterable[DayFuzz]:
+    """
+    Fuzz every day which can be (those with candidate engines or a fused pass, and
+    a generator)
+
+    Days which can't be are skipped, but still reported (with why), unless they
+    solve their parts only one way.
+    """
+
+    reasons: Mapping[Day, Optional[str]] = {day: get_skip_reason(day) for day in days}
+
+    if all(reason is not None for reason in reasons.values()):
+        raise FuzzingNotSupportedError(
+            "None of the selected days have several engines (or a fused pass) and an "
+            "input generator"
+            + "".join(
+                f"\n  {day}: {reason}"
+                for day, reason in reasons.items()
+                if reason != SKIP_NOTHING_TO_COMPARE
+            )
+        )
+
+    return (
+        DayFuzz(day, skipped=reason)
+        if reason is not None
+        else fuzz_day(day, cases=cases, max_size=max_size, seed=seed, params=params)
+        for day, reason in reasons.items()
+        if reason != SKIP_NOTHING_TO_COMPARE
+    )
+
+
+def format_fuzz(fuzzes: Iterable[DayFuzz], /) -> str:
+    """Format each candidate's mismatches (and each day's throughput) into a table"""
+
+    rows: MutableSequence[Sequence[str]] = [
+        ("Year", "Day", "Engine", "Reference", "Cases", "Cases/s", "Status")
+    ]
+
+    fuzz: DayFuzz
+    for fuzz in fuzzes:
+        if fuzz.skipped is not None:
+            rows.append(
+                (
+                    str(fuzz.day.year),
+                    str(fuzz.day.day),
+                    "-",
+                    "-",
+                    "-",
+                    "-",
+                    f"skipped ({fuzz.skipped})",
+                )
+            )
+
+        candidate: Candidate
+        for candidate in fuzz.candidates:
+            failures: int = fuzz.failures.get(candidate, 0)
+
+            rows.append(
+                (
+                    str(fuzz.day.year),
+                    str(fuzz.day.day),
+                    str(candidate),
+                    fuzz.reference,
+                    str(fuzz.cases),
+                    f"{fuzz.cases_per_second:.1f}",
+                    f"mismatch ({failures} cases)" if failures else "ok",
+                )
+            )
+
+    return format_table(rows)
+
+
+def format_mismatch(day: Day, mismatch: Mismatch, /) -> str:
+    """Describe a mismatch, with its shrunk input, and how to generate the original"""
+
+    return (
+        f"{day}, {mismatch.candidate}: expected {mismatch.expected}, "
+        f"got {mismatch.actual}\n"
+        f"  (shrunk from `generate {day.year} {day.day} "
+        f"--size {mismatch.size} --seed {mismatch.seed}"
+        + "".join(f" --param {name}={value}" for name, value in mismatch.params.items())
+        + "`)\n"
+        f"{mismatch.input}"
+    )
+
+
+def get_reproducer_path(directory: Path, day: Day, mismatch: Mismatch, /) -> Path:
+    """Where to write a mismatch's shrunk input, e.g. `2024-day-02-brute-force.txt`"""
+
+    name: str = str(mismatch.candidate).replace(" (", "-").rstrip(")")
+
+    return directory / f"{day.year}-day-{day.day:02}-{name}.txt"
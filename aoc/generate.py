@@ -0,0 +1,164 @@
+"""Deterministic, streamed generation of synthetic inputs at arbitrary scale"""
+
+import contextlib
+import inspect
+import sys
+from pathlib import Path
+from random import Random
+from types import ModuleType
+from typing import (
+    Collection,
+    Final,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TextIO,
+    TypeAlias,
+)
+
+from aoc.discovery import FILENAME_GENERATOR, Day, load_module
+
+# Constants
+DEFAULT_SEED: Final[int] = 0
+BUFFER_SIZE: Final[int] = 1 << 20
+STDOUT: Final[str] = "-"
+RESERVED_PARAMS: Final[Collection[str]] = ("size", "random")
+PARAM_TYPES: Final[Collection[type]] = (int, float)
+
+
+# Typing
+# Values are given as strings (e.g. on the command line), or already converted
+Params: TypeAlias = Mapping[str, str | int | float]
+
+
+# Exceptions
+class GeneratorNotFoundError(LookupError):
+    """Exception thrown when a day doesn't have an input generator"""
+
+
+class GeneratorParameterError(ValueError):
+    """Exception thrown when a generator doesn't accept a given parameter"""
+
+
+def load_generator(day: Day, /) -> ModuleType:
+    """
+    Load the input generator for a day, found at `<year>/day-*/generate.py`
+
+    Generators expose a `DEFAULT_SIZE` (the size of the real input) and a
+    `generate(file, /, *, size, random, **params)` function, which writes an
+    input of the given size to `file` using only `random` as a source of
+    randomness (so output is deterministic for a given seed).
+    """
+
+    if not (day.directory / FILENAME_GENERATOR).is_file():
+        raise GeneratorNotFoundError(f"No input generator exists for {day}")
+
+    return load_module(day, FILENAME_GENERATOR)
+
+
+def resolve_size(
+    day: Day, /, *, size: Optional[int] = None, scale: float = 1.0
+) -> int:
+    """Resolve an explicit size, or a scale relative to the real input's size"""
+
+    if size is not None:
+        return size
+
+    return max(1, round(load_generator(day).DEFAULT_SIZE * scale))
+
+
+def convert_params(
+    day: Day, generator: ModuleType, params: Params, /
+) -> Mapping[str, int | float]:
+    """
+    Check parameters are the generator's own, converting any given as strings to the
+    type (`int` or `float`) its signature declares them as
+    """
+
+    # Only the generator's (keyword-only) parameters can be overridden
+    accepted: Mapping[str, inspect.Parameter] = {
+        name: parameter
+        for name, parameter in inspect.signature(
+            generator.generate, eval_str=True
+        ).parameters.items()
+        if parameter.kind is inspect.Parameter.KEYWORD_ONLY
+        and name not in RESERVED_PARAMS
+    }
+    converted: MutableMapping[str, int | float] = {}
+
+    name: str
+    value: str | int | float
+    for name, value in params.items():
+        if name not in accepted:
+            raise GeneratorParameterError(
+                f"The {day} generator has no parameter {name!r}"
+                f" (accepted: {', '.join(accepted) or 'none'})"
+            )
+
+        type_: type = accepted[name].annotation
+
+        if isinstance(value, str) and type_ in PARAM_TYPES:
+            try:
+                value = type_(value)
+            except ValueError:
+                raise GeneratorParameterError(
+                    f"The {day} generator's {name!r} parameter is a {type_.__name__}"
+                    f", not {value!r}"
+                ) from None
+
+        converted[name] = value
+
+    return converted
+
+
+def generate_input(
+    day: Day,
+    file: TextIO,
+    /,
+    *,
+    size: int,
+    seed: int = DEFAULT_SEED,
+    params: Optional[Params] = None,
+) -> None:
+    """Write a synthetic input for a day to `file`"""
+
+    generator: ModuleType = load_generator(day)
+
+    generator.generate(
+        file,
+        size=size,
+        random=Random(seed),
+        **convert_params(day, generator, params or {}),
+    )
+
+
+@contextlib.contextmanager
+def open_output(path: Path | str, /) -> Iterator[TextIO]:
+    """Open a (buffered) file to write a generated input to (or stdout for "-")"""
+
+    if str(path) == STDOUT:
+        yield sys.stdout
+        return
+
+    file: TextIO
+    with open(
+        path, "w", encoding="utf-8", newline="\n", buffering=BUFFER_SIZE
+    ) as file:
+        yield file
+
+
+def write_input(
+    day: Day,
+    path: Path | str,
+    /,
+    *,
+    size: int,
+    seed: int = DEFAULT_SEED,
+    params: Optional[Params] = None,
+) -> None:
+    """Write a synthetic input for a day straight to disk (or stdout for "-")"""
+
+    file: TextIO
+    with open_output(path) as file:
+        generate_input(day, file, size=size, seed=seed, params=params)
@@ -0,0 +1,238 @@
+"""Rectangular grids of single-byte cells, backed by a single flat `bytearray`"""
+
+from pathlib import Path
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Final,
+    Iterator,
+    MutableSequence,
+    Self,
+    Sequence,
+    Tuple,
+)
+
+from aoc.reader import FILENAME_INPUT, open_input
+
+if TYPE_CHECKING:
+    import numpy
+
+# Constants
+BORDER: Final[int] = 0  # Value of the cells padding the grid
+
+# Offsets of neighbouring cells, as (dx, dy)
+DIRECTIONS_4: Final[Sequence[Tuple[int, int]]] = ((0, -1), (-1, 0), (1, 0), (0, 1))
+DIRECTIONS_8: Final[Sequence[Tuple[int, int]]] = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+
+class Grid:
+    """
+    Rectangular grid of single-byte cells (e.g. ASCII characters)
+
+    Cells are stored row-major in one flat `bytearray`, padded by a single cell of
+    `BORDER` on every side, so each row is `stride` (`width + 2`) bytes apart and
+    every cell (including those on the edge) has 8 neighbours at fixed offsets.
+    Cells are addressed either by (x, y) coordinates, or directly by their index
+    into `data`, which is much cheaper in hot loops.
+
+    Example:
+        >>> grid = Grid.from_text("ab\\ncd\\n")
+        >>> assert (grid.width, grid.height) == (2, 2)
+        >>> assert grid.get(1, 0) == ord("b")
+        >>> assert grid.rows() == [b"ab", b"cd"]
+        >>> assert grid.columns() == [b"ac", b"bd"]
+    """
+
+    data: bytearray
+    width: int
+    height: int
+    stride: int
+    offsets_4: Sequence[int]
+    offsets_8: Sequence[int]
+
+    def __init__(self, data: bytearray, width: int, height: int, /) -> None:
+        if len(data) != (width + 2) * (height + 2):
+            raise ValueError(
+                f"{len(data)} bytes can't hold a padded {width}x{height} grid"
+            )
+
+        self.data = data
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.offsets_4 = tuple(dx + dy * self.stride for dx, dy in DIRECTIONS_4)
+        self.offsets_8 = tuple(dx + dy * self.stride for dx, dy in DIRECTIONS_8)
+
+    @classmethod
+    def from_lines(cls, lines: Sequence[bytes], /) -> Self:
+        """Build a grid from its (equal length) rows"""
+
+        width: int = len(lines[0]) if lines else 0
+        border: bytes = bytes((BORDER,))
+        data: bytearray = bytearray(border * (width + 2))
+
+        line: bytes
+        for line in lines:
+            if len(line) != width:
+                raise ValueError(f"Row of length {len(line)} in a {width} wide grid")
+
+            data += border
+            data += line
+            data += border
+
+        data += border * (width + 2)
+
+        return cls(data, width, len(lines))
+
+    @classmethod
+    def from_text(cls, text: str | bytes, /) -> Self:
+        """Build a grid from text, with a row per (non-empty) line"""
+
+        if isinstance(text, str):
+            text = text.encode("ascii")
+
+        return cls.from_lines([line for line in text.splitlines() if line])
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode("ascii") for row in self.rows())
+
+    def __len__(self) -> int:
+        return self.width * self.height
+
+    def copy(self) -> "Grid":
+        """Copy the grid (and its cells)"""
+
+        return Grid(bytearray(self.data), self.width, self.height)
+
+    def index(self, x: int, y: int, /) -> int:
+        """Index of a cell in `data`"""
+
+        return (y + 1) * self.stride + x + 1
+
+    def coord(self, index: int, /) -> Tuple[int, int]:
+        """Coordinates of a cell, from its index in `data`"""
+
+        y: int
+        x: int
+        y, x = divmod(index, self.stride)
+
+        return (x - 1, y - 1)
+
+    def contains(self, x: int, y: int, /) -> bool:
+        """Whether coordinates are within the grid"""
+
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def get(self, x: int, y: int, /) -> int:
+        """Value of a cell"""
+
+        return self.data[(y + 1) * self.stride + x + 1]
+
+    def set(self, x: int, y: int, value: int, /) -> None:
+        """Set the value of a cell"""
+
+        self.data[(y + 1) * self.stride + x + 1] = value
+
+    def indices(self) -> Iterator[int]:
+        """Iterate the index of every cell, row by row"""
+
+        start: int
+        for start in self._row_starts():
+            yield from range(start, start + self.width)
+
+    def find_all(self, value: int, /) -> Iterator[int]:
+        """Iterate the index of every cell with a value, row by row"""
+
+        find = self.data.find
+        index: int = find(value)
+
+        while index != -1:
+            yield index
+
+            index = find(value, index + 1)
+
+    def count_neighbours(self, index: int, value: int, /) -> int:
+        """Count the (8, including diagonally) neighbours of a cell with a value"""
+
+        data: bytearray = self.data
+
+        return sum(data[index + offset] == value for offset in self.offsets_8)
+
+    def rows(self) -> Sequence[bytes]:
+        """Every row, top to bottom"""
+
+        return [
+            bytes(self.data[start : start + self.width])
+            for start in self._row_starts()
+        ]
+
+    def columns(self) -> Sequence[bytes]:
+        """Every column, left to right"""
+
+        stop: int = (self.height + 1) * self.stride
+
+        return [
+            bytes(self.data[self.stride + 1 + x : stop : self.stride])
+            for x in range(self.width)
+        ]
+
+    def diagonals(self) -> Sequence[bytes]:
+        """Every diagonal running down & to the right (bottom-left to top-right)"""
+
+        return self._lines(self.stride + 1, reverse=False)
+
+    def anti_diagonals(self) -> Sequence[bytes]:
+        """Every diagonal running down & to the left (bottom-right to top-left)"""
+
+        return self._lines(self.stride - 1, reverse=True)
+
+    def _row_starts(self) -> range:
+        return range(self.stride + 1, (self.height + 1) * self.stride, self.stride)
+
+    def _lines(self, step: int, /, *, reverse: bool) -> Sequence[bytes]:
+        # Diagonals start on the left (or right, if reversed) column, then the top row
+        starts: Sequence[Tuple[int, int]] = [
+            *((0, y) for y in range(self.height - 1, 0, -1)),
+            *((x, 0) for x in range(self.width)),
+        ]
+        lines: MutableSequence[bytes] = []
+
+        x: int
+        y: int
+        for x, y in starts:
+            length: int = min(self.width - x, self.height - y)
+            start: int = self.index(self.width - 1 - x if reverse else x, y)
+
+            lines.append(bytes(self.data[start : start + length * step : step]))
+
+        return lines
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """
+        (Writable) NumPy view of the cells, indexed by [y, x], sharing their memory
+
+        NumPy is an optional dependency, only required by this method.
+        """
+
+        import numpy
+
+        padded: numpy.ndarray = numpy.frombuffer(self.data, dtype=numpy.uint8)
+
+        return padded.reshape(self.height + 2, self.stride)[1:-1, 1:-1]
+
+
+def read_grid(path: Path | str = FILENAME_INPUT, /) -> Grid:
+    """Read a grid from an input (see `aoc.reader.open_input`), a row per line"""
+
+    file: IO[bytes]
+    with open_input(path) as file:
+        return Grid.from_text(file.read())
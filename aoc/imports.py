@@ -0,0 +1,242 @@
+"""Cold-start import profiling of solutions, via `python -X importtime`"""
+
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import (
+    Final,
+    Iterable,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+)
+
+from aoc.discovery import FILENAME_SOLUTION, ROOT, Day
+from aoc.lazy import lazy_import
+from aoc.report import PLACEHOLDER, format_table
+
+# Only needed once solutions are profiled
+subprocess: ModuleType = lazy_import("subprocess")
+
+# Constants
+DEFAULT_REPEAT: Final[int] = 3
+DEFAULT_TOP: Final[int] = 3
+MICROSECONDS_PER_MILLISECOND: Final[int] = 1_000
+INDENT: Final[int] = 2  # Spaces per level of nesting, in `-X importtime` output
+
+# e.g. `import time:       177 |       2053 |   re`
+PATTERN_TIMING: Final[re.Pattern[str]] = re.compile(
+    r"import time:\s+(?P<self>\d+) \|\s+(?P<cumulative>\d+) \| (?P<name>.+)"
+)
+
+
+# Models
+@dataclass(frozen=True)
+class ImportTiming:
+    """Time taken to import a single module, as reported by `-X importtime`"""
+
+    module: str
+    depth: int
+    self_us: int
+    cumulative_us: int
+
+
+@dataclass(frozen=True)
+class DayImports:
+    """
+    Modules imported by a day's solution, in a fresh interpreter
+
+    Only modules not already imported by the interpreter starting up are included
+    (so `imports` is everything the solution pulls in), and `total_ms` is the
+    cost of importing the solution, on top of that of starting the interpreter.
+    """
+
+    day: Day
+    imports: Sequence[ImportTiming] = field(default=())
+    error: Optional[str] = None
+
+    @property
+    def total_ms(self) -> Optional[float]:
+        """Cumulative time to import the solution, in milliseconds"""
+
+        if not self.imports:
+            return None
+
+        return self.imports[-1].cumulative_us / MICROSECONDS_PER_MILLISECOND
+
+    def top(self, count: int, /) -> Sequence[ImportTiming]:
+        """The modules (other than the solution's own) slowest to import themselves"""
+
+        return sorted(
+            self.imports[:-1], key=lambda timing: timing.self_us, reverse=True
+        )[:count]
+
+    def over_budget(self, budget_ms: Optional[float], /) -> bool:
+        """Whether the solution took longer to import than the budget"""
+
+        return budget_ms is not None and (self.total_ms or 0.0) > budget_ms
+
+
+def parse_importtime(output: str, /) -> Sequence[ImportTiming]:
+    """
+    Parse the (stderr) output of `-X importtime` into a timing per module
+
+    Example:
+        >>> timings = parse_importtime(
+        ...     "import time: self [us] | cumulative | imported package\\n"
+        ...     "import time:        80 |         80 |   _bisect\\n"
+        ...     "import time:       120 |        200 | bisect\\n"
+        ... )
+        >>> assert [(t.module, t.depth, t.cumulative_us) for t in timings] == [
+        ...     ("_bisect", 1, 80), ("bisect", 0, 200)
+        ... ]
+    """
+
+    timings: MutableSequence[ImportTiming] = []
+
+    line: str
+    for line in output.splitlines():
+        match: Optional[re.Match[str]] = PATTERN_TIMING.fullmatch(line)
+
+        if match is None:
+            continue
+
+        name: str = match.group("name")
+        module: str = name.lstrip(" ")
+
+        timings.append(
+            ImportTiming(
+                module=module,
+                depth=(len(name) - len(module)) // INDENT,
+                self_us=int(match.group("self")),
+                cumulative_us=int(match.group("cumulative")),
+            )
+        )
+
+    return timings
+
+
+def solution_imports(
+    timings: Sequence[ImportTiming], module: str, /
+) -> Sequence[ImportTiming]:
+    """
+    The timings of a top-level module & those it imported, ending with its own
+
+    Modules are reported once they've finished importing, so the modules imported
+    by a top-level module are those reported (more deeply nested) just before it.
+    """
+
+    end: int = next(
+        index
+        for index, timing in enumerate(timings)
+        if timing.module == module and timing.depth == 0
+    )
+    start: int = end
+
+    while start > 0 and timings[start - 1].depth > 0:
+        start -= 1
+
+    return timings[start : end + 1]
+
+
+def profile_day(day: Day, /, *, repeat: int = DEFAULT_REPEAT) -> DayImports:
+    """
+    Profile importing a day's solution in fresh interpreters, keeping the fastest
+
+    The solution is imported from its own directory (as `app`), with the
+    repository root on `PYTHONPATH`, as when it's run on its own.
+    """
+
+    module: str = FILENAME_SOLUTION.removesuffix(".py")
+    environment: Mapping[str, str] = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(
+            filter(None, (str(ROOT), os.environ.get("PYTHONPATH")))
+        ),
+    }
+    fastest: Optional[Sequence[ImportTiming]] = None
+
+    for _ in range(repeat):
+        process: subprocess.CompletedProcess[str] = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=day.directory,
+            env=environment,
+            capture_output=True,
+            text=True,
+        )
+
+        if process.returncode != 0:
+            error: str = process.stderr.strip().splitlines()[-1]
+
+            return DayImports(day, error=error)
+
+        imports: Sequence[ImportTiming] = solution_imports(
+            parse_importtime(process.stderr), module
+        )
+
+        if fastest is None or imports[-1].cumulative_us < fastest[-1].cumulative_us:
+            fastest = imports
+
+    return DayImports(day, imports=fastest or ())
+
+
+def profile_days(
+    days: Iterable[Day], /, *, repeat: int = DEFAULT_REPEAT
+) -> Iterable[DayImports]:
+    """Profile importing each day's solution"""
+
+    return (profile_day(day, repeat=repeat) for day in days)
+
+
+def format_imports(
+    profiles: Iterable[DayImports],
+    /,
+    *,
+    top: int = DEFAULT_TOP,
+    budget_ms: Optional[float] = None,
+) -> str:
+    """
+    Format import profiles into a table, slowest solution first
+
+    Each solution's slowest imports (by their own time, excluding that of the
+    modules they import in turn) are listed below it.
+    """
+
+    rows: MutableSequence[Sequence[str]] = [
+        ("Year", "Day", "Import (ms)", "Modules", "Slowest imports (ms)", "Status")
+    ]
+
+    profile: DayImports
+    for profile in sorted(
+        profiles, key=lambda profile: profile.total_ms or 0.0, reverse=True
+    ):
+        slowest: Sequence[str] = tuple(
+            f"{timing.module} ({timing.self_us / MICROSECONDS_PER_MILLISECOND:.1f})"
+            for timing in profile.top(top)
+        ) or ("",)
+        status: str = (
+            f"error ({profile.error})"
+            if profile.error is not None
+            else "over budget" if profile.over_budget(budget_ms) else "ok"
+        )
+
+        rows.append(
+            (
+                str(profile.day.year),
+                str(profile.day.day),
+                (
+                    f"{profile.total_ms:.1f}"
+                    if profile.total_ms is not None
+                    else PLACEHOLDER
+                ),
+                str(len(profile.imports)),
+                slowest[0],
+                status,
+            )
+        )
+        rows.extend(("", "", "", "", timing, "") for timing in slowest[1:])
+
+    return format_table(rows)
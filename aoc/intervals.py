@@ -0,0 +1,252 @@
+"""Sets of integer intervals, stored compactly as parallel arrays of starts & ends"""
+
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, compress
+from typing import (
+    Final,
+    Iterable,
+    Iterator,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    overload,
+)
+
+# Constants
+TYPECODE: Final[str] = "q"  # Signed 64-bit bounds
+
+
+class Intervals:
+    """
+    Collection of half-open integer intervals, `[start, end)`, as in `range`
+
+    Intervals are held as two parallel arrays, of their `starts` & `ends`, rather
+    than as an object per interval. They're kept as given (e.g. as parsed, in order,
+    possibly overlapping) until normalised: sorted by start, with any overlapping or
+    touching intervals merged (and empty ones dropped). Membership and the set
+    operations work on the normalised intervals, which are computed once & kept.
+
+    Example:
+        >>> intervals = Intervals.from_inclusive((10, 3, 16, 12), (14, 5, 20, 18))
+        >>> assert list(intervals.normalise()) == [(3, 6), (10, 21)]
+        >>> assert 4 in intervals and 9 not in intervals
+        >>> assert intervals.total_length() == 14
+        >>> assert list(intervals - Intervals((12,), (15,))) == [
+        ...     (3, 6), (10, 12), (15, 21)
+        ... ]
+    """
+
+    starts: array
+    ends: array
+    _normalised: Optional["Intervals"]
+
+    def __init__(self, starts: Iterable[int] = (), ends: Iterable[int] = (), /) -> None:
+        self.starts = array(TYPECODE, starts)
+        self.ends = array(TYPECODE, ends)
+        self._normalised = None
+
+        if len(self.starts) != len(self.ends):
+            raise ValueError(
+                f"{len(self.starts)} starts don't pair up with {len(self.ends)} ends"
+            )
+
+    @classmethod
+    def from_inclusive(
+        cls, firsts: Iterable[int], lasts: Iterable[int], /
+    ) -> "Intervals":
+        """Build intervals from closed bounds, `[first, last]`, e.g. ID ranges"""
+
+        return cls(firsts, (last + 1 for last in lasts))
+
+    @classmethod
+    def from_normalised(
+        cls, starts: Sequence[int], ends: Sequence[int], /
+    ) -> "Intervals":
+        """
+        Wrap bounds which are already normalised, without copying them
+
+        Bounds needn't be arrays (e.g. they may be views of shared memory), though
+        only intervals with arrays of bounds can be combined by `union`.
+
+        Example:
+            >>> starts = memoryview(array(TYPECODE, (3, 10)))
+            >>> ends = memoryview(array(TYPECODE, (6, 21)))
+            >>> intervals = Intervals.from_normalised(starts, ends)
+            >>> assert 4 in intervals and intervals.total_length() == 14
+        """
+
+        intervals: Intervals = cls()
+        intervals.starts = starts
+        intervals.ends = ends
+        intervals._normalised = intervals
+
+        return intervals
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    @overload
+    def __getitem__(self, index: int, /) -> Tuple[int, int]: ...
+
+    @overload
+    def __getitem__(self, index: slice, /) -> "Intervals": ...
+
+    def __getitem__(self, index: int | slice, /) -> "Tuple[int, int] | Intervals":
+        """
+        An interval, or a slice of the intervals (as given, so not normalised)
+
+        Example:
+            >>> intervals = Intervals((1, 5, 9), (3, 7, 11))
+            >>> assert intervals[1] == (5, 7)
+            >>> assert list(intervals[1:]) == [(5, 7), (9, 11)]
+        """
+
+        if isinstance(index, slice):
+            return Intervals(self.starts[index], self.ends[index])
+
+        return (self.starts[index], self.ends[index])
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self.starts)}, {list(self.ends)})"
+
+    def __eq__(self, rhs: object, /) -> bool:
+        if not isinstance(rhs, Intervals):
+            return NotImplemented
+
+        lhs: Intervals = self.normalise()
+        rhs = rhs.normalise()
+
+        return lhs.starts == rhs.starts and lhs.ends == rhs.ends
+
+    def __contains__(self, value: int, /) -> bool:
+        normalised: Intervals = self.normalise()
+
+        # The last interval starting at (or before) the value is the only candidate
+        index: int = bisect_right(normalised.starts, value) - 1
+
+        return index >= 0 and value < normalised.ends[index]
+
+    def __or__(self, rhs: "Intervals", /) -> "Intervals":
+        return self.union(rhs)
+
+    def __and__(self, rhs: "Intervals", /) -> "Intervals":
+        return self.intersection(rhs)
+
+    def __sub__(self, rhs: "Intervals", /) -> "Intervals":
+        return self.difference(rhs)
+
+    def normalise(self) -> "Intervals":
+        """The equivalent sorted, disjoint (and non-touching) intervals"""
+
+        if self._normalised is not None:
+            return self._normalised
+
+        # Sort by start, dropping empty intervals
+        order: Sequence[int] = sorted(
+            (
+                index
+                for index, (start, end) in enumerate(zip(self.starts, self.ends))
+                if start < end
+            ),
+            key=self.starts.__getitem__,
+        )
+        starts: Sequence[int] = [self.starts[index] for index in order]
+        ends: Sequence[int] = [self.ends[index] for index in order]
+
+        # How far the intervals so far reach. Any interval starting beyond the reach
+        # of all those before it is disjoint from them, so starts a merged interval
+        reach: Sequence[int] = list(accumulate(ends, max))
+        breaks: Sequence[bool] = [
+            start > previous_reach for start, previous_reach in zip(starts[1:], reach)
+        ]
+
+        self._normalised = Intervals.from_normalised(
+            array(TYPECODE, [*starts[:1], *compress(starts[1:], breaks)]),
+            array(TYPECODE, [*compress(reach, breaks), *reach[-1:]]),
+        )
+
+        return self._normalised
+
+    def total_length(self) -> int:
+        """Count of integers within any of the intervals"""
+
+        normalised: Intervals = self.normalise()
+
+        return sum(normalised.ends) - sum(normalised.starts)
+
+    def union(self, rhs: "Intervals", /) -> "Intervals":
+        """Integers within either these intervals or another's"""
+
+        return Intervals(self.starts + rhs.starts, self.ends + rhs.ends).normalise()
+
+    def intersection(self, rhs: "Intervals", /) -> "Intervals":
+        """Integers within both these intervals and another's"""
+
+        lhs: Intervals = self.normalise()
+        rhs = rhs.normalise()
+        starts: MutableSequence[int] = []
+        ends: MutableSequence[int] = []
+
+        # Sweep both (sorted) intervals in step, always advancing past whichever
+        # interval ends first, as it can't overlap anything beyond the other
+        index_lhs: int = 0
+        index_rhs: int = 0
+        while index_lhs < len(lhs) and index_rhs < len(rhs):
+            end_lhs: int = lhs.ends[index_lhs]
+            end_rhs: int = rhs.ends[index_rhs]
+            start: int = max(lhs.starts[index_lhs], rhs.starts[index_rhs])
+            end: int = min(end_lhs, end_rhs)
+
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+
+            if end_lhs < end_rhs:
+                index_lhs += 1
+            else:
+                index_rhs += 1
+
+        return Intervals.from_normalised(
+            array(TYPECODE, starts), array(TYPECODE, ends)
+        )
+
+    def difference(self, rhs: "Intervals", /) -> "Intervals":
+        """Integers within these intervals, but not another's"""
+
+        lhs: Intervals = self.normalise()
+        rhs = rhs.normalise()
+        starts: MutableSequence[int] = []
+        ends: MutableSequence[int] = []
+
+        index_rhs: int = 0
+
+        start: int
+        end: int
+        for start, end in lhs:
+            # Skip past what's removed before this interval (but not what might also
+            # overlap the next)
+            while index_rhs < len(rhs) and rhs.ends[index_rhs] <= start:
+                index_rhs += 1
+
+            # Keep the gaps between whatever's removed from within this interval
+            index: int = index_rhs
+            while index < len(rhs) and rhs.starts[index] < end:
+                if rhs.starts[index] > start:
+                    starts.append(start)
+                    ends.append(rhs.starts[index])
+
+                start = max(start, rhs.ends[index])
+                index += 1
+
+            if start < end:
+                starts.append(start)
+                ends.append(end)
+
+        return Intervals.from_normalised(
+            array(TYPECODE, starts), array(TYPECODE, ends)
+        )
@@ -0,0 +1,38 @@
+"""Lazy importing of modules, deferring their cost until they're first used"""
+
+import importlib.util
+import sys
+from importlib.machinery import ModuleSpec
+from types import ModuleType
+from typing import Optional
+
+
+def lazy_import(name: str, /) -> ModuleType:
+    """
+    Import a module lazily, only executing it when an attribute is first accessed
+
+    Keeps modules which are only needed by some commands (or code paths) off the
+    import path of every other. As accessing any attribute executes the module,
+    lazy modules mustn't be used in annotations which are evaluated (e.g. those of
+    function signatures), nor be `from`-imported.
+
+    Example:
+        >>> colorsys = lazy_import("colorsys")
+        >>> assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    """
+
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec: Optional[ModuleSpec] = importlib.util.find_spec(name)
+
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+
+    return module
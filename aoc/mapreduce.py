@@ -0,0 +1,327 @@
+"""Map-reduce over chunks of a single (huge) input: of its lines, or parsed items"""
+
+import itertools
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from aoc.backends import concurrent_futures, make_executor, resolve_backend
+from aoc.discovery import Day, load_module
+from aoc.reader import CHUNK_SIZE, STDIN, is_mappable
+from aoc.shared import SharedInput, attach, share
+
+# Constants
+CHUNKS_PER_JOB: Final[int] = 4  # More chunks than workers evens out their load
+BYTES_PER_MEGABYTE: Final[int] = 1_000_000
+
+
+# Exceptions
+class ChunkingNotSupportedError(Exception):
+    """Exception thrown when a day (or its input) can't be solved a chunk at a time"""
+
+
+# Models
+@dataclass(frozen=True)
+class ChunkedResult:
+    """Answers to both parts, as reduced from every chunk of an input"""
+
+    answers: Sequence[int]
+    chunks: int
+    size: int
+    elapsed: float
+
+    @property
+    def megabytes_per_second(self) -> float:
+        return self.size / BYTES_PER_MEGABYTE / self.elapsed if self.elapsed else 0.0
+
+
+def split_offsets(path: Path, chunks: int, /) -> Sequence[Tuple[int, int]]:
+    """
+    Split a file into (up to) `chunks` (start, end) byte ranges of whole lines
+
+    Each range starts just after a newline (or at the start of the file), so no
+    line is split between two chunks.
+    """
+
+    size: int = os.path.getsize(path)
+    starts: MutableSequence[int] = [0]
+
+    file: IO[bytes]
+    with open(path, "rb") as file:
+        index: int
+        for index in range(1, chunks):
+            file.seek(max(size * index // chunks, starts[-1]))
+
+            # Skip to the end of whichever line the (approximate) offset fell in
+            file.readline()
+
+            if file.tell() >= size:
+                break
+
+            if file.tell() > starts[-1]:
+                starts.append(file.tell())
+
+    return tuple(zip(starts, (*starts[1:], size)))
+
+
+def iter_range_lines(path: Path, start: int, end: int, /) -> Iterator[str]:
+    """Iterate the (non-empty) lines within a byte range of a file, as text"""
+
+    remaining: int = end - start
+    remainder: bytes = b""
+
+    file: IO[bytes]
+    with open(path, "rb") as file:
+        file.seek(start)
+
+        while remaining > 0:
+            block: bytes = file.read(min(CHUNK_SIZE, remaining))
+
+            if not block:
+                break
+
+            remaining -= len(block)
+
+            lines: MutableSequence[bytes] = (remainder + block).split(b"\n")
+            remainder = lines.pop()
+
+            yield from (line.decode("utf-8") for line in lines if line)
+
+    if remainder:
+        yield remainder.decode("utf-8")
+
+
+def solve_chunk(day: Day, path: Path, start: int, end: int, /) -> Any:
+    """Summarise a single chunk of an input (in a worker process)"""
+
+    return load_module(day).solve_chunk(iter_range_lines(path, start, end))
+
+
+def load_chunked_module(day: Day, /) -> ModuleType:
+    """Load a day's solution, checking it can be solved a chunk at a time"""
+
+    module: ModuleType = load_module(day)
+
+    if not callable(getattr(module, "solve_chunk", None)) or not callable(
+        getattr(module, "combine_chunks", None)
+    ):
+        raise ChunkingNotSupportedError(
+            f"{day} can't be solved a chunk at a time "
+            "(it has no `solve_chunk` & `combine_chunks`)"
+        )
+
+    return module
+
+
+def solve_chunked(
+    day: Day,
+    path: Optional[Path] = None,
+    /,
+    *,
+    jobs: int = 1,
+    chunks: Optional[int] = None,
+    backend: Optional[str] = None,
+) -> ChunkedResult:
+    """
+    Solve both parts of a day by splitting its input into chunks of whole lines
+
+    Each chunk is parsed & summarised by the solution's `solve_chunk(lines)` in a
+    worker (a process, or a thread on free-threaded builds, unless a backend is
+    given), then the summaries (in input order) are reduced to each part's answer
+    by `combine_chunks(summaries)`. Summaries needn't be partial answers, so state
+    carried from line to line can still be split, by summarising each chunk as a
+    function of the state it starts in.
+
+    Only plain files can be split (not stdin, or compressed files), and by
+    default the input is split into `CHUNKS_PER_JOB` chunks per worker.
+    """
+
+    path = path or day.input_path
+
+    if not is_mappable(path):
+        raise ChunkingNotSupportedError(
+            f"{path} can't be split into chunks (only plain files can be)"
+        )
+
+    combine: Callable[[Sequence[Any]], Sequence[int]] = load_chunked_module(
+        day
+    ).combine_chunks
+
+    started: float = time.perf_counter()
+    offsets: Sequence[Tuple[int, int]] = split_offsets(
+        path, chunks or jobs * CHUNKS_PER_JOB
+    )
+
+    executor: concurrent_futures.Executor
+    with make_executor(resolve_backend(backend), jobs=jobs) as executor:
+        summaries: Sequence[Any] = tuple(
+            executor.map(
+                solve_chunk,
+                *zip(*((day, path, start, end) for start, end in offsets)),
+            )
+        )
+
+    answers: Sequence[int] = tuple(combine(summaries))
+
+    return ChunkedResult(
+        answers=answers,
+        chunks=len(offsets),
+        size=os.path.getsize(path),
+        elapsed=time.perf_counter() - started,
+    )
+
+
+def split_shards(length: int, shards: int, /) -> Sequence[Tuple[int, int]]:
+    """
+    Split `length` items into (up to) `shards` (start, stop) ranges of even size
+
+    Example:
+        >>> assert split_shards(10, 3) == ((0, 3), (3, 6), (6, 10))
+        >>> assert split_shards(2, 3) == ((0, 1), (1, 2))
+    """
+
+    shards = max(1, min(shards, length))
+
+    return tuple(
+        (length * index // shards, length * (index + 1) // shards)
+        for index in range(shards)
+    )
+
+
+def solve_shard(day: Day, shard: Any, /) -> Any:
+    """Summarise a single shard of a parsed input (in a worker)"""
+
+    return load_module(day).solve_shard(shard)
+
+
+def solve_shared_shard(day: Day, handle: SharedInput, start: int, stop: int, /) -> Any:
+    """Summarise a single shard of a parsed input in shared memory (in a worker)"""
+
+    module: ModuleType = load_module(day)
+
+    views: Mapping[str, memoryview]
+    with attach(handle) as views:
+        return module.solve_shard(module.import_input(views)[start:stop])
+
+
+def load_sharded_module(day: Day, /) -> ModuleType:
+    """Load a day's solution, checking it can be solved a shard at a time"""
+
+    module: ModuleType = load_module(day)
+
+    if not callable(getattr(module, "solve_shard", None)) or not callable(
+        getattr(module, "combine_chunks", None)
+    ):
+        raise ChunkingNotSupportedError(
+            f"{day} can't be solved a shard of its parsed input at a time "
+            "(it has no `solve_shard` & `combine_chunks`)"
+        )
+
+    return module
+
+
+def map_shards(
+    day: Day,
+    data: Any,
+    executor: "concurrent_futures.Executor",
+    /,
+    *,
+    shards: int,
+    shared: bool = True,
+) -> Sequence[int]:
+    """
+    Solve both parts of a day from its parsed input, a shard at a time
+
+    The parsed input is sliced into shards, each summarised by the solution's
+    `solve_shard(shard)` in a worker, then reduced by `combine_chunks(summaries)`.
+    Worker threads share the parsed input. Worker processes attach to it in shared
+    memory, if the solution can export it (see `aoc.shared`) and `shared` isn't
+    disabled, otherwise each shard is pickled to them.
+    """
+
+    module: ModuleType = load_sharded_module(day)
+    bounds: Sequence[Tuple[int, int]] = split_shards(len(data), shards)
+    summaries: Sequence[Any]
+
+    if (
+        shared
+        and isinstance(executor, concurrent_futures.ProcessPoolExecutor)
+        and callable(getattr(module, "import_input", None))
+    ):
+        handle: SharedInput
+        with share(module.export_input(data)) as handle:
+            summaries = tuple(
+                executor.map(
+                    solve_shared_shard,
+                    itertools.repeat(day),
+                    itertools.repeat(handle),
+                    (start for start, _ in bounds),
+                    (stop for _, stop in bounds),
+                )
+            )
+    else:
+        summaries = tuple(
+            executor.map(
+                solve_shard,
+                itertools.repeat(day),
+                (data[start:stop] for start, stop in bounds),
+            )
+        )
+
+    return tuple(module.combine_chunks(summaries))
+
+
+def solve_sharded(
+    day: Day,
+    path: Optional[Path] = None,
+    /,
+    *,
+    jobs: int = 1,
+    shards: Optional[int] = None,
+    backend: Optional[str] = None,
+) -> ChunkedResult:
+    """
+    Solve both parts of a day by parsing its input once, then sharding the result
+
+    Unlike `solve_chunked`, any input can be parsed (including stdin, or compressed
+    files), and shards are solved from parsed items rather than raw lines, so best
+    suit worker threads (on free-threaded builds, where they're used by default).
+    By default, the input is split into `CHUNKS_PER_JOB` shards per worker.
+    """
+
+    path = path or day.input_path
+    module: ModuleType = load_sharded_module(day)
+
+    started: float = time.perf_counter()
+
+    # Lazily parsed inputs are gathered up, so that they can be sliced into shards
+    data: Any = module.read_input(path)
+    if not hasattr(data, "__getitem__"):
+        data = tuple(data)
+
+    shards = shards or jobs * CHUNKS_PER_JOB
+
+    executor: concurrent_futures.Executor
+    with make_executor(resolve_backend(backend), jobs=jobs) as executor:
+        answers: Sequence[int] = map_shards(day, data, executor, shards=shards)
+
+    return ChunkedResult(
+        answers=answers,
+        chunks=len(split_shards(len(data), shards)),
+        size=os.path.getsize(path) if str(path) != STDIN else 0,
+        elapsed=time.perf_counter() - started,
+    )
@@ -0,0 +1,141 @@
+"""Peak-memory & allocation-site instrumentation (via tracemalloc)"""
+
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Final, Optional, Self, Sequence, Type
+
+# Constants
+DEFAULT_TOP: Final[int] = 3
+UNITS: Final[Sequence[str]] = ("B", "KiB", "MiB", "GiB", "TiB")
+SUFFIXES: Final[str] = "KMGT"
+
+# Allocations made by the instrumentation itself (and the runner) aren't of interest
+EXCLUDED: Final[Sequence[tracemalloc.Filter]] = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, str(Path(__file__).with_name("runner.py"))),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+# Exceptions
+class MemoryBudgetExceededError(Exception):
+    """Exception thrown when a solution's peak memory exceeds its budget"""
+
+
+# Models
+@dataclass(frozen=True)
+class AllocationSite:
+    """Memory still allocated, at the end of a phase, from a single line of code"""
+
+    filename: str
+    lineno: int
+    size: int
+    count: int
+
+    def __str__(self) -> str:
+        return f"{Path(self.filename).name}:{self.lineno} ({format_bytes(self.size)})"
+
+
+@dataclass(frozen=True)
+class MemoryUsage:
+    """Memory allocated (and traced) during a phase, in bytes"""
+
+    peak: int
+    retained: int
+    sites: Sequence[AllocationSite] = ()
+
+
+class MemoryTracer:
+    """
+    Context manager tracing the memory allocated within it
+
+    Only allocations made within the context count, so e.g. a part's usage excludes
+    the parsed input it was given. Tracing slows allocation-heavy code considerably,
+    so timings taken alongside it are inflated.
+    """
+
+    usage: MemoryUsage
+    top: int
+    _started: bool
+
+    def __init__(self, *, top: int = DEFAULT_TOP) -> None:
+        self.usage = MemoryUsage(peak=0, retained=0)
+        self.top = top
+        self._started = False
+
+    def __enter__(self) -> Self:
+        self._started = not tracemalloc.is_tracing()
+
+        if self._started:
+            tracemalloc.start()
+        else:
+            tracemalloc.clear_traces()
+
+        tracemalloc.reset_peak()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        retained: int
+        peak: int
+        retained, peak = tracemalloc.get_traced_memory()
+
+        statistics: Sequence[tracemalloc.Statistic] = (
+            tracemalloc.take_snapshot().filter_traces(EXCLUDED).statistics("lineno")
+        )
+
+        if self._started:
+            tracemalloc.stop()
+
+        self.usage = MemoryUsage(
+            peak=peak,
+            retained=retained,
+            sites=tuple(
+                AllocationSite(
+                    filename=statistic.traceback[0].filename,
+                    lineno=statistic.traceback[0].lineno,
+                    size=statistic.size,
+                    count=statistic.count,
+                )
+                for statistic in statistics[: self.top]
+            ),
+        )
+
+
+def format_bytes(size: Optional[float], /) -> str:
+    """Format a size in bytes with a binary unit, e.g. `1.5 MiB`"""
+
+    if size is None:
+        return "-"
+
+    unit: str
+    for unit in UNITS[:-1]:
+        if abs(size) < 1024:
+            break
+
+        size /= 1024
+    else:
+        unit = UNITS[-1]
+
+    return f"{size:.0f} {unit}" if unit == UNITS[0] else f"{size:.1f} {unit}"
+
+
+def parse_bytes(value: str, /) -> int:
+    """Parse a size in bytes, with an optional binary suffix, e.g. `64M`"""
+
+    value = value.strip().upper().removesuffix("IB").removesuffix("B")
+
+    if value and value[-1] in SUFFIXES:
+        return int(float(value[:-1]) * 1024 ** (SUFFIXES.index(value[-1]) + 1))
+
+    return int(value)
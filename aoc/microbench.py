@@ -0,0 +1,175 @@
+"""Micro-benchmarks comparing alternative implementations of the same operation"""
+
+import gc
+import importlib
+from dataclasses import dataclass
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterable,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+)
+
+from aoc.bench import Statistics
+from aoc.lazy import lazy_import
+from aoc.report import format_seconds, format_table
+
+# Only needed once a suite is run
+timeit: ModuleType = lazy_import("timeit")
+
+# Constants
+PACKAGE_SUITES: Final[str] = "aoc.benchmarks"
+SUITES: Final[Sequence[str]] = (
+    "reader",
+    "grid",
+    "digits",
+    "intervals",
+    "parallel",
+)
+DEFAULT_REPEAT: Final[int] = 5
+DEFAULT_NUMBER: Final[int] = 1
+
+
+# Exceptions
+class SuiteNotFoundError(LookupError):
+    """Exception thrown when there's no micro-benchmark suite by a given name"""
+
+
+# Models
+@dataclass(frozen=True)
+class Case:
+    """
+    A single implementation of an operation
+
+    Cases in the same `group` perform the same operation (on the same workload),
+    so must return equal results, and are compared against the group's first case.
+    """
+
+    group: str
+    name: str
+    func: Callable[[], Any]
+    items: int = 1
+
+
+@dataclass(frozen=True)
+class CaseResult:
+    """Timings (per call, in seconds) of a single case"""
+
+    case: Case
+    statistics: Statistics
+    matches: bool
+
+    @property
+    def per_item(self) -> float:
+        """Fastest time per item processed, in seconds"""
+
+        return self.statistics.min / max(1, self.case.items)
+
+
+def load_suite(name: str, /) -> ModuleType:
+    """
+    Load a suite of micro-benchmarks, found at `aoc/benchmarks/<name>.py`
+
+    Suites expose a `DEFAULT_SIZE` and a `cases(*, size)` context manager, which
+    prepares a workload of the given size and yields the cases to run against it.
+    """
+
+    if name not in SUITES:
+        raise SuiteNotFoundError(
+            f"No such suite {name!r} (available: {', '.join(SUITES)})"
+        )
+
+    return importlib.import_module(f"{PACKAGE_SUITES}.{name}")
+
+
+def measure(
+    case: Case,
+    /,
+    *,
+    repeat: int = DEFAULT_REPEAT,
+    number: int = DEFAULT_NUMBER,
+) -> Statistics:
+    """Time a case, per call"""
+
+    gc.collect()
+
+    timings: Sequence[float] = timeit.Timer(case.func).repeat(
+        repeat=repeat, number=number
+    )
+
+    return Statistics.from_samples([timing / number for timing in timings])
+
+
+def run_suite(
+    name: str,
+    /,
+    *,
+    size: Optional[int] = None,
+    repeat: int = DEFAULT_REPEAT,
+    number: int = DEFAULT_NUMBER,
+) -> Sequence[CaseResult]:
+    """Run every case in a suite, checking cases within a group agree"""
+
+    suite: ModuleType = load_suite(name)
+    results: MutableSequence[CaseResult] = []
+    expected: MutableMapping[str, Any] = {}
+
+    cases: Iterable[Case]
+    with suite.cases(size=size or suite.DEFAULT_SIZE) as cases:
+        case: Case
+        for case in cases:
+            # Calling the case up-front doubles as a warmup
+            result: Any = case.func()
+            expected.setdefault(case.group, result)
+
+            results.append(
+                CaseResult(
+                    case=case,
+                    statistics=measure(case, repeat=repeat, number=number),
+                    matches=result == expected[case.group],
+                )
+            )
+
+    return results
+
+
+def format_results(results: Iterable[CaseResult], /) -> str:
+    """Format case results into a table, relative to the first case of each group"""
+
+    rows: MutableSequence[Sequence[str]] = [
+        (
+            "Group",
+            "Case",
+            "Items",
+            "Min (s)",
+            "Median (s)",
+            "Per item (ns)",
+            "Speedup",
+            "Status",
+        )
+    ]
+    references: MutableMapping[str, CaseResult] = {}
+
+    result: CaseResult
+    for result in results:
+        reference: CaseResult = references.setdefault(result.case.group, result)
+
+        rows.append(
+            (
+                result.case.group,
+                result.case.name,
+                str(result.case.items),
+                format_seconds(result.statistics.min),
+                format_seconds(result.statistics.median),
+                f"{result.per_item * 1e9:.1f}",
+                f"{reference.statistics.min / result.statistics.min:.2f}x",
+                "ok" if result.matches else "MISMATCH",
+            )
+        )
+
+    return format_table(rows)
@@ -0,0 +1,132 @@
+"""Deterministic (cProfile) profiling of phases, as `.pstats` & collapsed stacks"""
+
+import contextlib
+import cProfile
+import pstats
+from collections import defaultdict
+from pathlib import Path
+from typing import (
+    Final,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+    TypeAlias,
+)
+
+# Constants
+SUFFIX_PSTATS: Final[str] = ".pstats"
+SUFFIX_COLLAPSED: Final[str] = ".collapsed"
+DEFAULT_DIRECTORY: Final[Path] = Path("profiles")
+FRAME_SEP: Final[str] = ";"
+MIN_MICROSECONDS: Final[int] = 1  # Stacks with less (self) time are dropped
+
+
+# Typing
+Function: TypeAlias = Tuple[str, int, str]  # (filename, line number, name)
+Edge: TypeAlias = Tuple[Function, float]  # (callee, cumulative time via the call)
+
+
+def format_function(function: Function, /) -> str:
+    """Format a profiled function as a frame, e.g. `parse_rule (app.py:42)`"""
+
+    filename: str
+    lineno: int
+    name: str
+    filename, lineno, name = function
+
+    # Built-ins have no source location
+    if filename == "~":
+        return name
+
+    return f"{name} ({Path(filename).name}:{lineno})"
+
+
+def collapse_stats(stats: pstats.Stats, /) -> Mapping[str, int]:
+    """
+    Reconstruct collapsed stacks (and their self time, in microseconds) from stats
+
+    cProfile only records caller/callee pairs rather than entire stacks, so each
+    function's time is split across its callers in proportion to the time spent
+    beneath each call site. Recursive calls are folded into the outermost frame.
+    """
+
+    entries: Mapping[Function, Tuple[int, int, float, float, Mapping]] = (
+        stats.stats  # type: ignore[attr-defined]
+    )
+    callees: MutableMapping[Function, MutableSequence[Edge]] = defaultdict(list)
+    roots: MutableSequence[Function] = []
+
+    function: Function
+    for function, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            roots.append(function)
+
+        caller: Function
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees[caller].append((function, cumulative))
+
+    stacks: MutableMapping[str, int] = defaultdict(int)
+
+    def walk(function: Function, stack: Sequence[str], share: float, /) -> None:
+        self_time: float = entries[function][2] * share
+        frames: Sequence[str] = (*stack, format_function(function))
+
+        if round(self_time * 1e6) >= MIN_MICROSECONDS:
+            stacks[FRAME_SEP.join(frames)] += round(self_time * 1e6)
+
+        callee: Function
+        via: float
+        for callee, via in callees[function]:
+            callee_cumulative: float = entries[callee][3]
+
+            if format_function(callee) in frames or not callee_cumulative:
+                continue
+
+            # The callee's time beneath this stack, relative to its total time
+            callee_share: float = min(1.0, share * via / callee_cumulative)
+
+            if callee_share * callee_cumulative * 1e6 >= MIN_MICROSECONDS:
+                walk(callee, frames, callee_share)
+
+    root: Function
+    for root in roots:
+        walk(root, (), 1.0)
+
+    return stacks
+
+
+def write_collapsed(stats: pstats.Stats, path: Path, /) -> None:
+    """Write collapsed stacks, one `frame;frame;... microseconds` per line"""
+
+    stacks: Mapping[str, int] = collapse_stats(stats)
+
+    with open(path, "w", encoding="utf-8") as file:
+        stack: str
+        for stack in sorted(stacks):
+            file.write(f"{stack} {stacks[stack]}\n")
+
+
+@contextlib.contextmanager
+def profile(prefix: Path, /) -> Iterator[cProfile.Profile]:
+    """
+    Profile the code within the context, writing `<prefix>.pstats` (readable by
+    `python -m pstats`, snakeviz, etc.) and `<prefix>.collapsed` (readable by
+    flamegraph.pl, speedscope, etc.) once it exits
+    """
+
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(prefix.with_name(prefix.name + SUFFIX_PSTATS))
+        write_collapsed(
+            pstats.Stats(profiler), prefix.with_name(prefix.name + SUFFIX_COLLAPSED)
+        )
@@ -0,0 +1,339 @@
+"""Memory-mapped (or streamed), bytes-level reading of (potentially huge) inputs"""
+
+import mmap
+import os
+import re
+import sys
+from array import array
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import (
+    IO,
+    Any,
+    Final,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from aoc.lazy import lazy_import
+
+# Constants
+FILENAME_INPUT: Final[str] = "input"
+STDIN: Final[str] = "-"
+CHUNK_SIZE: Final[int] = 1 << 20  # Bytes read at a time, when streaming
+SECTION_SEP: Final[bytes] = b"\n\n"
+TYPECODE_INT: Final[str] = "q"  # signed 64-bit
+
+PATTERN_LINE: Final[re.Pattern[bytes]] = re.compile(rb"[^\n]+")
+
+# Translation table blanking every byte but ASCII digits, so integers can be split out
+# by `bytes.split` (which is considerably faster than matching a pattern)
+NON_DIGITS_TO_SPACE: Final[bytes] = bytes(
+    byte if ord("0") <= byte <= ord("9") else ord(" ") for byte in range(256)
+)
+
+
+# Modules (by suffix) opening compressed inputs, which decompress as they're read.
+# They're only imported once such an input is opened
+DECOMPRESSORS: Final[Mapping[str, ModuleType]] = {
+    ".gz": lazy_import("gzip"),
+    ".xz": lazy_import("lzma"),
+    ".bz2": lazy_import("bz2"),
+}
+
+
+def is_mappable(path: Path | str, /) -> bool:
+    """Whether an input is a plain file (rather than stdin, or compressed)"""
+
+    return str(path) != STDIN and Path(path).suffix.lower() not in DECOMPRESSORS
+
+
+def open_input(path: Path | str = FILENAME_INPUT, /, *, text: bool = False) -> IO[Any]:
+    """
+    Open an input to be streamed, in binary (or UTF-8 text) mode
+
+    The input is either a file, `-` for stdin, or a file compressed with gzip, xz or
+    bzip2 (going by its suffix), which is decompressed as it's read, so is never
+    held (decompressed) in memory or on disk in its entirety.
+    """
+
+    mode: str = "rt" if text else "rb"
+    encoding: Optional[str] = "utf-8" if text else None
+
+    if str(path) == STDIN:
+        # Closing the input mustn't close stdin itself
+        return open(sys.stdin.fileno(), mode, encoding=encoding, closefd=False)
+
+    decompressor: Optional[ModuleType] = DECOMPRESSORS.get(Path(path).suffix.lower())
+
+    if decompressor is not None:
+        return decompressor.open(path, mode, encoding=encoding)
+
+    return open(path, mode, encoding=encoding)
+
+
+def iter_chunks(file: IO[bytes], /, separator: bytes = b"\n") -> Iterator[bytes]:
+    """
+    Stream a file in chunks (of about `CHUNK_SIZE` bytes) ending on a separator
+
+    Chunks only end on a separator (or at the end of the file), so never split
+    e.g. a line or an integer across two chunks.
+    """
+
+    remainder: bytes = b""
+
+    while chunk := file.read(CHUNK_SIZE):
+        end: int = chunk.rfind(separator) + len(separator)
+
+        if end < len(separator):
+            remainder += chunk
+            continue
+
+        yield remainder + chunk[:end]
+
+        remainder = chunk[end:]
+
+    if remainder:
+        yield remainder
+
+
+def iter_lines(buffer: memoryview, /) -> Iterator[memoryview]:
+    """Iterate the (non-empty) lines of a buffer as zero-copy views, without newlines"""
+
+    match: re.Match[bytes]
+    for match in PATTERN_LINE.finditer(buffer):
+        yield buffer[match.start() : match.end()]
+
+
+def split_sections(
+    buffer: memoryview, /, separator: bytes = SECTION_SEP
+) -> Sequence[memoryview]:
+    """Split a buffer into zero-copy views of its sections, e.g. on blank lines"""
+
+    sections: MutableSequence[memoryview] = []
+    start: int = 0
+
+    match: re.Match[bytes]
+    for match in re.finditer(re.escape(separator), buffer):
+        sections.append(buffer[start : match.start()])
+        start = match.end()
+
+    sections.append(buffer[start:])
+
+    return sections
+
+
+def parse_ints(buffer: memoryview, /, *, typecode: str = TYPECODE_INT) -> array:
+    """
+    Parse every (non-negative) integer in a buffer, regardless of separators
+
+    Example:
+        >>> assert list(parse_ints(memoryview(b"47|53\\n97|13"))) == [47, 53, 97, 13]
+    """
+
+    digits: bytes = bytes(buffer).translate(NON_DIGITS_TO_SPACE)
+
+    return array(typecode, map(int, digits.split()))
+
+
+def parse_int_columns(
+    buffer: memoryview, columns: int, /, *, typecode: str = TYPECODE_INT
+) -> Sequence[array]:
+    """
+    Parse the (non-negative) integers in a buffer into `columns` columns
+
+    Example:
+        >>> lhs, rhs = parse_int_columns(memoryview(b"3   4\\n4   3\\n"), 2)
+        >>> assert (list(lhs), list(rhs)) == ([3, 4], [4, 3])
+    """
+
+    return split_columns(parse_ints(buffer, typecode=typecode), columns)
+
+
+def split_columns(integers: array, columns: int, /) -> Sequence[array]:
+    """Split integers (in row-major order) into `columns` columns"""
+
+    if len(integers) % columns != 0:
+        raise ValueError(
+            f"{len(integers)} integers cannot be split into {columns} columns"
+        )
+
+    return tuple(integers[column::columns] for column in range(columns))
+
+
+def read_ints(
+    path: Path | str = FILENAME_INPUT, /, *, typecode: str = TYPECODE_INT
+) -> array:
+    """
+    Parse every (non-negative) integer in an input
+
+    Plain files are mapped, anything else (see `open_input`) is streamed in chunks,
+    so only the integers themselves are ever held in memory.
+    """
+
+    if is_mappable(path):
+        input_: MappedInput
+        with MappedInput(path) as input_:
+            return input_.ints(typecode=typecode)
+
+    integers: array = array(typecode)
+
+    file: IO[bytes]
+    with open_input(path) as file:
+        chunk: bytes
+        for chunk in iter_chunks(file):
+            integers.extend(map(int, chunk.translate(NON_DIGITS_TO_SPACE).split()))
+
+    return integers
+
+
+def read_int_columns(
+    path: Path | str, columns: int, /, *, typecode: str = TYPECODE_INT
+) -> Sequence[array]:
+    """Parse the (non-negative) integers in an input into `columns` columns"""
+
+    return split_columns(read_ints(path, typecode=typecode), columns)
+
+
+def parse_int_rows(
+    buffer: memoryview, /, separator: Optional[bytes] = None
+) -> Sequence[Tuple[int, ...]]:
+    """
+    Parse each (non-empty) line of a buffer into a row of integers
+
+    Rows may be of differing lengths, and their integers are split on `separator`
+    (or whitespace, if not given).
+
+    Example:
+        >>> rows = parse_int_rows(memoryview(b"1,2,3\\n4,5\\n"), b",")
+        >>> assert rows == [(1, 2, 3), (4, 5)]
+    """
+
+    return [
+        tuple(map(int, line.split(separator)))
+        for line in bytes(buffer).split(b"\n")
+        if line
+    ]
+
+
+class MappedInput:
+    """
+    Read-only, memory-mapped view of an input file
+
+    Lines and sections are handed out as zero-copy `memoryview`s of the mapping.
+    If any are still referenced once the input is closed, the mapping is kept alive
+    until they are garbage collected, so copy them (e.g. with `bytes`) if they're
+    to be kept around. Inputs which can't be mapped (stdin, or compressed files)
+    are read into memory in their entirety instead.
+
+    Example:
+        >>> with MappedInput("input") as input_:  # doctest: +SKIP
+        ...     lhs, rhs = input_.int_columns(2)
+    """
+
+    path: Path
+    _mmap: Optional[mmap.mmap]
+    _buffer: mmap.mmap | bytes
+    _view: memoryview
+
+    def __init__(self, path: Path | str = FILENAME_INPUT, /) -> None:
+        self.path = Path(path)
+        self._mmap = None
+
+        if not is_mappable(path):
+            stream: IO[bytes]
+            with open_input(path) as stream:
+                self._buffer = stream.read()
+        else:
+            with open(self.path, "rb") as file:
+                # Empty files can't be mapped, but there's nothing to map anyway
+                if os.fstat(file.fileno()).st_size:
+                    self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            self._buffer = self._mmap if self._mmap is not None else b""
+
+        self._view = memoryview(self._buffer)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def view(self) -> memoryview:
+        """Zero-copy view of the entire input"""
+
+        return self._view
+
+    def close(self) -> None:
+        """Unmap the input (once no views of it remain)"""
+
+        self._view.release()
+
+        if self._mmap is None:
+            return
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Views handed out are still alive, the mapping is closed when they're
+            # garbage collected instead.
+            pass
+
+    def lines(self) -> Iterator[memoryview]:
+        """Iterate the (non-empty) lines of the input as zero-copy views"""
+
+        # Searching the buffer directly is cheaper than matching a pattern per line
+        find = self._buffer.find
+        end: int = len(self._buffer)
+        start: int = 0
+
+        while start < end:
+            stop: int = find(b"\n", start)
+
+            if stop < 0:
+                stop = end
+
+            if stop > start:
+                yield self._view[start:stop]
+
+            start = stop + 1
+
+    def sections(self, separator: bytes = SECTION_SEP, /) -> Sequence[memoryview]:
+        """Split the input into zero-copy views of its sections"""
+
+        return split_sections(self._view, separator)
+
+    def ints(self, *, typecode: str = TYPECODE_INT) -> array:
+        """Parse every (non-negative) integer in the input"""
+
+        return parse_ints(self._view, typecode=typecode)
+
+    def int_columns(
+        self, columns: int, /, *, typecode: str = TYPECODE_INT
+    ) -> Sequence[array]:
+        """Parse the (non-negative) integers in the input into columns"""
+
+        return parse_int_columns(self._view, columns, typecode=typecode)
+
+    def int_rows(
+        self, separator: Optional[bytes] = None, /
+    ) -> Sequence[Tuple[int, ...]]:
+        """Parse each line of the input into a row of integers"""
+
+        return parse_int_rows(self._view, separator)
@@ -0,0 +1,178 @@
+"""Plain-text reporting of run results"""
+
+from typing import Final, Iterable, MutableSequence, Optional, Sequence
+
+from aoc.memory import format_bytes
+from aoc.runner import DayResult, Phase, PhaseResult, Timing
+
+# Constants
+COLUMN_SEP: Final[str] = "  "
+PLACEHOLDER: Final[str] = "-"
+HEADERS: Final[Sequence[str]] = (
+    "Year",
+    "Day",
+    "Part 1",
+    "Part 2",
+    "Parse (s)",
+    "Wall (s)",
+    "CPU (s)",
+    "Status",
+)
+COUNTER_HEADERS: Final[Sequence[str]] = ("Year", "Day", "Phase", "Counter", "Count")
+MEMORY_HEADERS: Final[Sequence[str]] = (
+    "Year",
+    "Day",
+    "Phase",
+    "Peak",
+    "Retained",
+    "Peak per input byte",
+    "Top allocation sites",
+)
+
+
+def format_seconds(seconds: Optional[float], /) -> str:
+    """Format a duration in seconds (or a placeholder if there isn't one)"""
+
+    return PLACEHOLDER if seconds is None else f"{seconds:.4f}"
+
+
+def format_table(rows: Sequence[Sequence[str]], /) -> str:
+    """Format rows of cells into a left-aligned, plain-text table"""
+
+    widths: Sequence[int] = tuple(
+        max(len(row[column]) for row in rows) for column in range(len(rows[0]))
+    )
+
+    return "\n".join(
+        COLUMN_SEP.join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip()
+        for row in rows
+    )
+
+
+def format_status(result: DayResult, /) -> str:
+    """Format the status of a day's result, e.g. `ok (cached)`"""
+
+    if not result.ok:
+        return f"error ({result.error})"
+
+    return "ok (cached)" if result.cached else "ok"
+
+
+def format_day(result: DayResult, /) -> str:
+    """Format the day of a result, with the engine it was solved by (if any)"""
+
+    if result.engine is None:
+        return str(result.day.day)
+
+    return f"{result.day.day} ({result.engine})"
+
+
+def format_results(results: Iterable[DayResult], /) -> str:
+    """Format day results into a table of answers & timings (with a total row)"""
+
+    rows: MutableSequence[Sequence[str]] = [HEADERS]
+    total: Timing = Timing()
+
+    result: DayResult
+    for result in results:
+        parse: Optional[PhaseResult] = result.get(Phase.PARSE)
+        answers: Sequence[str] = tuple(
+            PLACEHOLDER if answer is None else str(answer)
+            for answer in (result.answer(Phase.PART_1), result.answer(Phase.PART_2))
+        )
+
+        rows.append(
+            (
+                str(result.day.year),
+                format_day(result),
+                *answers,
+                format_seconds(parse.timing.wall if parse is not None else None),
+                format_seconds(result.timing.wall),
+                format_seconds(result.timing.cpu),
+                format_status(result),
+            )
+        )
+
+        total += result.timing
+
+    rows.append(
+        (
+            "Total",
+            "",
+            "",
+            "",
+            "",
+            format_seconds(total.wall),
+            format_seconds(total.cpu),
+            "",
+        )
+    )
+
+    return format_table(rows)
+
+
+def format_memory(results: Iterable[DayResult], /) -> str:
+    """
+    Format the traced memory usage of each phase into a table
+
+    Usage is also given per byte of (raw) input, to compare representations, with
+    each phase's top allocation sites (of memory still allocated at its end).
+    """
+
+    rows: MutableSequence[Sequence[str]] = [MEMORY_HEADERS]
+
+    result: DayResult
+    for result in results:
+        phase: PhaseResult
+        for phase in result.phases:
+            if phase.memory is None:
+                continue
+
+            sites: Sequence[str] = tuple(map(str, phase.memory.sites)) or ("",)
+
+            rows.append(
+                (
+                    str(result.day.year),
+                    str(result.day.day),
+                    str(phase.phase),
+                    format_bytes(phase.memory.peak),
+                    format_bytes(phase.memory.retained),
+                    (
+                        f"{phase.memory.peak / result.input_size:.1f}"
+                        if result.input_size
+                        else PLACEHOLDER
+                    ),
+                    sites[0],
+                )
+            )
+            rows.extend(("", "", "", "", "", "", site) for site in sites[1:])
+
+    return format_table(rows)
+
+
+def format_counters(results: Iterable[DayResult], /) -> str:
+    """Format the work counted in each phase into a table (a row per counter)"""
+
+    rows: MutableSequence[Sequence[str]] = [COUNTER_HEADERS]
+
+    result: DayResult
+    for result in results:
+        phase: PhaseResult
+        for phase in result.phases:
+            if phase.counters is None:
+                continue
+
+            name: str
+            count: int
+            for name, count in phase.counters.items():
+                rows.append(
+                    (
+                        str(result.day.year),
+                        format_day(result),
+                        str(phase.phase),
+                        name,
+                        str(count),
+                    )
+                )
+
+    return format_table(rows)
@@ -0,0 +1,928 @@
+"""In-process execution & timing of solutions"""
+
+import contextlib
+import inspect
+import os
+import time
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Final,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from aoc.backends import (
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+    concurrent_futures,
+    make_executor,
+    resolve_backend,
+)
+from aoc.cache import AnswerCache, InputCodec, ParseCache, hash_file
+from aoc.counters import Counter, count
+from aoc.discovery import Day, load_module
+from aoc.engines import ENGINE_ALL, Engine, EngineRegistry
+from aoc.memory import (
+    MemoryBudgetExceededError,
+    MemoryTracer,
+    MemoryUsage,
+    format_bytes,
+)
+from aoc.profiling import profile
+from aoc.reader import FILENAME_INPUT, STDIN
+from aoc.sampling import Sampler
+from aoc.shared import SharedCodec, SharedInput, attach, share
+
+
+# Models
+class Phase(str, Enum):
+    """The phases a solution is executed in"""
+
+    def __str__(self) -> str:
+        return self.value
+
+    PARSE = "parse"
+    PART_1 = "part_1"
+    PART_2 = "part_2"
+    FUSED = "fused"  # Both parts, solved together in a single pass
+
+
+PARTS: Final[Sequence[Phase]] = (Phase.PART_1, Phase.PART_2)
+
+
+@dataclass(frozen=True)
+class Timing:
+    """Wall-clock & CPU time, in seconds"""
+
+    wall: float = 0.0
+    cpu: float = 0.0
+
+    def __add__(self, rhs: "Timing", /) -> "Timing":
+        return Timing(wall=self.wall + rhs.wall, cpu=self.cpu + rhs.cpu)
+
+
+class Stopwatch:
+    """Context manager measuring the wall-clock & CPU time spent within it"""
+
+    timing: Timing
+    _wall_start: float
+    _cpu_start: float
+
+    def __init__(self) -> None:
+        self.timing = Timing()
+
+    def __enter__(self) -> Self:
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.timing = Timing(
+            wall=time.perf_counter() - self._wall_start,
+            cpu=time.process_time() - self._cpu_start,
+        )
+
+
+@dataclass
+class PhaseResult:
+    """Outcome of executing a single phase of a solution"""
+
+    phase: Phase
+    timing: Timing
+    answer: Optional[int] = None
+    cached: bool = False
+    memory: Optional[MemoryUsage] = None
+    answers: Sequence[int] = ()  # Of every part, if solved in a single pass
+    counters: Optional[Mapping[str, int]] = None  # If the phase's work was counted
+
+
+@dataclass
+class DayResult:
+    """Outcome of executing every phase of a day's solution"""
+
+    day: Day
+    phases: MutableSequence[PhaseResult] = field(default_factory=list)
+    error: Optional[str] = None
+    input_size: Optional[int] = None
+    engine: Optional[str] = None  # Of days with several (see `aoc.engines`)
+
+    @property
+    def ok(self) -> bool:
+        """Whether every phase executed without error"""
+
+        return self.error is None
+
+    @property
+    def cached(self) -> bool:
+        """Whether any answer was served from the answer cache"""
+
+        return any(result.cached for result in self.phases)
+
+    @property
+    def timing(self) -> Timing:
+        """Total time spent across all phases"""
+
+        return sum((result.timing for result in self.phases), Timing())
+
+    @property
+    def peak_memory(self) -> Optional[int]:
+        """Highest peak memory of any phase (if memory was traced)"""
+
+        return max(
+            (result.memory.peak for result in self.phases if result.memory),
+            default=None,
+        )
+
+    def get(self, phase: Phase, /) -> Optional[PhaseResult]:
+        """Get the result of a specific phase (if it was executed)"""
+
+        result: PhaseResult
+        for result in self.phases:
+            if result.phase is phase:
+                return result
+
+        return None
+
+    def answer(self, phase: Phase, /) -> Optional[int]:
+        """Get the answer produced by a specific phase (if any)"""
+
+        result: Optional[PhaseResult] = self.get(phase)
+
+        if result is None and phase in PARTS:
+            # The part may have been solved alongside the others, in a single pass
+            fused: Optional[PhaseResult] = self.get(Phase.FUSED)
+
+            if fused is not None and fused.answers:
+                return fused.answers[PARTS.index(phase)]
+
+        return result.answer if result is not None else None
+
+    @property
+    def answers(self) -> Sequence[Optional[int]]:
+        """The answer to every part (if any)"""
+
+        return tuple(self.answer(phase) for phase in PARTS)
+
+    @property
+    def counters(self) -> Mapping[str, Mapping[str, int]]:
+        """The counted work of each phase (if counted), by phase"""
+
+        return {
+            str(result.phase): result.counters
+            for result in self.phases
+            if result.counters is not None
+        }
+
+    def to_json(self) -> Mapping[str, Any]:
+        """A (JSON-serialisable) summary of the result"""
+
+        return {
+            "year": self.day.year,
+            "day": self.day.day,
+            "engine": self.engine,
+            "ok": self.ok,
+            "error": self.error,
+            **{str(phase): self.answer(phase) for phase in PARTS},
+            **{f"{result.phase}_s": result.timing.wall for result in self.phases},
+            **({"counters": self.counters} if self.counters else {}),
+        }
+
+
+# Exceptions
+class InvalidSolutionError(Exception):
+    """Exception thrown when a solution module doesn't expose the expected API"""
+
+
+def describe_error(error: BaseException, /) -> str:
+    """Describe an error in a single line, e.g. `ValueError: bad input`"""
+
+    return f"{type(error).__name__}: {error}"
+
+
+@dataclass
+class Solution:
+    """
+    The callable phases of a solution module
+
+    Solutions expose `solve_part_1` and `solve_part_2`. If these require the parsed
+    input, the solution must also expose a `read_input` to produce it, otherwise
+    each part is responsible for reading its own input. Either way, whatever reads
+    the input takes an optional path to read it from (by default, `input` in the
+    working directory). Solutions with parsed inputs may also opt in to parse
+    caching (see `aoc.cache.InputCodec`), and to sharing their parsed input with
+    worker processes (see `aoc.shared.SharedCodec`).
+
+    Solutions may also expose `solve_parts`, taking the same arguments as the parts,
+    which solves every part in a single (fused) pass, returning each part's answer.
+
+    Solutions with several implementations of their parts register each as an
+    engine in `ENGINES` (see `aoc.engines.EngineRegistry`), one of which is chosen
+    by `with_engine`. Solutions may also declare `COUNTERS` of the work done by
+    their hot functions (see `aoc.counters.Counter`), which are only counted when
+    asked to.
+    """
+
+    name: str
+    read_input: Optional[Callable[..., Any]]
+    parts: Mapping[Phase, Callable[..., int]]
+    codec: Optional[InputCodec] = None
+    path: Optional[Path] = None
+    fused: Optional[Callable[..., Sequence[int]]] = None
+    shared: Optional[SharedCodec] = None
+    engines: Optional[EngineRegistry] = None
+    engine: Optional[str] = None
+    counters: Sequence[Counter] = ()
+    module: Optional[ModuleType] = None
+
+    @classmethod
+    def from_module(cls, module: ModuleType, /) -> "Solution":
+        """Extract the phases of a solution from its module"""
+
+        parts: Mapping[Phase, Callable[..., int]] = {
+            phase: getattr(module, f"solve_{phase}", None) for phase in PARTS
+        }
+
+        phase: Phase
+        solver: Optional[Callable[..., int]]
+        for phase, solver in parts.items():
+            if not callable(solver):
+                raise InvalidSolutionError(
+                    f"{module.__name__} is missing `solve_{phase}`"
+                )
+
+        # Parts reading their own input may still take (optionally) a path to it
+        takes_input: bool = any(
+            parameter.default is inspect.Parameter.empty
+            for solver in parts.values()
+            for parameter in inspect.signature(solver).parameters.values()
+        )
+        read_input: Optional[Callable[..., Any]] = getattr(module, "read_input", None)
+
+        if takes_input and not callable(read_input):
+            raise InvalidSolutionError(f"{module.__name__} is missing `read_input`")
+
+        codec: Optional[InputCodec] = None
+        parser_version: Optional[int] = getattr(module, "PARSER_VERSION", None)
+
+        if takes_input and parser_version is not None:
+            encode: Optional[Callable[[Any], bytes]] = getattr(
+                module, "encode_input", None
+            )
+            decode: Optional[Callable[[memoryview], Any]] = getattr(
+                module, "decode_input", None
+            )
+
+            if not callable(encode) or not callable(decode):
+                raise InvalidSolutionError(
+                    f"{module.__name__} has a `PARSER_VERSION`, "
+                    "but is missing `encode_input` or `decode_input`"
+                )
+
+            codec = InputCodec(version=parser_version, encode=encode, decode=decode)
+
+        shared: Optional[SharedCodec] = None
+        export: Optional[Callable[[Any], Mapping[str, Any]]] = getattr(
+            module, "export_input", None
+        )
+        import_: Optional[Callable[[Mapping[str, memoryview]], Any]] = getattr(
+            module, "import_input", None
+        )
+
+        if takes_input and (export is not None or import_ is not None):
+            if not callable(export) or not callable(import_):
+                raise InvalidSolutionError(
+                    f"{module.__name__} can only share its parsed input with both "
+                    "`export_input` & `import_input`"
+                )
+
+            shared = SharedCodec(export=export, import_=import_)
+
+        return cls(
+            name=module.__name__,
+            read_input=read_input if takes_input else None,
+            parts=parts,
+            codec=codec,
+            path=Path(module.__file__) if module.__file__ else None,
+            fused=getattr(module, "solve_parts", None),
+            shared=shared,
+            engines=getattr(module, "ENGINES", None),
+            counters=tuple(getattr(module, "COUNTERS", ())),
+            module=module,
+        )
+
+    def with_engine(self, name: Optional[str] = None, /, *, size: int = 0) -> Self:
+        """
+        The solution, solved by one of its engines (if it has several)
+
+        The engine is chosen by name, otherwise it's picked for an input of `size`
+        bytes (see `aoc.engines.EngineRegistry.select`).
+        """
+
+        if self.engines is None:
+            return self
+
+        engine: Engine = self.engines.select(name, size=size)
+
+        return replace(
+            self,
+            parts={
+                Phase.PART_1: engine.solve_part_1,
+                Phase.PART_2: engine.solve_part_2,
+            },
+            fused=engine.solve_parts,
+            engine=engine.name,
+        )
+
+    def parse(
+        self, *, cache: Optional[ParseCache] = None, path: Optional[Path] = None
+    ) -> Any:
+        """
+        Read & parse the input (materialising it, if it's lazily produced)
+
+        The input is read from `path`, if given (otherwise, from the solution's
+        default). If a cache is given (and the solution supports it), the parsed
+        input is loaded from it when the raw input has been parsed before, and
+        stored in it otherwise.
+        """
+
+        if cache is None or self.codec is None or not is_file_input(path):
+            return self._parse(path)
+
+        digest: bytes = hash_file(path or FILENAME_INPUT)
+        data: Any = cache.load(self.name, digest, self.codec)
+
+        if data is None:
+            data = self._parse(path)
+            cache.store(self.name, digest, self.codec, data)
+
+        return data
+
+    def _parse(self, path: Optional[Path], /) -> Any:
+        assert self.read_input is not None
+
+        data: Any = self.read_input(*input_args(path))
+
+        # Lazily produced inputs would otherwise be exhausted by the first part
+        if isinstance(data, Iterator):
+            data = tuple(data)
+
+        return data
+
+    def solve(
+        self, phase: Phase, data: Any = None, /, *, path: Optional[Path] = None
+    ) -> int:
+        """
+        Solve a single part, passing it the parsed input (if it takes one), or
+        otherwise the path to read the input from (if given)
+        """
+
+        if self.read_input is None:
+            return self.parts[phase](*input_args(path))
+
+        return self.parts[phase](data)
+
+    def solve_fused(
+        self, data: Any = None, /, *, path: Optional[Path] = None
+    ) -> Sequence[int]:
+        """Solve every part in a single pass, passing the parsed input (or path)"""
+
+        assert self.fused is not None
+
+        answers: Sequence[int] = tuple(
+            self.fused(*input_args(path))
+            if self.read_input is None
+            else self.fused(data)
+        )
+
+        if len(answers) != len(PARTS):
+            raise InvalidSolutionError(
+                f"{self.name}'s `solve_parts` gave {len(answers)} answers, "
+                f"rather than {len(PARTS)}"
+            )
+
+        return answers
+
+
+def input_args(path: Optional[Path], /) -> Sequence[Path]:
+    """Arguments to read the input with: its path, unless using the default"""
+
+    return () if path is None else (path,)
+
+
+def is_file_input(path: Optional[Path], /) -> bool:
+    """Whether the input is a file, so can be sized & hashed without consuming it"""
+
+    return path is None or str(path) != STDIN
+
+
+def trace_phase(trace_memory: bool, /) -> ContextManager[Optional[MemoryTracer]]:
+    """Trace the memory allocated by a phase, if enabled"""
+
+    return MemoryTracer() if trace_memory else contextlib.nullcontext()
+
+
+def profile_phase(
+    prefix: Optional[Path], phase: Phase, /, sample_rate: Optional[int] = None
+) -> ContextManager[Any]:
+    """
+    Profile a phase to `<prefix>-<phase>.*`, if there's a prefix, with cProfile or
+    by sampling it at `sample_rate` samples per second (if given)
+    """
+
+    if prefix is None:
+        return contextlib.nullcontext()
+
+    phase_prefix: Path = prefix.with_name(f"{prefix.name}-{phase}")
+
+    if sample_rate is not None:
+        return Sampler(rate=sample_rate, prefix=phase_prefix)
+
+    return profile(phase_prefix)
+
+
+def count_phase(
+    solution: Solution, enabled: bool, /
+) -> ContextManager[Optional[Mapping[str, int]]]:
+    """Count the work done by a phase, if enabled (and the solution has counters)"""
+
+    if not enabled or not solution.counters or solution.module is None:
+        return contextlib.nullcontext()
+
+    return count(solution.module, solution.counters)
+
+
+def solve_shared(
+    day: Day, phase: Phase, handle: SharedInput, engine: Optional[str] = None, /
+) -> Tuple[int, Timing]:
+    """
+    Solve (and time) a single part, in a worker, from a parsed input in shared memory
+
+    The time taken to import the parsed input (from views of the shared memory) is
+    included in the part's.
+    """
+
+    solution: Solution = Solution.from_module(load_module(day)).with_engine(engine)
+
+    assert solution.shared is not None
+
+    views: Mapping[str, memoryview]
+    stopwatch: Stopwatch
+    with attach(handle) as views, Stopwatch() as stopwatch:
+        answer: int = solution.solve(phase, solution.shared.import_(views))
+
+    return (answer, stopwatch.timing)
+
+
+def run_phases_shared(
+    solution: Solution,
+    day: Day,
+    /,
+    *,
+    parse_cache: Optional[ParseCache] = None,
+    input_path: Optional[Path] = None,
+) -> Iterator[PhaseResult]:
+    """
+    Execute (and time) each phase of a solution, solving its parts concurrently
+
+    The input is parsed once, then exported to shared memory (as part of the parse
+    phase), which each part attaches to from its own worker process rather than
+    parsing the input again (or having it pickled to it).
+    """
+
+    assert solution.shared is not None
+
+    stopwatch: Stopwatch
+    stack: contextlib.ExitStack
+    with contextlib.ExitStack() as stack:
+        with Stopwatch() as stopwatch:
+            handle: SharedInput = stack.enter_context(
+                share(
+                    solution.shared.export(
+                        solution.parse(cache=parse_cache, path=input_path)
+                    )
+                )
+            )
+
+        yield PhaseResult(Phase.PARSE, stopwatch.timing)
+
+        executor: concurrent_futures.Executor = stack.enter_context(
+            make_executor(BACKEND_PROCESS, jobs=len(PARTS))
+        )
+        futures: Mapping[Phase, concurrent_futures.Future[Tuple[int, Timing]]] = {
+            phase: executor.submit(solve_shared, day, phase, handle, solution.engine)
+            for phase in PARTS
+        }
+
+        phase: Phase
+        future: concurrent_futures.Future[Tuple[int, Timing]]
+        for phase, future in futures.items():
+            answer: int
+            timing: Timing
+            answer, timing = future.result()
+
+            yield PhaseResult(phase, timing, answer)
+
+
+def run_phases(
+    solution: Solution,
+    /,
+    *,
+    parse_cache: Optional[ParseCache] = None,
+    answer_cache: Optional[AnswerCache] = None,
+    profile_prefix: Optional[Path] = None,
+    sample_rate: Optional[int] = None,
+    trace_memory: bool = False,
+    count_work: bool = False,
+    fused: bool = True,
+    input_path: Optional[Path] = None,
+    parallel_day: Optional[Day] = None,
+) -> Iterator[PhaseResult]:
+    """
+    Execute (and time) each phase of a solution once, yielding as they finish
+
+    If an answer cache is given, parts with a cached answer aren't executed at all
+    (nor is the parse phase, if every part's answer is cached). If a profile prefix
+    is given, each executed phase is profiled to `<prefix>-<phase>.*` (by sampling
+    it, if given a sample rate, see `aoc.sampling`), and if memory is traced, each
+    executed phase's usage is recorded, and if work is counted, each executed
+    phase's counters are (all of which inflate its timings). Parts
+    are solved in a single pass if the solution supports it (unless `fused` is
+    disabled, or some answers are cached). The input is read from `input_path`, if
+    given (stdin, `-`, is never cached).
+
+    If the day is given as `parallel_day`, and the solution can share its parsed
+    input, parts are instead solved concurrently in worker processes (see
+    `run_phases_shared`), unless profiling, tracing memory or counting work (which
+    only cover this process) or some answers are cached.
+    """
+
+    stopwatch: Stopwatch
+    tracer: Optional[MemoryTracer]
+    counts: Optional[Mapping[str, int]]
+    data: Any = None
+    cached: Mapping[Phase, Optional[int]] = {}
+    input_digest: bytes = b""
+    source_digest: bytes = b""
+
+    if (
+        answer_cache is not None
+        and solution.path is not None
+        and is_file_input(input_path)
+    ):
+        input_digest = hash_file(input_path or FILENAME_INPUT)
+        source_digest = hash_file(solution.path)
+        cached = {
+            phase: answer_cache.get(
+                input_digest, source_digest, str(phase), engine=solution.engine
+            )
+            for phase in PARTS
+        }
+
+    fully_cached: bool = bool(cached) and None not in cached.values()
+    none_cached: bool = all(answer is None for answer in cached.values())
+    single_pass: bool = fused and solution.fused is not None
+
+    # Parts reading their own input would each read it from stdin, which only works
+    # once (and isn't cached)
+    if solution.read_input is None and not single_pass and not is_file_input(
+        input_path
+    ):
+        raise InvalidSolutionError(
+            f"{solution.name} reads its input once per part, so can't read it from "
+            "stdin (unless solving both parts in a single pass)"
+        )
+
+    phase: Phase
+    answer: Optional[int]
+
+    if (
+        parallel_day is not None
+        and solution.shared is not None
+        and none_cached
+        and profile_prefix is None
+        and not trace_memory
+        and not count_work
+    ):
+        phase_result: PhaseResult
+        for phase_result in run_phases_shared(
+            solution, parallel_day, parse_cache=parse_cache, input_path=input_path
+        ):
+            if answer_cache is not None and cached and phase_result.answer is not None:
+                answer_cache.put(
+                    input_digest,
+                    source_digest,
+                    str(phase_result.phase),
+                    phase_result.answer,
+                    engine=solution.engine,
+                )
+
+            yield phase_result
+
+        return
+
+    if solution.read_input is not None and not fully_cached:
+        with (
+            profile_phase(profile_prefix, Phase.PARSE, sample_rate),
+            trace_phase(trace_memory) as tracer,
+            count_phase(solution, count_work) as counts,
+            Stopwatch() as stopwatch,
+        ):
+            data = solution.parse(cache=parse_cache, path=input_path)
+
+        yield PhaseResult(
+            Phase.PARSE,
+            stopwatch.timing,
+            memory=tracer.usage if tracer else None,
+            counters=counts,
+        )
+
+    if single_pass and none_cached:
+        with (
+            profile_phase(profile_prefix, Phase.FUSED, sample_rate),
+            trace_phase(trace_memory) as tracer,
+            count_phase(solution, count_work) as counts,
+            Stopwatch() as stopwatch,
+        ):
+            answers: Sequence[int] = solution.solve_fused(data, path=input_path)
+
+        if answer_cache is not None and cached:
+            for phase, answer in zip(PARTS, answers):
+                answer_cache.put(
+                    input_digest,
+                    source_digest,
+                    str(phase),
+                    answer,
+                    engine=solution.engine,
+                )
+
+        yield PhaseResult(
+            Phase.FUSED,
+            stopwatch.timing,
+            memory=tracer.usage if tracer else None,
+            answers=answers,
+            counters=counts,
+        )
+
+        return
+
+    for phase in PARTS:
+        answer = cached.get(phase)
+
+        if answer is not None:
+            yield PhaseResult(phase, Timing(), answer, cached=True)
+            continue
+
+        with (
+            profile_phase(profile_prefix, phase, sample_rate),
+            trace_phase(trace_memory) as tracer,
+            count_phase(solution, count_work) as counts,
+            Stopwatch() as stopwatch,
+        ):
+            answer = solution.solve(phase, data, path=input_path)
+
+        if answer_cache is not None and cached:
+            answer_cache.put(
+                input_digest, source_digest, str(phase), answer, engine=solution.engine
+            )
+
+        yield PhaseResult(
+            phase,
+            stopwatch.timing,
+            answer,
+            memory=tracer.usage if tracer else None,
+            counters=counts,
+        )
+
+
+@dataclass(frozen=True)
+class RunOptions:
+    """
+    Options for executing days
+
+    Attributes:
+        parse_cache: Cache to load parsed inputs from (and store them in)
+        answer_cache: Cache to look answers up in, skipping parts found in it
+        profile_directory: Directory to write each phase's profile to
+        sample_rate: Samples per second to profile each phase by sampling at, rather
+            than with cProfile
+        trace_memory: Whether to trace the memory allocated by each phase
+        count_work: Whether to count the work done by each phase (of days with
+            counters, see `aoc.counters`)
+        memory_budget: Peak memory (in bytes) any phase may use (if traced)
+        fused: Whether to solve every part in a single pass, where supported
+        input_path: Input to run against, rather than the day's own (`-` for stdin)
+        parallel_parts: Whether to solve parts concurrently, in worker processes
+            sharing the parsed input (where supported)
+        engine: Engine to solve with (of days with several), by name, rather than
+            picking one by input size, or `ENGINE_ALL` (see `run_engines`)
+    """
+
+    parse_cache: Optional[ParseCache] = None
+    answer_cache: Optional[AnswerCache] = None
+    profile_directory: Optional[Path] = None
+    sample_rate: Optional[int] = None
+    trace_memory: bool = False
+    count_work: bool = False
+    memory_budget: Optional[int] = None
+    fused: bool = True
+    input_path: Optional[Path] = None
+    parallel_parts: bool = False
+    engine: Optional[str] = None
+
+
+def run_day(
+    day: Day,
+    /,
+    options: RunOptions = RunOptions(),
+    *,
+    directory: Optional[Path] = None,
+) -> DayResult:
+    """
+    Execute (and time) every phase of a day's solution
+
+    The solution is run from `directory` (by default, the day's own directory), so
+    reads the input found there, unless it's given an input (so that days can be
+    run concurrently by threads, which share a working directory). If a profile
+    directory is given, each phase is profiled to
+    `<directory>/<year>-day-<day>-<phase>.*`. If memory is traced and exceeds the
+    budget, the day fails (once every phase has executed).
+    """
+
+    result: DayResult = DayResult(day)
+
+    # Solutions read their input relative to the working directory
+    with (
+        contextlib.chdir(directory or day.directory)
+        if options.input_path is None
+        else contextlib.nullcontext()
+    ):
+        try:
+            input_size: Optional[int] = (
+                os.path.getsize(options.input_path or FILENAME_INPUT)
+                if is_file_input(options.input_path)
+                else None
+            )
+            solution: Solution = Solution.from_module(load_module(day)).with_engine(
+                options.engine, size=input_size or 0
+            )
+            result.engine = solution.engine
+
+            if options.trace_memory:
+                result.input_size = input_size
+
+            phase_result: PhaseResult
+            for phase_result in run_phases(
+                solution,
+                parse_cache=options.parse_cache,
+                answer_cache=options.answer_cache,
+                profile_prefix=(
+                    options.profile_directory / f"{day.year}-day-{day.day:02}"
+                    if options.profile_directory is not None
+                    else None
+                ),
+                sample_rate=options.sample_rate,
+                trace_memory=options.trace_memory,
+                count_work=options.count_work,
+                fused=options.fused,
+                input_path=options.input_path,
+                parallel_day=day if options.parallel_parts else None,
+            ):
+                result.phases.append(phase_result)
+
+            peak: Optional[int] = result.peak_memory
+
+            if options.memory_budget is not None and (peak or 0) > (
+                options.memory_budget
+            ):
+                raise MemoryBudgetExceededError(
+                    f"peak of {format_bytes(peak)} exceeds the budget of "
+                    f"{format_bytes(options.memory_budget)}"
+                )
+        except Exception as error:
+            result.error = describe_error(error)
+
+    return result
+
+
+def run_engines(day: Day, /, options: RunOptions = RunOptions()) -> Sequence[DayResult]:
+    """
+    Execute (and time) a day's solution, with every one of its engines if asked to
+
+    With `ENGINE_ALL`, each engine's answers are checked against those of the
+    reference engine, failing any engine which disagrees. Answers are never served
+    from the answer cache, as they'd then agree regardless.
+    """
+
+    if options.engine != ENGINE_ALL:
+        return (run_day(day, options),)
+
+    names: Sequence[Optional[str]] = (None,)
+
+    # Days which can't even be loaded are still run, so that `run_day` reports why
+    with contextlib.suppress(Exception):
+        engines: Optional[EngineRegistry] = Solution.from_module(
+            load_module(day)
+        ).engines
+        names = engines.names if engines is not None else names
+
+    results: Sequence[DayResult] = tuple(
+        run_day(day, replace(options, engine=name, answer_cache=None))
+        for name in names
+    )
+    reference: DayResult = results[0]
+
+    result: DayResult
+    for result in results[1:]:
+        if result.ok and reference.ok and result.answers != reference.answers:
+            result.error = (
+                f"answers {result.answers} differ from the {reference.engine} "
+                f"engine's {reference.answers}"
+            )
+
+    return results
+
+
+def run_days_concurrently(
+    days: Iterable[Day],
+    /,
+    *,
+    jobs: int,
+    options: RunOptions = RunOptions(),
+    backend: str,
+) -> Iterable[DayResult]:
+    """
+    Execute (and time) each day's solution across a pool of workers
+
+    Each worker process executes a single day (with every engine, if asked to)
+    before being replaced, so days are isolated from one another (module state,
+    working directory, crashes). Worker threads can't be, so are given each day's
+    input rather than changing into its directory. Results are yielded as they
+    complete, rather than in the order the days were given.
+    """
+
+    executor: concurrent_futures.Executor
+    with make_executor(backend, jobs=jobs, max_tasks_per_child=1) as executor:
+        futures: Mapping[concurrent_futures.Future[Sequence[DayResult]], Day] = {
+            executor.submit(
+                run_engines,
+                day,
+                (
+                    replace(
+                        options, input_path=options.input_path or day.input_path
+                    )
+                    if backend == BACKEND_THREAD
+                    else options
+                ),
+            ): day
+            for day in days
+        }
+
+        future: concurrent_futures.Future[Sequence[DayResult]]
+        for future in concurrent_futures.as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as error:
+                # The worker itself failed (e.g. it died), rather than the solution
+                yield DayResult(futures[future], error=describe_error(error))
+
+
+def run_days(
+    days: Iterable[Day],
+    /,
+    *,
+    jobs: int = 1,
+    options: RunOptions = RunOptions(),
+    backend: Optional[str] = None,
+) -> Iterable[DayResult]:
+    """
+    Execute (and time) each day's solution, using `jobs` workers
+
+    Workers are processes, or threads on free-threaded builds (unless a backend is
+    given).
+    """
+
+    if jobs > 1:
+        return run_days_concurrently(
+            days, jobs=jobs, options=options, backend=resolve_backend(backend)
+        )
+
+    return (result for day in days for result in run_engines(day, options))
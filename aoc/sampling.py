@@ -0,0 +1,300 @@
+"""Statistical (sampling) profiling of phases, as ranked line hotspots & stacks"""
+
+import linecache
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from random import Random
+from types import CodeType, FrameType, TracebackType
+from typing import (
+    Final,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Self,
+    Sequence,
+    Tuple,
+    TypeAlias,
+)
+
+from aoc.profiling import FRAME_SEP, SUFFIX_COLLAPSED, Function, format_function
+
+# Constants
+DEFAULT_RATE: Final[int] = 1_000  # Samples per second
+# The timer thread needs the GIL to arm each sample, so the sampled thread is made
+# to drop it this many times more often than samples are taken
+SWITCHES_PER_SAMPLE: Final[int] = 10
+TOOL_ID: Final[int] = sys.monitoring.PROFILER_ID
+TOOL_NAME: Final[str] = "aoc-sampler"
+# The first line started, or call made, once a sample's due takes it
+EVENTS: Final[int] = sys.monitoring.events.LINE | sys.monitoring.events.CALL
+JITTER: Final[float] = 0.02  # Of the interval, over which each sample is delayed
+DEFAULT_TOP: Final[int] = 40  # Lines listed in the report
+SUFFIX_HOTSPOTS: Final[str] = ".hotspots"
+CONTEXT_METHODS: Final[Tuple[str, ...]] = (".__enter__", ".__exit__")
+
+
+# Typing
+Stack: TypeAlias = Tuple[Function, ...]  # The line each frame is at, outermost first
+Hotspot: TypeAlias = Tuple[Function, int, int]  # (line, self samples, total samples)
+
+
+class Sampler:
+    """
+    Sample the stack of the thread entering the context, at the line it's executing
+
+    Unlike cProfile, which is called on every call (and return), sampling costs
+    nothing per call or line executed, only per sample: every `1 / rate` seconds, a
+    timer thread arms `sys.monitoring`'s line & call events, and the first of them
+    the sampled thread reaches records its stack (from within it) and disarms them
+    again. Samples are taken at whichever line the sampled thread is executing,
+    rather than only where it drops the GIL (at calls & loop back-edges), as reading
+    its frames from another thread would. As the sampled thread only resumes where
+    it dropped the GIL, each sample is delayed by a random fraction of the interval
+    from there, spreading samples over the lines that follow. With the GIL, the
+    timer thread only gets to run as often as the thread holding it is made to drop
+    it, so the switch interval is lowered well below the sampling interval.
+
+    Stacks are recorded from the frame which entered the context (frames without a
+    line number drop their sample), and the CPU time spent arming and recording
+    them is kept as the overhead of sampling. Given a prefix, it writes
+    `<prefix>.hotspots` (a report of the hottest lines) and `<prefix>.collapsed`
+    (readable by flamegraph.pl, speedscope, etc.) on exit.
+    """
+
+    interval: float
+    prefix: Optional[Path]
+    stacks: MutableMapping[Stack, int]
+    samples: int
+    elapsed: float
+    overhead: float
+
+    _thread_id: int
+    _root: FrameType
+    _stopped: threading.Event
+    _timer: threading.Thread
+    _switch_interval: float
+    _started: float
+    _arming: float  # The timer thread's CPU time
+    _delay: float
+    _due: Optional[float]
+    _random: Random
+
+    def __init__(
+        self, *, rate: int = DEFAULT_RATE, prefix: Optional[Path] = None
+    ) -> None:
+        self.interval = 1 / rate
+        self.prefix = prefix
+        self.stacks = defaultdict(int)
+        self.samples = 0
+        self.elapsed = 0.0
+        self.overhead = 0.0
+
+    def __enter__(self) -> Self:
+        self._thread_id = threading.get_ident()
+        self._root = sys._getframe(1)
+        self._stopped = threading.Event()
+        self._timer = threading.Thread(target=self._arm, name=TOOL_NAME)
+        self._delay = 0.0
+        self._due = None
+        self._random = Random(0)
+        self._switch_interval = sys.getswitchinterval()
+
+        sys.monitoring.use_tool_id(TOOL_ID, TOOL_NAME)
+        sys.monitoring.register_callback(
+            TOOL_ID, sys.monitoring.events.LINE, self._on_line
+        )
+        sys.monitoring.register_callback(
+            TOOL_ID, sys.monitoring.events.CALL, self._on_call
+        )
+        sys.setswitchinterval(
+            min(self._switch_interval, self.interval / SWITCHES_PER_SAMPLE)
+        )
+
+        self._started = time.perf_counter()
+        self._timer.start()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+        /,
+    ) -> None:
+        self._stopped.set()
+        self._timer.join()
+        self.elapsed = time.perf_counter() - self._started
+        self.overhead += self._arming
+
+        sys.monitoring.set_events(TOOL_ID, 0)
+        sys.monitoring.free_tool_id(TOOL_ID)
+        sys.setswitchinterval(self._switch_interval)
+
+        if self.prefix is not None:
+            self.write(self.prefix)
+
+    @property
+    def rate(self) -> float:
+        """Samples actually taken per second (short of the rate asked for, if busy)"""
+
+        return self.samples / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def overhead_ratio(self) -> float:
+        """The CPU time spent sampling, relative to the time spent sampling"""
+
+        return self.overhead / self.elapsed if self.elapsed else 0.0
+
+    def write(self, prefix: Path, /) -> None:
+        """Write the hotspots report & collapsed stacks to `<prefix>.*`"""
+
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        prefix.with_name(prefix.name + SUFFIX_HOTSPOTS).write_text(
+            format_hotspots(self) + "\n", encoding="utf-8"
+        )
+        write_collapsed(self.stacks, prefix.with_name(prefix.name + SUFFIX_COLLAPSED))
+
+    def _arm(self) -> None:
+        started: float = time.thread_time()
+        deadline: float = time.perf_counter() + self.interval
+
+        # Samples are armed on a fixed schedule, so those armed late (waiting for
+        # the GIL) don't push back every one after them
+        while not self._stopped.wait(max(0.0, deadline - time.perf_counter())):
+            self._delay = self._random.uniform(0, self.interval * JITTER)
+            self._due = None
+            sys.monitoring.set_events(TOOL_ID, EVENTS)
+            deadline += self.interval
+
+        self._arming = time.thread_time() - started
+
+    def _on_line(self, code: CodeType, line: int, /) -> None:
+        self._take(sys._getframe(1), line)
+
+    def _on_call(
+        self, code: CodeType, offset: int, function: object, arg: object, /
+    ) -> None:
+        self._take(sys._getframe(1), None)
+
+    def _take(self, frame: Optional[FrameType], line: Optional[int], /) -> None:
+        # Every thread reaches armed events, but only the sampled thread takes them
+        if threading.get_ident() != self._thread_id:
+            return
+
+        now: float = time.perf_counter()
+
+        if self._due is None:
+            self._due = now + self._delay
+
+        if now < self._due:
+            return
+
+        started: float = time.thread_time()
+
+        sys.monitoring.set_events(TOOL_ID, 0)
+
+        lines: MutableSequence[Function] = []
+
+        while frame is not None and frame is not self._root:
+            code: CodeType = frame.f_code
+            lineno: Optional[int] = frame.f_lineno if line is None else line
+
+            if lineno is None:
+                break
+
+            lines.append((code.co_filename, lineno, code.co_qualname))
+            frame = frame.f_back
+            line = None
+
+        # Stacks not beneath the root are of entering the sampler (or have a frame
+        # without a line), and those of entering (or exiting) any context alongside
+        # it are dropped too
+        if frame is self._root and not (
+            lines and lines[-1][2].endswith(CONTEXT_METHODS)
+        ):
+            self.stacks[tuple(reversed(lines))] += 1
+            self.samples += 1
+
+        self.overhead += time.thread_time() - started
+
+
+def rank_lines(stacks: Mapping[Stack, int], /) -> Sequence[Hotspot]:
+    """
+    Rank lines by their self samples (executing them), then total samples (beneath)
+
+    Example:
+        >>> outer, inner = ("app.py", 1, "solve"), ("app.py", 9, "step")
+        >>> hotspots = rank_lines({(outer, inner): 3, (outer,): 1})
+        >>> assert hotspots == [(inner, 3, 3), (outer, 1, 4)]
+    """
+
+    self_samples: MutableMapping[Function, int] = defaultdict(int)
+    total_samples: MutableMapping[Function, int] = defaultdict(int)
+
+    stack: Stack
+    samples: int
+    for stack, samples in stacks.items():
+        if stack:
+            self_samples[stack[-1]] += samples
+
+        # Recursive frames at the same line are only counted once per stack
+        line: Function
+        for line in set(stack):
+            total_samples[line] += samples
+
+    return sorted(
+        (
+            (line, self_samples.get(line, 0), total)
+            for line, total in total_samples.items()
+        ),
+        key=lambda hotspot: (-hotspot[1], -hotspot[2], hotspot[0]),
+    )
+
+
+def format_hotspots(sampler: Sampler, /, *, top: int = DEFAULT_TOP) -> str:
+    """Format the lines most often sampled (and their source), hottest first"""
+
+    rows: MutableSequence[str] = [
+        f"{sampler.samples} samples in {sampler.elapsed:.3f}s "
+        f"({sampler.rate:.0f}/s of {1 / sampler.interval:.0f}/s), "
+        f"sampling overhead {sampler.overhead_ratio:.1%}",
+        "",
+        f"{'Self':>7}  {'Total':>7}  {'Samples':>7}  Line",
+    ]
+
+    line: Function
+    self_samples: int
+    total_samples: int
+    for line, self_samples, total_samples in rank_lines(sampler.stacks)[:top]:
+        source: str = linecache.getline(line[0], line[1]).strip()
+
+        rows.append(
+            f"{self_samples / sampler.samples:>7.1%}  "
+            f"{total_samples / sampler.samples:>7.1%}  "
+            f"{self_samples:>7}  {format_function(line)}"
+            + (f"  {source}" if source else "")
+        )
+
+    return "\n".join(rows)
+
+
+def write_collapsed(stacks: Mapping[Stack, int], path: Path, /) -> None:
+    """Write collapsed stacks, one `frame;frame;... samples` per line"""
+
+    collapsed: MutableMapping[str, int] = defaultdict(int)
+
+    stack: Stack
+    samples: int
+    for stack, samples in stacks.items():
+        if stack:
+            collapsed[FRAME_SEP.join(map(format_function, stack))] += samples
+
+    with open(path, "w", encoding="utf-8") as file:
+        frames: str
+        for frames in sorted(collapsed):
+            file.write(f"{frames} {collapsed[frames]}\n")
@@ -0,0 +1,171 @@
+"""Hand-off of parsed inputs to worker processes, through shared memory"""
+
+import contextlib
+import sys
+from dataclasses import dataclass
+from types import ModuleType
+from typing import (
+    Any,
+    Callable,
+    Final,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+    Tuple,
+)
+
+from aoc.lazy import lazy_import
+
+# Only needed once parsed inputs are shared
+resource_tracker: ModuleType = lazy_import("multiprocessing.resource_tracker")
+shared_memory: ModuleType = lazy_import("multiprocessing.shared_memory")
+
+# Constants
+ALIGNMENT: Final[int] = 8  # Bytes, so every buffer starts aligned for any typecode
+
+
+# Models
+@dataclass(frozen=True)
+class SharedCodec:
+    """
+    Export of a solution's parsed input as flat, typed buffers (and back again)
+
+    Solutions opt in to sharing their parsed input by exposing
+    `export_input(data) -> Mapping[str, buffer]`, whose buffers are flat & typed
+    (e.g. `array.array`s, or `bytearray`s), and `import_input(views) -> data`,
+    which rebuilds the parsed input from a (read-only) view of each buffer, cast to
+    its type. Views are of memory shared with other workers, so anything mutating
+    the parsed input must import a copy.
+    """
+
+    export: Callable[[Any], Mapping[str, Any]]
+    import_: Callable[[Mapping[str, memoryview]], Any]
+
+
+@dataclass(frozen=True)
+class SharedBuffer:
+    """Where a single (typed) buffer sits within a block of shared memory"""
+
+    name: str
+    format: str
+    offset: int
+    size: int  # In bytes
+
+
+@dataclass(frozen=True)
+class SharedInput:
+    """Handle to a parsed input in shared memory, small enough to send to workers"""
+
+    block: str
+    buffers: Sequence[SharedBuffer]
+
+
+def align(offset: int, /) -> int:
+    """
+    Round an offset up to the next multiple of `ALIGNMENT`
+
+    Example:
+        >>> assert [align(offset) for offset in (0, 1, 8, 9)] == [0, 8, 8, 16]
+    """
+
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+@contextlib.contextmanager
+def share(buffers: Mapping[str, Any], /) -> Iterator[SharedInput]:
+    """
+    Copy typed buffers into a new block of shared memory, for workers to attach to
+
+    The block is freed on exit, so must outlive every worker attached to it.
+
+    Example:
+        >>> from array import array
+        >>> with share({"ids": array("q", (3, 1, 2))}) as handle:
+        ...     with attach(handle) as views:
+        ...         assert list(views["ids"]) == [3, 1, 2]
+    """
+
+    views: Sequence[Tuple[str, memoryview]] = tuple(
+        (name, memoryview(buffer)) for name, buffer in buffers.items()
+    )
+    layout: MutableSequence[SharedBuffer] = []
+    offset: int = 0
+
+    name: str
+    view: memoryview
+    for name, view in views:
+        layout.append(SharedBuffer(name, view.format, offset, view.nbytes))
+        offset = align(offset + view.nbytes)
+
+    # Blocks can't be empty, even if every buffer is
+    block: shared_memory.SharedMemory = shared_memory.SharedMemory(
+        create=True, size=max(1, offset)
+    )
+
+    try:
+        buffer: SharedBuffer
+        for buffer, (_, view) in zip(layout, views):
+            block.buf[buffer.offset : buffer.offset + buffer.size] = view.cast("B")
+            view.release()
+
+        yield SharedInput(block.name, tuple(layout))
+    finally:
+        block.close()
+        block.unlink()
+
+
+def open_block(name: str, /) -> "shared_memory.SharedMemory":
+    """
+    Open an existing block of shared memory, without tracking it
+
+    Only the process creating a block tracks it (to free it, should that process
+    die without doing so). Workers attaching to it would otherwise each report it
+    as leaked when they exit, or even free it from under the others.
+    """
+
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, track=False)
+
+    # Before 3.13, attaching always registers the block, and unregistering it again
+    # can't undo that: a worker sharing the creator's resource tracker (e.g. forked
+    # after it started) would unregister the creator's registration, which the
+    # creator's `unlink` then fails to find. So registering is skipped altogether
+    register: Callable[[str, str], None] = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+
+    try:
+        return shared_memory.SharedMemory(name)
+    finally:
+        resource_tracker.register = register
+
+
+@contextlib.contextmanager
+def attach(handle: SharedInput, /) -> Iterator[Mapping[str, memoryview]]:
+    """
+    Attach to a parsed input in shared memory, as a read-only view of each buffer
+
+    Views are released on exit, so nothing still referring to them (e.g. a parsed
+    input imported from them) may outlive it.
+    """
+
+    block: shared_memory.SharedMemory = open_block(handle.block)
+    views: MutableMapping[str, memoryview] = {}
+
+    try:
+        buffer: SharedBuffer
+        for buffer in handle.buffers:
+            views[buffer.name] = (
+                block.buf[buffer.offset : buffer.offset + buffer.size]
+                .toreadonly()
+                .cast(buffer.format)
+            )
+
+        yield views
+    finally:
+        view: memoryview
+        for view in views.values():
+            view.release()
+
+        block.close()
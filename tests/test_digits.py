@@ -0,0 +1,171 @@
+"""Property tests of exact digit arithmetic (`aoc.digits`), against `int` & `str`"""
+
+from random import Random
+from typing import Final, Iterator, Sequence
+
+import pytest
+
+from aoc.digits import (
+    DIGITS_BY_BIT_LENGTH,
+    TABLE_DIGITS,
+    concat,
+    from_digits,
+    int_join,
+    int_len,
+    int_repeat,
+    int_split,
+    pow10,
+    to_digits,
+)
+
+# Constants
+SEED: Final[int] = 0
+MAX_EXPONENT: Final[int] = 200  # Well beyond the table of powers of ten
+RANDOM_INTEGERS: Final[int] = 500
+MAX_RANDOM_BITS: Final[int] = 4_000  # ~1,200 digits, within `str`'s default limit
+MAX_REPEATED_DIGITS: Final[int] = 500  # So repeating them is too
+
+
+def iter_edge_cases() -> Iterator[int]:
+    """Integers either side of every carry (or borrow) into another digit"""
+
+    yield 0
+
+    exponent: int
+    for exponent in range(MAX_EXPONENT + 1):
+        # e.g. 99 (borrowed from 100), 100, 101
+        yield from (10**exponent - 1, 10**exponent, 10**exponent + 1)
+
+        # e.g. 199 & 999, whose digits all carry on adding one
+        yield from (2 * 10**exponent - 1, 9 * 10**exponent - 1)
+
+    # Either side of each power of two, where the digit count estimated from the bit
+    # length is at its furthest from exact
+    bits: int
+    for bits in range(1, MAX_RANDOM_BITS, 7):
+        yield from (2**bits - 1, 2**bits)
+
+
+def iter_random_integers(random: Random, /) -> Iterator[int]:
+    """Integers of random (and so mostly large) bit lengths"""
+
+    for _ in range(RANDOM_INTEGERS):
+        yield random.getrandbits(random.randint(1, MAX_RANDOM_BITS))
+
+
+INTEGERS: Final[Sequence[int]] = (
+    *iter_edge_cases(),
+    *iter_random_integers(Random(SEED)),
+)
+
+
+@pytest.fixture
+def random() -> Random:
+    return Random(SEED)
+
+
+def test_pow10() -> None:
+    """Powers of ten are exact, whether tabled or not"""
+
+    exponent: int
+    for exponent in range(MAX_EXPONENT + 1):
+        assert pow10(exponent) == int("1" + "0" * exponent)
+
+
+def test_int_len() -> None:
+    """Digit counts are exact, however large the integer (or near a power of ten)"""
+
+    integer: int
+    for integer in INTEGERS:
+        assert int_len(integer) == len(str(integer)), integer
+
+
+def test_int_len_table_boundary() -> None:
+    """Digit counts either side of the largest tabled power of ten are exact"""
+
+    limit: int = 10**TABLE_DIGITS
+
+    integer: int
+    for integer in range(limit - 1_000, limit + 1_000):
+        assert int_len(integer) == len(str(integer)), integer
+
+
+def test_int_len_bit_lengths() -> None:
+    """Digit counts either side of every power of two tabled by bit length are exact"""
+
+    bits: int
+    for bits in range(len(DIGITS_BY_BIT_LENGTH) + 2):
+        integer: int
+        for integer in (2**bits - 1, 2**bits, 2**bits + 1):
+            assert int_len(integer) == len(str(integer)), integer
+
+
+def test_digits_round_trip() -> None:
+    """Integers round trip through their digits, which match their `str`"""
+
+    integer: int
+    for integer in INTEGERS:
+        digits: Sequence[int] = to_digits(integer)
+
+        assert digits == tuple(map(int, str(integer))), integer
+        assert from_digits(digits) == integer, integer
+
+
+def test_split_join_round_trip(random: Random) -> None:
+    """Splitting at any width (even beyond the integer's length) round trips"""
+
+    integer: int
+    for integer in INTEGERS:
+        digits: str = str(integer)
+        width: int = random.randint(0, len(digits) + 1)
+
+        high: int
+        low: int
+        high, low = int_split(integer, width)
+
+        assert int_join(high, low, width) == integer, (integer, width)
+        # The trailing digits keep their leading zeros only by way of their width
+        assert low == int(digits[-width:] if width else "0"), (integer, width)
+        assert high == int((digits[:-width] or "0") if width else digits), (
+            integer,
+            width,
+        )
+
+
+def test_split_trailing_zeros() -> None:
+    """Trailing digits which are all zero (e.g. of a power of ten) split off as 0"""
+
+    exponent: int
+    for exponent in range(1, MAX_EXPONENT + 1):
+        assert int_split(10**exponent, exponent) == (1, 0)
+        assert int_split(10**exponent - 1, exponent) == (0, 10**exponent - 1)
+
+
+def test_concat(random: Random) -> None:
+    """Concatenating digits matches concatenating strings, including of zero"""
+
+    integer: int
+    for integer in INTEGERS:
+        other: int = random.choice(INTEGERS)
+
+        assert concat(integer, other) == int(f"{integer}{other}"), (integer, other)
+        assert concat(integer, 0) == integer * 10, integer
+
+
+def test_int_repeat(random: Random) -> None:
+    """Repeated digits (padded to a width) match repeated (zero-padded) strings"""
+
+    integer: int
+    for integer in INTEGERS:
+        digits: str = str(integer)
+
+        if len(digits) > MAX_REPEATED_DIGITS:
+            continue
+
+        times: int = random.randint(1, 5)
+        width: int = len(digits) + random.randint(0, 3)
+
+        assert int_repeat(integer, times) == int(digits * times), integer
+        assert int_repeat(integer, times, width) == int(
+            digits.zfill(width) * times
+        ), (integer, times, width)
@@ -0,0 +1,56 @@
+"""Tests of handing parsed inputs to worker processes through shared memory"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Final
+
+import pytest
+
+# Constants
+ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+
+# Shares a buffer with a pool of worker processes (which each attach to it), and
+# sums it in each of them
+SCRIPT: Final[str] = """
+import multiprocessing
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc.shared import attach, share
+
+
+def total(handle):
+    with attach(handle) as views:
+        return sum(views["values"])
+
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context(sys.argv[1])
+
+    with ProcessPoolExecutor(3, mp_context=context) as executor:
+        with share({"values": array("q", range(100))}) as handle:
+            assert list(executor.map(total, [handle] * 6)) == [4950] * 6
+"""
+
+
+@pytest.mark.parametrize("start_method", ("fork", "spawn"))
+def test_share_with_workers(tmp_path: Path, start_method: str) -> None:
+    """Workers attaching to a block leave nothing for the resource tracker to report"""
+
+    script: Path = tmp_path / "share.py"
+    script.write_text(SCRIPT, encoding="utf-8")
+
+    result: subprocess.CompletedProcess[str] = subprocess.run(
+        (sys.executable, str(script), start_method),
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": str(ROOT)},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stderr == ""